@@ -0,0 +1,49 @@
+"""Measures the memory footprint per node of tree.treeNode and graph.graphNode.
+
+Usage:
+    python benchmarks/bench_memory.py [number of nodes]
+"""
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'treeOps'))
+
+import tree
+import graph
+
+def bytes_per_node(factory, n):
+    """Returns the average number of bytes allocated per node when creating n nodes.
+
+    Args:
+        factory (callable): called with an int, returns a new node.
+        n (int): the number of nodes to create.
+    Returns:
+        (float) the average memory (in bytes) allocated per node.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    nodes = [factory(i) for i in range(n)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # exclude the list holding the nodes
+    return (after - before - sys.getsizeof(nodes)) / len(nodes)
+
+def bytes_per_tree_node(n, engine='object'):
+    """Returns the average memory per node of a tree built with add_node (balanced)."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    t = tree.tree(engine=engine)
+    for i in range(n):
+        t.add_node(i, balanced=True)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / n
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    print('treeNode:              {:8.1f} bytes/node'.format(bytes_per_node(tree.tree.treeNode, n)))
+    print('graphNode:             {:8.1f} bytes/node'.format(bytes_per_node(graph.graph.graphNode, n)))
+    print('tree (add_node, AVL):  {:8.1f} bytes/node'.format(bytes_per_tree_node(n)))
+    print('arrayTree (add_node):  {:8.1f} bytes/node'.format(bytes_per_tree_node(n, 'array')))
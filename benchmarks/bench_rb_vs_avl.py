@@ -0,0 +1,68 @@
+"""Compares the AVL balancing of tree.tree (add_node(balanced=True)) with the red-black tree on an
+insert-heavy and a lookup-heavy workload.
+
+Usage:
+    python benchmarks/bench_rb_vs_avl.py [number of keys]
+"""
+import os
+import sys
+import random
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'treeOps'))
+
+import tree
+import rbTree
+
+def counting(cls):
+    """Returns a subclass of the given tree class that counts the rotations."""
+    class countingTree(cls):
+        rotations = 0
+
+        def _rotateLeft(self, node):
+            countingTree.rotations += 1
+            return super()._rotateLeft(node)
+
+        def _rotateRight(self, node):
+            countingTree.rotations += 1
+            return super()._rotateRight(node)
+
+    return countingTree
+
+def run(cls, keys, lookups):
+    """Builds a tree of the given class from keys, then looks up the given keys.
+
+    Returns:
+        (tuple) insertion time, lookup time, number of rotations and height of the tree.
+    """
+    cls = counting(cls)
+    t = cls()
+
+    start = time.perf_counter()
+    for k in keys:
+        t.add_node(k, True)
+    insert_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for k in lookups:
+        k in t
+    lookup_time = time.perf_counter() - start
+
+    return insert_time, lookup_time, cls.rotations, t._calcHeight(t.root)
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    random.seed(0)
+
+    workloads = {
+        'insert-heavy (n inserts, n/10 lookups)': (random.sample(range(10 * n), n), n // 10),
+        'lookup-heavy (n/10 inserts, n lookups)': (random.sample(range(10 * n), n // 10), n),
+    }
+
+    for name, (keys, nlookups) in workloads.items():
+        lookups = [random.choice(keys) for _ in range(nlookups)]
+        print(name)
+        for label, cls in (('AVL', tree.tree), ('red-black', rbTree.rbTree)):
+            ins, look, rot, height = run(cls, keys, lookups)
+            print('  {:10s} insert {:7.3f}s  lookup {:7.3f}s  rotations {:8d}  height {:3d}'.format(
+                  label, ins, look, rot, height))
@@ -0,0 +1,65 @@
+"""Compares the splay tree with the AVL tree (tree.tree) on lookups following a Zipf distribution,
+where a few hot keys dominate the workload.
+
+Usage:
+    python benchmarks/bench_splay_zipf.py [number of keys] [number of lookups] [Zipf exponent]
+"""
+import os
+import sys
+import random
+import time
+from itertools import accumulate
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'treeOps'))
+
+import tree
+import splayTree
+
+def zipf_lookups(keys, nlookups, s):
+    """Draws lookups from keys where the key of rank r has a probability proportional to 1/r**s
+    (the ranks are assigned to the keys at random)."""
+    hot = random.sample(keys, len(keys))
+    weights = list(accumulate(1 / r**s for r in range(1, len(keys) + 1)))
+    return random.choices(hot, cum_weights=weights, k=nlookups)
+
+def depth(t, data):
+    """Returns the number of comparisons needed to find data from the root (without splaying)."""
+    res = 1
+    node = t.root
+    while node.data != data:
+        node = node.left if data < node.data else node.right
+        res += 1
+    return res
+
+def run(cls, keys, lookups):
+    """Builds a balanced tree of the given class from keys, then looks up the given keys.
+
+    Returns:
+        (tuple) lookup time and average number of comparisons per lookup.
+    """
+    t = cls.from_sorted(keys)
+
+    comparisons = 0
+    for k in lookups[:10000]:
+        comparisons += depth(t, k)
+        k in t
+
+    start = time.perf_counter()
+    for k in lookups:
+        k in t
+    lookup_time = time.perf_counter() - start
+
+    return lookup_time, comparisons / min(len(lookups), 10000)
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    nlookups = int(sys.argv[2]) if len(sys.argv) > 2 else 500000
+    s = float(sys.argv[3]) if len(sys.argv) > 3 else 1.2
+    random.seed(0)
+
+    keys = random.sample(range(10 * n), n)
+    lookups = zipf_lookups(keys, nlookups, s)
+    print('{} keys, {} Zipf(s={}) lookups'.format(n, nlookups, s))
+    for label, cls in (('AVL', tree.tree), ('splay', splayTree.splayTree)):
+        look, comp = run(cls, keys, lookups)
+        print('  {:6s} lookup {:7.3f}s  comparisons/lookup {:6.2f}'.format(label, look, comp))
@@ -0,0 +1,453 @@
+from array import array
+from collections import deque
+
+# the id used for missing links (the counterpart of None in tree.treeNode)
+NIL = -1
+
+class arrayTree(object):
+    """A (binary search) tree stored as parallel columns (struct-of-arrays) indexed by integer node ids.
+    It exposes the same public interface as tree.tree, the nodes are however represented by their ids
+    (int) instead of treeNode objects, e.g. find_node returns a node id and the traversals return lists
+    of node ids. The data of a node n is self.data[n].
+    """
+    def __init__(self):
+        """Initializes an empty array-backed tree.
+        Attributes:
+            root (int): the id of the root node, None if the tree is empty.
+            data (list): the node values.
+            left (array of int): the ids of the left children (NIL if missing).
+            right (array of int): the ids of the right children (NIL if missing).
+            parent (array of int): the ids of the parent nodes (NIL if missing).
+            height (array of int): the height of the tree rooted at each node.
+            balance_factor (array of int): difference between the height of the left and the right subtrees.
+        """
+        self.root = None
+        self.data = []
+        self.left = array('i')
+        self.right = array('i')
+        self.parent = array('i')
+        self.height = array('i')
+        self.balance_factor = array('i')
+
+    @classmethod
+    def from_sorted(cls, iterable):
+        """Constructs a perfectly balanced BST from the given data in O(n) (plus one sort of the data).
+        The ids of the nodes are their positions in the sorted data.
+
+        Args:
+            iterable (iterable): the node data (need not be sorted, the input is not modified).
+        Returns:
+            (arrayTree) a balanced BST with up-to-date heights and balance factors.
+        """
+        t = cls()
+        t.data = sorted(iterable)
+        n = len(t.data)
+        if n == 0:
+            return t
+
+        t.left = array('i', [NIL]) * n
+        t.right = array('i', [NIL]) * n
+        t.parent = array('i', [NIL]) * n
+        t.height = array('i', [0]) * n
+        t.balance_factor = array('i', [0]) * n
+        t.root = t._buildBalanced(0, n - 1, NIL)
+
+        return t
+
+    def _buildBalanced(self, start, end, parent):
+        """(helper function) Links the (sorted) nodes start..end into a balanced subtree.
+
+        Args:
+            start (int): the id of the left-most node of the subtree.
+            end (int): the id of the right-most node of the subtree.
+            parent (int): the id of the parent of the subtree root.
+        Returns:
+            (int) the id of the root of the subtree, NIL if start > end.
+        """
+        if start > end:
+            return NIL
+
+        mid = start + (end - start)//2
+        self.parent[mid] = parent
+        self.left[mid] = self._buildBalanced(start, mid - 1, mid)
+        self.right[mid] = self._buildBalanced(mid + 1, end, mid)
+        self._updateNodeMetadata(mid)
+
+        return mid
+
+    def __len__(self):
+        """Returns the number of nodes in the tree."""
+        return len(self.data)
+
+    def _newNode(self, data, parent=NIL):
+        """(helper function) Appends a new (leaf) node to the columns.
+
+        Args:
+            data (node val data type): the value to be assigned to the new node.
+            parent (int): the id of the parent node.
+        Returns:
+            (int) the id of the new node.
+        """
+        self.data.append(data)
+        self.left.append(NIL)
+        self.right.append(NIL)
+        self.parent.append(parent)
+        self.height.append(0)
+        self.balance_factor.append(0)
+        return len(self.data) - 1
+
+    def __contains__(self, data):
+        """Checks if a tree contains a given data.
+
+        Args:
+            data (node val data type): the data to be found in the tree.
+        Returns:
+            (boolean) True if the tree contains the data, False otherwise.
+        """
+        return self.find_node(data) is not None
+
+    def __str__(self):
+        """Represents a tree with a string starting from its root."""
+        return ''.join('{} '.format(self.data[n]) for n in self.iter_inorder(self.root)) + '\n'
+
+    def verbose_rep(self, verb_level=0):
+        """Returns a verbose representation of the tree as a list of dictionaries (see tree.verbose_rep).
+
+        Args:
+            verb_level (0 or 1): the verbosity level.
+        Returns:
+            (list of dict) a list of dictionaries representing the tree.
+        """
+        assert(verb_level in {0, 1}), 'Invalid verbosity level!'
+
+        data, left, right, parent = self.data, self.left, self.right, self.parent
+
+        representation = []
+        for n in self.iter_inorder(self.root):
+            attrs = {}
+            attrs['data'] = data[n]
+            attrs['left'] = 'None' if left[n] == NIL else data[left[n]]
+            attrs['right'] = 'None' if right[n] == NIL else data[right[n]]
+            if verb_level == 1:
+                attrs['parent'] = 'None' if parent[n] == NIL else data[parent[n]]
+                attrs['height'] = self.height[n]
+                attrs['balance_factor'] = self.balance_factor[n]
+            representation.append(attrs)
+
+        return representation
+
+    def add_node(self, data, balanced=False):
+        """Adds a node to a tree.
+
+        Args:
+            data (node val data type): the value to be assigned to the new tree node.
+            balanced (boolean): if True rebalance the tree along the insertion path.
+        Returns:
+            (arrayTree) tree updated with the new node inserted at one of its leaves.
+        """
+        if self.root is None:
+            self.root = self._newNode(data)
+            return
+
+        keys, left, right = self.data, self.left, self.right
+        node = self.root
+        while True:
+            if data < keys[node]:
+                if left[node] == NIL:
+                    left[node] = self._newNode(data, node)
+                    break
+                node = left[node]
+            else:
+                if right[node] == NIL:
+                    right[node] = self._newNode(data, node)
+                    break
+                node = right[node]
+
+        # the tree is only modified through add_node, so its metadata is always consistent and the
+        # update can stop as soon as the height of a (rebalanced) subtree on the path is unchanged
+        height, bf, parent = self.height, self.balance_factor, self.parent
+        while node != NIL:
+            old_height = height[node]
+            l, r = left[node], right[node]
+            lheight = -1 if l == NIL else height[l]
+            rheight = -1 if r == NIL else height[r]
+            height[node] = (lheight if lheight > rheight else rheight) + 1
+            bf[node] = lheight - rheight
+            if balanced and not -1 <= lheight - rheight <= 1:
+                node = self._rebalanceSubtree(node)
+            if height[node] == old_height:
+                break
+            node = parent[node]
+
+    def _updateNodeMetadata(self, node):
+        """(helper function) Updates the height and the balance factor of a given node from the stored
+        heights of its children.
+
+        Args:
+            node (int): the id of the node to be updated.
+        """
+        l = self.left[node]
+        r = self.right[node]
+        lheight = -1 if l == NIL else self.height[l]
+        rheight = -1 if r == NIL else self.height[r]
+        self.height[node] = max(lheight, rheight) + 1
+        self.balance_factor[node] = lheight - rheight
+
+    def _rebalanceSubtree(self, node):
+        """(helper function) Rebalances a subtree rooted at a given node using rotation operations.
+
+        Args:
+            node (int): the id of the root of the subtree to be rebalanced.
+        Returns:
+            (int) the id of the root of the rebalanced subtree.
+        """
+        bf = self.balance_factor
+        if bf[node] > 1:
+            if bf[self.left[node]] < 0:
+                self._rotateLeft(self.left[node])
+            return self._rotateRight(node)
+        elif bf[node] < -1:
+            if bf[self.right[node]] > 0:
+                self._rotateRight(self.right[node])
+            return self._rotateLeft(node)
+        else:
+            return node
+
+    def _replaceChild(self, parent, old, new):
+        """(helper function) Replaces the child old of parent by new (or the root if parent is NIL)."""
+        if parent == NIL:
+            self.root = new
+        elif self.left[parent] == old:
+            self.left[parent] = new
+        else:
+            self.right[parent] = new
+
+    def _rotateRight(self, node):
+        """(helper function) Performs right rotation of subtree rooted at node.
+
+        Args:
+            node (int): the id of the parent node of the subtree to rotate.
+        Returns:
+            (int) the id of the root of the new subtree.
+        """
+        left, right, parent = self.left, self.right, self.parent
+        assert(left[node] != NIL)
+
+        pivot = left[node]
+        left[node] = right[pivot]
+        if right[pivot] != NIL:
+            parent[right[pivot]] = node
+        right[pivot] = node
+
+        parent[pivot] = parent[node]
+        parent[node] = pivot
+        self._replaceChild(parent[pivot], node, pivot)
+
+        self._updateNodeMetadata(node)
+        self._updateNodeMetadata(pivot)
+
+        return pivot
+
+    def _rotateLeft(self, node):
+        """(helper function) Performs left rotation of subtree rooted at node.
+
+        Args:
+            node (int): the id of the parent node of the subtree to rotate.
+        Returns:
+            (int) the id of the root of the new subtree.
+        """
+        left, right, parent = self.left, self.right, self.parent
+        assert(right[node] != NIL)
+
+        pivot = right[node]
+        right[node] = left[pivot]
+        if left[pivot] != NIL:
+            parent[left[pivot]] = node
+        left[pivot] = node
+
+        parent[pivot] = parent[node]
+        parent[node] = pivot
+        self._replaceChild(parent[pivot], node, pivot)
+
+        self._updateNodeMetadata(node)
+        self._updateNodeMetadata(pivot)
+
+        return pivot
+
+    def find_node(self, data):
+        """Finds a node in a tree.
+
+        Args:
+            data (node val data type): the data to be found in the tree.
+        Returns:
+            (int) the id of the node that contains the given data, None if not found.
+        """
+        if self.root is None:
+            return None
+
+        keys, left, right = self.data, self.left, self.right
+        node = self.root
+        while node != NIL:
+            key = keys[node]
+            if key == data:
+                return node
+            node = left[node] if data < key else right[node]
+
+        return None
+
+    def iter_inorder(self, node):
+        """Iterates over a (sub)tree in order.
+
+        Args:
+            node (int): the id of the node at which the inorder traversal starts.
+        Yields:
+            (int) the id of the next node of the inorder traversal path.
+        """
+        left, right = self.left, self.right
+        if node is None: node = NIL
+        stack = []
+        while stack or node != NIL:
+            while node != NIL:
+                stack.append(node)
+                node = left[node]
+            node = stack.pop()
+            yield node
+            node = right[node]
+
+    def iter_preorder(self, node):
+        """Iterates over a (sub)tree in preorder.
+
+        Args:
+            node (int): the id of the node at which the preorder traversal starts.
+        Yields:
+            (int) the id of the next node of the preorder traversal path.
+        """
+        left, right = self.left, self.right
+        stack = [] if node is None or node == NIL else [node]
+        while stack:
+            node = stack.pop()
+            yield node
+            if right[node] != NIL: stack.append(right[node])
+            if left[node] != NIL: stack.append(left[node])
+
+    def iter_postorder(self, node):
+        """Iterates over a (sub)tree in postorder.
+
+        Args:
+            node (int): the id of the node at which the postorder traversal starts.
+        Yields:
+            (int) the id of the next node of the postorder traversal path.
+        """
+        left, right = self.left, self.right
+        if node is None: node = NIL
+        stack = []
+        last = NIL
+        while stack or node != NIL:
+            if node != NIL:
+                stack.append(node)
+                node = left[node]
+            else:
+                top = stack[-1]
+                if right[top] != NIL and right[top] != last:
+                    node = right[top]
+                else:
+                    last = stack.pop()
+                    yield last
+
+    def iter_levelorder(self, node):
+        """Iterates over a (sub)tree in level order (breadth-first).
+
+        Args:
+            node (int): the id of the node at which the level order traversal starts.
+        Yields:
+            (int) the id of the next node of the level order traversal path.
+        """
+        if node is None or node == NIL:
+            return
+
+        left, right = self.left, self.right
+        Q = deque()
+        Q.append(node)
+        while Q:
+            node = Q.popleft()
+            if left[node] != NIL: Q.append(left[node])
+            if right[node] != NIL: Q.append(right[node])
+            yield node
+
+    def inorder_traversal(self, node, path=None):
+        """Inorder Traversal.
+
+        Args:
+            node (int): the id of the node at which the inorder traversal starts.
+            path (list of int): the traversal path.
+        Returns:
+            (list of int) the full traversal path (node ids).
+        """
+        if path is None:
+            path = []
+
+        path.extend(self.iter_inorder(node))
+
+        return path
+
+    def preorder_traversal(self, node, path=None):
+        """Preorder Traversal.
+
+        Args:
+            node (int): the id of the node at which the preorder traversal starts.
+            path (list of int): the traversal path.
+        Returns:
+            (list of int) the full traversal path (node ids).
+        """
+        if path is None:
+            path = []
+
+        path.extend(self.iter_preorder(node))
+
+        return path
+
+    def postorder_traversal(self, node, path=None):
+        """Postorder Traversal.
+
+        Args:
+            node (int): the id of the node at which the postorder traversal starts.
+            path (list of int): the traversal path.
+        Returns:
+            (list of int) the full traversal path (node ids).
+        """
+        if path is None:
+            path = []
+
+        path.extend(self.iter_postorder(node))
+
+        return path
+
+    def BFS(self, start):
+        """Breadth-First Search (BFS).
+
+        Args:
+            start (int): the id of the node where the traversal starts.
+        Returns:
+            (list of int) the full BFS path (node ids).
+        """
+        if start is None:
+            return
+
+        return list(self.iter_levelorder(start))
+
+    def is_balanced(self):
+        """Checks whether or not a tree (BST or not) is balanced (recomputes the heights bottom-up).
+
+        Returns:
+            (bool) True when the tree is balanced, False otherwise.
+        """
+        left, right = self.left, self.right
+        heights = {}
+        for n in self.iter_postorder(self.root):
+            lheight = -1 if left[n] == NIL else heights.pop(left[n])
+            rheight = -1 if right[n] == NIL else heights.pop(right[n])
+            if abs(lheight - rheight) > 1:
+                return False
+            heights[n] = max(lheight, rheight) + 1
+
+        return True
@@ -0,0 +1,419 @@
+import os
+import struct
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+
+# file header: magic, page size, key format, root page id, number of pages, number of keys
+FILE_HEADER = struct.Struct('<8sI16sqqq')
+MAGIC = b'TREEOPSB'
+# page header: is leaf, number of keys, next leaf page id (leaf pages only)
+PAGE_HEADER = struct.Struct('<BIq')
+# page ids are stored as 64-bit integers
+PAGE_ID = struct.Struct('<q')
+# the id used for missing links
+NIL = -1
+
+class bTree(object):
+    """A disk-resident B+-tree. The keys are stored in fixed-size pages of a file on local disk and only a
+    bounded number of pages (the page cache) is held in memory, so that the number of keys is not limited
+    by the RAM. A lookup reads one page per level of the tree (a handful of pages).
+    It exposes the same interface as tree.tree for insertion, lookup and ordered iteration, except that
+    the keys themselves take the place of the tree nodes (e.g. find_node returns the key).
+    NOTE:
+        - the keys must be packable with the fixed-width struct format key_format, e.g. 'q' (64-bit
+        integers, default), 'd' (floats) or '<N>s' (str of at most N bytes once UTF-8 encoded);
+        - the modified pages are written back on eviction from the cache, on flush and on close;
+        - the pages on the path of an insertion are pinned in the cache until the insertion is done, so
+        the cache must hold at least the depth of the tree + 2 pages.
+    """
+    def __init__(self, path, page_size=4096, key_format='q', cache_pages=256):
+        """Opens (or creates) a B+-tree stored in the given file.
+
+        Args:
+            path (str): path to the file storing the tree.
+            page_size (int): the size of a page in bytes (ignored if the file already exists).
+            key_format (str): struct format of a key (ignored if the file already exists).
+            cache_pages (int): the maximum number of pages held in memory (at least the depth of the
+            tree + 2).
+        Attributes:
+            root (int): the id of the root page.
+        """
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        self._file = open(path, 'r+b' if exists else 'w+b')
+        self._cache = OrderedDict()
+        self._dirty = set()
+        # the pages on the path of the current insertion (never evicted)
+        self._pinned = set()
+        self.cache_pages = cache_pages
+
+        if exists:
+            magic, page_size, key_format, self.root, self._npages, self._size = \
+                FILE_HEADER.unpack(self._file.read(FILE_HEADER.size))
+            assert(magic == MAGIC), 'Invalid B-tree file!'
+            key_format = key_format.rstrip(b'\0').decode()
+            self._setFormat(page_size, key_format)
+            # the depth of the tree (number of levels below the root page)
+            self._depth = 0
+            node = self._readPage(self.root)
+            while not node.leaf:
+                self._depth += 1
+                node = self._readPage(node.children[0])
+        else:
+            self._setFormat(page_size, key_format)
+            # page 0 holds the file header, page 1 is the (empty) root leaf
+            self._npages = 1
+            self._size = 0
+            self._depth = 0
+            self.root = self._newPage(leaf=True)
+            self._writeHeader()
+
+        assert(cache_pages >= self._depth + 2), 'The page cache must hold at least the depth of the tree + 2 pages.'
+
+    class page(object):
+        """A B+-tree page (defined as an inner class of the bTree class)."""
+        __slots__ = ('leaf', 'keys', 'children', 'next')
+
+        def __init__(self, leaf, keys=None, children=None, next=NIL):
+            """Initializes a page.
+            Attributes:
+                leaf (boolean): True for a leaf page.
+                keys (list): the sorted keys of the page.
+                children (list of int): the ids of the child pages (internal pages only).
+                next (int): the id of the next leaf page (leaf pages only).
+            """
+            self.leaf = leaf
+            self.keys = [] if keys is None else keys
+            self.children = [] if children is None else children
+            self.next = next
+
+    def _setFormat(self, page_size, key_format):
+        """(helper function) Sets the page size and the key format and derives the page capacities."""
+        self.page_size = page_size
+        self.key_format = key_format
+        self._key = struct.Struct('<' + key_format)
+        self._isStr = key_format.endswith('s')
+        self._structs = {}
+
+        free = page_size - PAGE_HEADER.size
+        self.max_leaf_keys = free // self._key.size
+        self.max_internal_keys = (free - PAGE_ID.size) // (self._key.size + PAGE_ID.size)
+        assert(self.max_internal_keys >= 3), 'The page size is too small for the key format.'
+
+    def _keysStruct(self, n, fmt):
+        """(helper function) Returns (and caches) the struct packing n items of the given format."""
+        s = self._structs.get((n, fmt))
+        if s is None:
+            s = self._structs[(n, fmt)] = struct.Struct('<' + fmt * n)
+        return s
+
+    def _encode(self, key):
+        """(helper function) Converts a key to its stored representation."""
+        if self._isStr and isinstance(key, str):
+            key = key.encode()
+            assert(len(key) <= self._key.size), 'The key {} is too long for the key format.'.format(key)
+        return key
+
+    def _decode(self, key):
+        """(helper function) Converts a stored key back to its original representation."""
+        if self._isStr:
+            return key.rstrip(b'\0').decode()
+        return key
+
+    def _writeHeader(self):
+        """(helper function) Writes the file header (page 0)."""
+        self._file.seek(0)
+        self._file.write(FILE_HEADER.pack(MAGIC, self.page_size, self.key_format.encode(),
+                                          self.root, self._npages, self._size))
+
+    def _readPage(self, pid):
+        """(helper function) Returns a page from the cache, reading it from disk on a cache miss.
+
+        Args:
+            pid (int): the page id.
+        Returns:
+            (page) the page.
+        """
+        node = self._cache.get(pid)
+        if node is not None:
+            self._cache.move_to_end(pid)
+            return node
+
+        self._file.seek(pid * self.page_size)
+        buf = self._file.read(self.page_size)
+        leaf, n, nxt = PAGE_HEADER.unpack_from(buf, 0)
+        keys = list(self._keysStruct(n, self.key_format).unpack_from(buf, PAGE_HEADER.size))
+        if self._isStr:
+            keys = [self._decode(k) for k in keys]
+        if leaf:
+            node = self.page(True, keys, next=nxt)
+        else:
+            offset = PAGE_HEADER.size + n * self._key.size
+            node = self.page(False, keys, list(self._keysStruct(n + 1, 'q').unpack_from(buf, offset)))
+
+        self._cache[pid] = node
+        self._evict()
+        return node
+
+    def _putPage(self, pid, node):
+        """(helper function) Stores a modified page in the cache (it is written on eviction or flush).
+
+        Args:
+            pid (int): the page id.
+            node (page): the modified page.
+        """
+        self._cache[pid] = node
+        self._cache.move_to_end(pid)
+        self._dirty.add(pid)
+        self._evict()
+
+    def _evict(self):
+        """(helper function) Evicts the least recently used pages until the cache fits its capacity. The
+        pinned pages (see _addNode) are moved to the most recently used end instead."""
+        for _ in range(len(self._cache)):
+            if len(self._cache) <= self.cache_pages:
+                break
+            pid, node = self._cache.popitem(last=False)
+            if pid in self._pinned:
+                self._cache[pid] = node
+                continue
+            if pid in self._dirty:
+                self._writePage(pid, node)
+                self._dirty.discard(pid)
+
+    def _writePage(self, pid, node):
+        """(helper function) Writes a page to disk.
+
+        Args:
+            pid (int): the page id.
+            node (page): the page to be written.
+        """
+        n = len(node.keys)
+        buf = bytearray(self.page_size)
+        PAGE_HEADER.pack_into(buf, 0, node.leaf, n, node.next)
+        keys = [self._encode(k) for k in node.keys] if self._isStr else node.keys
+        self._keysStruct(n, self.key_format).pack_into(buf, PAGE_HEADER.size, *keys)
+        if not node.leaf:
+            self._keysStruct(n + 1, 'q').pack_into(buf, PAGE_HEADER.size + n * self._key.size, *node.children)
+
+        self._file.seek(pid * self.page_size)
+        self._file.write(buf)
+
+    def _newPage(self, leaf, keys=None, children=None, next=NIL):
+        """(helper function) Allocates a new page at the end of the file.
+
+        Returns:
+            (int) the id of the new page.
+        """
+        pid = self._npages
+        self._npages += 1
+        self._putPage(pid, self.page(leaf, keys, children, next))
+        return pid
+
+    def flush(self):
+        """Writes all the modified pages and the file header to disk."""
+        for pid in sorted(self._dirty):
+            self._writePage(pid, self._cache[pid])
+        self._dirty.clear()
+        self._writeHeader()
+        self._file.flush()
+
+    def close(self):
+        """Flushes the tree and closes the file."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        """Returns the number of keys in the tree."""
+        return self._size
+
+    def __contains__(self, data):
+        """Checks if a tree contains a given data.
+
+        Args:
+            data (key type): the data to be found in the tree.
+        Returns:
+            (boolean) True if the tree contains the data, False otherwise.
+        """
+        return self.find_node(data) is not None
+
+    def __str__(self):
+        """Represents a tree with a string of its keys in ascending order."""
+        return ''.join('{} '.format(k) for k in self.iter_inorder()) + '\n'
+
+    def __iter__(self):
+        """Iterates over the keys in ascending order."""
+        return self.iter_inorder()
+
+    def add_node(self, data, balanced=True):
+        """Adds a key to the tree (duplicate keys are kept).
+
+        Args:
+            data (key type): the key to be added.
+            balanced (boolean): ignored, a B-tree is always balanced (kept for compatibility).
+        Returns:
+            (bTree) tree updated with the new key.
+        """
+        self._encode(data)
+        assert(self.cache_pages >= self._depth + 2), 'The page cache must hold at least the depth of the tree + 2 pages.'
+        try:
+            split = self._addNode(self.root, data)
+        finally:
+            self._pinned.clear()
+
+        if split is not None:
+            sep, right = split
+            self.root = self._newPage(False, [sep], [self.root, right])
+            self._depth += 1
+        self._size += 1
+
+    def _addNode(self, pid, data):
+        """(helper function) Inserts a key in the subtree rooted at a given page, splitting the full pages
+        on the way back up. The pages of the path are pinned in the cache: a page is modified in place
+        before it is split, so it must not be written to disk by the eviction of a new page.
+
+        Args:
+            pid (int): the id of the root page of the subtree.
+            data (key type): the key to be inserted.
+        Returns:
+            (tuple or None) (separator key, id of the new right page) if the page has been split.
+        """
+        node = self._readPage(pid)
+        self._pinned.add(pid)
+        if node.leaf:
+            node.keys.insert(bisect_right(node.keys, data), data)
+            if len(node.keys) <= self.max_leaf_keys:
+                self._putPage(pid, node)
+                return None
+
+            mid = len(node.keys)//2
+            rkeys = node.keys[mid:]
+            right = self._newPage(True, rkeys, next=node.next)
+            node.keys = node.keys[:mid]
+            node.next = right
+            self._putPage(pid, node)
+            return rkeys[0], right
+
+        i = bisect_right(node.keys, data)
+        split = self._addNode(node.children[i], data)
+        if split is None:
+            return None
+
+        sep, child = split
+        node.keys.insert(i, sep)
+        node.children.insert(i + 1, child)
+        if len(node.keys) <= self.max_internal_keys:
+            self._putPage(pid, node)
+            return None
+
+        mid = len(node.keys)//2
+        sep = node.keys[mid]
+        right = self._newPage(False, node.keys[mid + 1:], node.children[mid + 1:])
+        node.keys = node.keys[:mid]
+        node.children = node.children[:mid + 1]
+        self._putPage(pid, node)
+        return sep, right
+
+    def _lowerBound(self, data, strict=False):
+        """(helper function) Finds the position of the first key greater than (strict) or greater than or
+        equal to the given data.
+
+        Returns:
+            (tuple) (leaf page id, index of the key in the leaf), the index may be past the last key of
+            the leaf.
+        """
+        search = bisect_right if strict else bisect_left
+        pid = self.root
+        node = self._readPage(pid)
+        while not node.leaf:
+            pid = node.children[search(node.keys, data)]
+            node = self._readPage(pid)
+
+        return pid, search(node.keys, data)
+
+    def find_node(self, data):
+        """Finds a key in the tree.
+
+        Args:
+            data (key type): the key to be found in the tree.
+        Returns:
+            (key type) the stored key equal to data, None if not found.
+        """
+        for key in self._iterFrom(*self._lowerBound(data)):
+            return key if key == data else None
+
+        return None
+
+    def _iterFrom(self, pid, i):
+        """(helper function) Iterates over the keys in ascending order starting at a given position.
+
+        Args:
+            pid (int): the id of the leaf page.
+            i (int): the index of the first key in the leaf.
+        Yields:
+            (key type) the next key.
+        """
+        while pid != NIL:
+            node = self._readPage(pid)
+            keys = node.keys
+            while i < len(keys):
+                yield keys[i]
+                i += 1
+            pid, i = node.next, 0
+
+    def iter_inorder(self, node=None):
+        """Iterates over the keys in ascending order by following the links between the leaf pages.
+
+        Args:
+            node (int): the id of the page where the iteration starts (the root by default).
+        Yields:
+            (key type) the next key.
+        """
+        pid = self.root if node is None else node
+        page = self._readPage(pid)
+        while not page.leaf:
+            pid = page.children[0]
+            page = self._readPage(pid)
+
+        return self._iterFrom(pid, 0)
+
+    def inorder_traversal(self, node=None, path=None):
+        """Inorder Traversal.
+
+        Args:
+            node (int): the id of the page where the traversal starts (the root by default).
+            path (list): the traversal path.
+        Returns:
+            (list) the keys in ascending order.
+        """
+        if path is None:
+            path = []
+
+        path.extend(self.iter_inorder(node))
+
+        return path
+
+    def iter_range(self, lo, hi, inclusive=True):
+        """Iterates (in ascending order) over the keys between lo and hi (see tree.iter_range).
+
+        Args:
+            lo (key type): the lower bound of the range.
+            hi (key type): the upper bound of the range.
+            inclusive (boolean or pair of boolean): whether the lower and upper bounds are included.
+        Yields:
+            (key type) the next key of the range.
+        """
+        if isinstance(inclusive, bool):
+            inclusive = (inclusive, inclusive)
+        lo_incl, hi_incl = inclusive
+
+        for key in self._iterFrom(*self._lowerBound(lo, strict=not lo_incl)):
+            if hi < key or (not hi_incl and key == hi):
+                return
+            yield key
@@ -0,0 +1,182 @@
+import threading
+from contextlib import contextmanager
+import tree
+
+class rwLock(object):
+    """A readers-writer lock: any number of readers or a single writer hold the lock at a time.
+    Waiting writers take precedence over new readers, so a stream of lookups cannot starve a writer.
+    The lock is reentrant per thread: a thread holding it (for reading or writing) acquires it again
+    for reading without waiting for the queued writers, and a writer acquires it again for writing.
+    A lock held for reading cannot be upgraded to a write lock.
+    """
+    def __init__(self):
+        """Initializes an unlocked readers-writer lock."""
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = None
+        self._waitingWriters = 0
+        # the number of nested acquisitions of the lock by the current thread
+        self._holds = threading.local()
+
+    def acquire_read(self):
+        """Blocks until no writer holds or waits for the lock, then acquires it for reading. Returns
+        at once if the current thread already holds the lock."""
+        with self._cond:
+            holds = getattr(self._holds, 'count', 0)
+            if not holds:
+                while self._writer is not None or self._waitingWriters:
+                    self._cond.wait()
+                self._readers += 1
+            self._holds.count = holds + 1
+
+    def release_read(self):
+        """Releases the lock held for reading."""
+        self._release()
+
+    def acquire_write(self):
+        """Blocks until no reader or writer holds the lock, then acquires it for writing. Returns at
+        once if the current thread already holds the lock for writing."""
+        with self._cond:
+            holds = getattr(self._holds, 'count', 0)
+            if self._writer != threading.get_ident():
+                assert(not holds), 'A read lock cannot be upgraded to a write lock!'
+                self._waitingWriters += 1
+                while self._writer is not None or self._readers:
+                    self._cond.wait()
+                self._waitingWriters -= 1
+                self._writer = threading.get_ident()
+            self._holds.count = holds + 1
+
+    def release_write(self):
+        """Releases the lock held for writing."""
+        self._release()
+
+    def _release(self):
+        """(helper function) Releases the last acquisition of the lock by the current thread, the lock
+        itself is released with the outermost one (in the mode it was acquired in)."""
+        with self._cond:
+            self._holds.count -= 1
+            if self._holds.count:
+                return
+            if self._writer == threading.get_ident():
+                self._writer = None
+                self._cond.notify_all()
+            else:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def read_locked(self):
+        """Context manager holding the lock for reading."""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_locked(self):
+        """Context manager holding the lock for writing."""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+class concurrentTree(object):
+    """A thread-safe wrapper of a (binary search) tree. Lookups and traversals run concurrently under
+    the read side of a readers-writer lock, insertions and deletions (including their rotations and
+    the reassignment of the root) are serialized under its write side.
+    NOTE:
+        - traversals return complete lists built under the lock (no lazy iterators, which would
+        hold the lock while being consumed);
+        - the returned nodes belong to the live tree, their links may change after the call returns,
+        use the data of the nodes or hold the lock (see read_locked) for a consistent view;
+        - the lookups of a tree that restructures itself on access (splayTree) are serialized under
+        the write side of the lock like the writers, and so is read_locked;
+        - the lock is reentrant, the methods of the wrapper can be called inside read_locked, but
+        not its writers (a read lock is not upgraded).
+    """
+    def __init__(self, t=None):
+        """Initializes a thread-safe tree.
+
+        Args:
+            t (tree): the tree to be wrapped (a new empty tree by default). It must not be used
+            directly afterwards.
+        Attributes:
+            tree (tree): the wrapped tree.
+            lock (rwLock): the readers-writer lock guarding the tree.
+        """
+        self.tree = tree.tree() if t is None else t
+        self.lock = rwLock()
+        # the lock of find_node, __contains__ and read_locked, exclusive if the lookups modify the tree
+        mutating = getattr(self.tree, '_mutatingLookups', False)
+        self._lookupLocked = self.lock.write_locked if mutating else self.lock.read_locked
+
+    def read_locked(self):
+        """Context manager holding the read lock (the write lock if the lookups modify the tree), for
+        consistent multi-step reads of self.tree."""
+        return self._lookupLocked()
+
+    # readers
+    def __contains__(self, data):
+        """Checks if the tree contains a given data (see tree.__contains__)."""
+        with self._lookupLocked():
+            return data in self.tree
+
+    def __str__(self):
+        """Represents the tree with a string (see tree.__str__)."""
+        with self.lock.read_locked():
+            return str(self.tree)
+
+    def find_node(self, data):
+        """Finds a node in the tree (see tree.find_node)."""
+        with self._lookupLocked():
+            return self.tree.find_node(data)
+
+    def inorder_traversal(self, node=None):
+        """Returns the inorder traversal path of the (sub)tree rooted at node (the root by default)."""
+        with self.lock.read_locked():
+            return self.tree.inorder_traversal(self.tree.root if node is None else node)
+
+    def preorder_traversal(self, node=None):
+        """Returns the preorder traversal path of the (sub)tree rooted at node (the root by default)."""
+        with self.lock.read_locked():
+            return self.tree.preorder_traversal(self.tree.root if node is None else node)
+
+    def postorder_traversal(self, node=None):
+        """Returns the postorder traversal path of the (sub)tree rooted at node (the root by default)."""
+        with self.lock.read_locked():
+            return self.tree.postorder_traversal(self.tree.root if node is None else node)
+
+    def BFS(self, start=None):
+        """Returns the level order traversal path of the (sub)tree rooted at start (the root by default)."""
+        with self.lock.read_locked():
+            return self.tree.BFS(self.tree.root if start is None else start)
+
+    def is_balanced(self):
+        """Checks if the tree is balanced (see tree.is_balanced)."""
+        with self.lock.read_locked():
+            return self.tree.is_balanced()
+
+    def height(self):
+        """Returns the height of the tree (see tree.height)."""
+        with self.lock.read_locked():
+            return self.tree.height()
+
+    # writers
+    def add_node(self, data, balanced=False):
+        """Adds a node to the tree (see tree.add_node)."""
+        with self.lock.write_locked():
+            self.tree.add_node(data, balanced)
+
+    def insert_node(self, data, balanced=False):
+        """Inserts a node in level order (see tree.insert_node)."""
+        with self.lock.write_locked():
+            self.tree.insert_node(data, balanced)
+
+    def remove_node(self, data, balanced=True):
+        """Removes a node from the tree (see tree.remove_node)."""
+        with self.lock.write_locked():
+            self.tree.remove_node(data, balanced)
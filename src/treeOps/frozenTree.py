@@ -0,0 +1,269 @@
+import numpy as np
+
+# the index used for missing children (van Emde Boas layout)
+NIL = -1
+
+class frozenTree(object):
+    """An immutable search tree over sorted keys, stored contiguously in one of the following layouts:
+        - 'eytzinger': the keys of a complete BST in level order (BFS numbering), the children of the
+        node i (1-based) are the nodes 2i and 2i+1, so no links are stored;
+        - 'veb': the nodes of the same complete BST in van Emde Boas order (the top half of the tree,
+        then each bottom subtree, recursively) with explicit child indices, so that every subtree of
+        a few levels is contiguous whatever the block size.
+    Both layouts keep the nodes read by a search close to each other, and batch lookups of numeric
+    keys (contains_many) run a branchless search over NumPy arrays.
+    """
+    def __init__(self, keys, layout='eytzinger'):
+        """Lays out the given sorted keys.
+
+        Args:
+            keys (list): the keys in ascending order.
+            layout ('eytzinger' or 'veb'): the memory layout.
+        Attributes:
+            layout (str): the memory layout.
+            keys (list): the keys in layout order.
+            left, right (list of int): the child indices of the nodes ('veb' layout only).
+        """
+        assert(layout in {'eytzinger', 'veb'}), 'Invalid layout!'
+        self.layout = layout
+        self._size = len(keys)
+        self._height = self._size.bit_length()
+
+        eytzinger = self._eytzinger(keys)
+        if layout == 'eytzinger':
+            self.keys = eytzinger
+        else:
+            order = []
+            if self._size: self._vebOrder(1, self._height, order)
+            slot = [NIL] * (self._size + 1)
+            for pos, bfs in enumerate(order):
+                slot[bfs] = pos
+            n = self._size
+            self.keys = [eytzinger[bfs - 1] for bfs in order]
+            self.left = [slot[2 * bfs] if 2 * bfs <= n else NIL for bfs in order]
+            self.right = [slot[2 * bfs + 1] if 2 * bfs + 1 <= n else NIL for bfs in order]
+
+        self._arrays = None
+
+    def _eytzinger(self, keys):
+        """(helper function) Returns the sorted keys in Eytzinger (level) order by an inorder walk of
+        the implicit complete tree, without recursion."""
+        n = len(keys)
+        res = [None] * n
+        it = iter(keys)
+        stack = []
+        k = 1
+        while stack or k <= n:
+            while k <= n:
+                stack.append(k)
+                k = 2 * k
+            k = stack.pop()
+            res[k - 1] = next(it)
+            k = 2 * k + 1
+
+        return res
+
+    def _vebOrder(self, root, height, order):
+        """(helper function) Appends the BFS indices of the (complete) subtree of a given height rooted at
+        root to order, in van Emde Boas order."""
+        if root > self._size:
+            return
+        if height == 1:
+            order.append(root)
+            return
+
+        top = height // 2
+        self._vebOrder(root, top, order)
+        first = root << top
+        for child in range(first, first + (1 << top)):
+            self._vebOrder(child, height - top, order)
+
+    def __len__(self):
+        """Returns the number of keys."""
+        return self._size
+
+    def __iter__(self):
+        """Iterates over the keys in ascending order."""
+        if self.layout == 'eytzinger':
+            start = (1 << (self._height - 1)) - 1 if self._size else None
+        else:
+            start = []
+            pos = 0 if self._size else NIL
+            while pos != NIL:
+                start.append(pos)
+                pos = self.left[pos]
+
+        if self._size:
+            for pos in self._iterFrom(start):
+                yield self.keys[pos]
+
+    def __contains__(self, data):
+        """Checks if the frozen tree contains a given key.
+
+        Args:
+            data (node val data type): the key to be found.
+        Returns:
+            (boolean) True if the tree contains the key, False otherwise.
+        """
+        return self.find(data) is not None
+
+    def find(self, data):
+        """Finds a key.
+
+        Args:
+            data (node val data type): the key to be found.
+        Returns:
+            (int) the index of the key in self.keys, None if not found.
+        """
+        pos = self._lowerBound(data)
+        if pos is not None and self.keys[pos] == data:
+            return pos
+        return None
+
+    def _lowerBound(self, data, strict=False):
+        """(helper function) Finds the first key greater than (strict) or greater than or equal to data.
+
+        Returns:
+            (int) the index of the key in self.keys, None if there is none.
+        """
+        if self.layout == 'eytzinger':
+            keys = self.keys
+            n = self._size
+            k = 1
+            if strict:
+                while k <= n:
+                    k = 2 * k + (not data < keys[k - 1])
+            else:
+                while k <= n:
+                    k = 2 * k + (keys[k - 1] < data)
+            # drop the trailing right turns and the last left turn
+            k >>= ((~k) & (k + 1)).bit_length()
+            return k - 1 if k else None
+
+        stack = self._vebPath(data, strict)
+        return stack[-1] if stack else None
+
+    def _vebPath(self, data, strict=False):
+        """(helper function) Walks down the van Emde Boas layout towards data ('veb' layout only).
+
+        Returns:
+            (list of int) the indices of the nodes of the search path where the walk turned left, i.e.
+            the keys following data in descending order (the last one is the lower bound of data).
+        """
+        keys, left, right = self.keys, self.left, self.right
+        stack = []
+        pos = 0 if self._size else NIL
+        while pos != NIL:
+            if data < keys[pos] or (not strict and keys[pos] == data):
+                stack.append(pos)
+                pos = left[pos]
+            else:
+                pos = right[pos]
+
+        return stack
+
+    def _iterFrom(self, start):
+        """(helper function) Iterates over the indices of the keys in ascending order.
+
+        Args:
+            start (int or list of int): the index of the first key ('eytzinger' layout) or the search
+            path of the first key returned by _vebPath ('veb' layout).
+        Yields:
+            (int) the index of the next key in self.keys.
+        """
+        if self.layout == 'eytzinger':
+            n = self._size
+            k = start + 1
+            while k:
+                yield k - 1
+                if 2 * k + 1 <= n:
+                    k = 2 * k + 1
+                    while 2 * k <= n:
+                        k = 2 * k
+                else:
+                    k >>= ((~k) & (k + 1)).bit_length()
+            return
+
+        left, right = self.left, self.right
+        stack = start
+        while stack:
+            pos = stack.pop()
+            yield pos
+            pos = right[pos]
+            while pos != NIL:
+                stack.append(pos)
+                pos = left[pos]
+
+    def iter_range(self, lo, hi, inclusive=True):
+        """Iterates (in ascending order) over the keys between lo and hi.
+
+        Args:
+            lo (node val data type): the lower bound of the range.
+            hi (node val data type): the upper bound of the range.
+            inclusive (boolean or pair of boolean): whether the lower and upper bounds are included,
+            a single boolean applies to both bounds.
+        Yields:
+            (node val data type) the next key of the range.
+        """
+        if isinstance(inclusive, bool):
+            inclusive = (inclusive, inclusive)
+        lo_incl, hi_incl = inclusive
+
+        if self.layout == 'eytzinger':
+            start = self._lowerBound(lo, strict=not lo_incl)
+            if start is None:
+                return
+        else:
+            start = self._vebPath(lo, strict=not lo_incl)
+
+        for pos in self._iterFrom(start):
+            key = self.keys[pos]
+            if hi < key or (not hi_incl and key == hi):
+                return
+            yield key
+
+    def _numpyArrays(self):
+        """(helper function) Returns the layout as NumPy arrays (keys, left, right), built once."""
+        if self._arrays is None:
+            keys = np.array(self.keys)
+            if self.layout == 'eytzinger':
+                self._arrays = (keys, None, None)
+            else:
+                self._arrays = (keys, np.array(self.left, dtype=np.intp), np.array(self.right, dtype=np.intp))
+        return self._arrays
+
+    def contains_many(self, keys):
+        """Checks the membership of a batch of keys at once: all the keys go down the tree together,
+        one level per step, without branches (NumPy arrays).
+
+        Args:
+            keys (array_like): the keys to be found.
+        Returns:
+            (numpy array of bool) True for the keys contained in the tree.
+        """
+        x = np.asarray(keys)
+        if self._size == 0:
+            return np.zeros(x.shape, dtype=bool)
+
+        data, left, right = self._numpyArrays()
+        if self.layout == 'eytzinger':
+            n = self._size
+            k = np.ones(x.shape, dtype=np.intp)
+            for _ in range(self._height):
+                valid = k <= n
+                k = np.where(valid, 2 * k + (data[np.where(valid, k, 1) - 1] < x), k)
+            # drop the trailing right turns and the last left turn
+            k >>= np.log2((~k) & (k + 1)).astype(np.intp) + 1
+            return (k > 0) & (data[np.maximum(k, 1) - 1] == x)
+
+        found = np.zeros(x.shape, dtype=bool)
+        pos = np.zeros(x.shape, dtype=np.intp)
+        for _ in range(self._height):
+            active = pos != NIL
+            p = np.where(active, pos, 0)
+            key = data[p]
+            hit = active & (key == x)
+            found |= hit
+            pos = np.where(active & ~hit, np.where(key < x, right[p], left[p]), NIL)
+
+        return found
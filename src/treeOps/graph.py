@@ -16,22 +16,35 @@ class graph(object):
         self.vertices = defaultdict(partial(defaultdict, list))
 
     class graphNode(object):
+        __slots__ = ('data', '_children', 'status', 'distance', 'previous')
+
         def __init__(self, data=None, status=node_status.UNVISITED):
             """Initializes a graph node.
             Attributes:
                 data (any type): the node value.
-                children (dict): a dictionary of the children (adjacent nodes).
+                children (dict): a dictionary of the children (adjacent nodes), allocated on first access.
                 status (node_status): the visit status of the node (graph traversal).
                 distance (float): the distance from a source node to this node.
                 previous (graphNode): predecessor of this node in an optimal path from 
                 a predefined source in a shortest path algorithm.
             """
             self.data = data
-            self.children = defaultdict(list)
+            self._children = None
             self.status = status
             self.distance = float('inf')
             self.previous = None
 
+        @property
+        def children(self):
+            """Returns the dict of children of this node, allocating it on first access."""
+            if self._children is None:
+                self._children = defaultdict(list)
+            return self._children
+
+        @children.setter
+        def children(self, children):
+            self._children = children
+
         # comparison operators
         def __lt__(self, other):
             return self.data < other.data
@@ -103,7 +116,9 @@ class graph(object):
             Returns:
                 (dict_keys) keys of the dictionary of children of this node.
             """
-            return self.children.keys()
+            if self._children is None:
+                return {}.keys()
+            return self._children.keys()
 
         def _getDistance(self):
             """Returns the value of the distance instance attribute of this node."""
@@ -137,8 +152,8 @@ class graph(object):
             """Returns the weight of the edge between this node and the given node if they are adjacent,
             otherwise returns None.
             """
-            if adjNode in self.children:
-                return self.children[adjNode]
+            if self._children is not None and adjNode in self._children:
+                return self._children[adjNode]
             else:
                 return None
 
@@ -148,7 +163,7 @@ class graph(object):
             Returns:
                 (boolean) whether or not this node and the given node are adjacent.
             """
-            return node in self.children
+            return self._children is not None and node in self._children
 
     def __str__(self):
         """Returns a string representing the vertices and edges of this graph."""
@@ -0,0 +1,130 @@
+import tree
+
+class intervalTree(tree.tree):
+    """An interval tree: a (binary search) tree of closed intervals (lo, hi) ordered by (lo, hi),
+    where each node also stores the maximum end point of its subtree. The augmentation is maintained
+    by _updateNodeMetadata, hence through add_node, remove_node, rotations and from_sorted, and by
+    update_height after the nodes have been linked by hand, and is checked by validate. It lets
+    overlapping skip every subtree that ends before the query.
+    NOTE:
+        - the node data are the (lo, hi) tuples;
+        - insert_node (level order insertion) does not preserve the BST property.
+    """
+    def __init__(self, root=None, engine='object', order_stats=False):
+        """Initializes an interval tree with its root node (see tree.__init__)."""
+        assert(engine == 'object'), 'An interval tree only supports the object engine.'
+        super().__init__(root, engine, order_stats)
+
+    class treeNode(tree.tree.treeNode):
+        """The interval tree node class: a tree.treeNode with the maximum end point of its subtree."""
+        __slots__ = ('max_end',)
+
+        def __init__(self, data=None, balance_factor=0):
+            """Initializes an interval tree node.
+            Attributes:
+                max_end (interval end data type): the maximum end point of the intervals stored in the
+                tree rooted at the node.
+            """
+            super().__init__(data, balance_factor)
+            self.max_end = None if data is None else data[1]
+
+    class sizedTreeNode(treeNode):
+        """The interval tree node class of the trees with order_stats enabled: an interval tree node with
+        the size of its subtree (see tree.sizedTreeNode)."""
+        __slots__ = ('size',)
+
+        def __init__(self, data=None, balance_factor=0):
+            """Initializes an interval tree node.
+            Attributes:
+                size (int): the number of nodes of the tree rooted at the node.
+            """
+            super().__init__(data, balance_factor)
+            self.size = 1
+
+    def _updateNodeMetadata(self, node):
+        """(helper function) Updates the maximum end point of a given node, in addition to the metadata
+        updated by tree._updateNodeMetadata.
+
+        Returns:
+            (boolean) True if the ancestors of the node may have to be updated as well.
+        """
+        changed = super()._updateNodeMetadata(node)
+        return self._updateNodeAugmentation(node) or changed
+
+    def _updateNodeAugmentation(self, node):
+        """(helper function) Updates the maximum end point of a given node from the maximum end points of
+        its children (see tree._updateNodeAugmentation).
+
+        Returns:
+            (boolean) True if the maximum end point of the node has changed.
+        """
+        max_end = self._maxEnd(node)
+        if max_end != node.max_end:
+            node.max_end = max_end
+            return True
+
+        return False
+
+    def _validateNode(self, node):
+        """(helper function) Checks the maximum end point of a given node (see tree._validateNode)."""
+        assert(node.max_end == self._maxEnd(node)), 'Invalid maximum end point of {}!'.format(node.data)
+
+    def _maxEnd(self, node):
+        """(helper function) Returns the maximum end point of the subtree rooted at a given node, computed
+        from its interval and the stored maximum end points of its children."""
+        max_end = node.data[1]
+        if node.left is not None and node.left.max_end > max_end: max_end = node.left.max_end
+        if node.right is not None and node.right.max_end > max_end: max_end = node.right.max_end
+        return max_end
+
+    def add_node(self, interval, balanced=True):
+        """Adds an interval to the tree.
+
+        Args:
+            interval (pair): the (lo, hi) end points of the interval (lo <= hi).
+            balanced (boolean): if True (default) rebalance the tree along the insertion path.
+        Returns:
+            (intervalTree) tree updated with the new interval.
+        """
+        lo, hi = interval
+        assert(not hi < lo), 'Invalid interval!'
+        super().add_node((lo, hi), balanced)
+
+    def remove_node(self, interval, balanced=True):
+        """Removes an interval from the tree. Nothing happens if the interval is not found in the tree.
+
+        Args:
+            interval (pair): the (lo, hi) end points of the interval.
+            balanced (boolean): if True (default) rebalance the tree along the deletion path.
+        Returns:
+            (intervalTree) tree updated with the interval removed.
+        """
+        super().remove_node(tuple(interval), balanced)
+
+    def overlapping(self, a, b):
+        """Iterates over the intervals overlapping [a, b] (end points included) in O(log n + k) for k
+        results in a balanced tree: the subtrees whose maximum end point is lower than a are skipped
+        and the walk stops at the first interval starting after b.
+
+        Args:
+            a (interval end data type): the start of the query interval.
+            b (interval end data type): the end of the query interval.
+        Yields:
+            (treeNode) the next node (in ascending order) whose interval overlaps [a, b].
+        """
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None and not node.max_end < a:
+                stack.append(node)
+                node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+
+            lo, hi = node.data
+            if b < lo:
+                return
+            if not hi < a:
+                yield node
+            node = node.right
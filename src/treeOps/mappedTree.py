@@ -0,0 +1,144 @@
+import mmap
+import struct
+
+# file header: magic, key format, number of nodes
+FILE_HEADER = struct.Struct('<8s16sq')
+MAGIC = b'TREEOPST'
+# the index used for missing links
+NIL = -1
+
+def record_struct(key_format):
+    """Returns the struct of a node record (key, left index, right index, height, balance factor)
+    for a given key format."""
+    return struct.Struct('<' + key_format + 'iiii')
+
+def encode_key(key, key_format):
+    """Converts a key to its stored representation ('<N>s' formats store UTF-8 encoded str)."""
+    if key_format.endswith('s') and isinstance(key, str):
+        width = struct.calcsize(key_format)
+        key = key.encode()
+        assert(len(key) <= width), 'The key {} is too long for the key format.'.format(key)
+        # padded as stored, so that the keys compare like the stored ones
+        key = key.ljust(width, b'\0')
+    return key
+
+def decode_key(key, key_format):
+    """Converts a stored key back to its original representation."""
+    if key_format.endswith('s'):
+        return key.rstrip(b'\0').decode()
+    return key
+
+class mappedTree(object):
+    """A read-only tree answering queries directly from a memory-mapped file written by tree.save,
+    without constructing node objects. The nodes are represented by their (preorder) indices in the
+    file, the root is the node 0.
+    """
+    def __init__(self, path):
+        """Maps a tree file into memory.
+
+        Args:
+            path (str): path to a file written by tree.save.
+        Attributes:
+            root (int): the index of the root node, None if the tree is empty.
+            key_format (str): the struct format of the keys.
+        """
+        self._file = open(path, 'rb')
+        self._buf = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, key_format, self._size = FILE_HEADER.unpack_from(self._buf, 0)
+        assert(magic == MAGIC), 'Invalid tree file!'
+        self.key_format = key_format.rstrip(b'\0').decode()
+        self._record = record_struct(self.key_format)
+        self.root = 0 if self._size > 0 else None
+
+    def close(self):
+        """Unmaps the buffer and closes the file."""
+        if not self._buf.closed:
+            self._buf.close()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        """Returns the number of nodes in the tree."""
+        return self._size
+
+    def _node(self, node):
+        """(helper function) Reads a node record.
+
+        Args:
+            node (int): the node index.
+        Returns:
+            (tuple) key, left index, right index, height and balance factor of the node.
+        """
+        return self._record.unpack_from(self._buf, FILE_HEADER.size + node * self._record.size)
+
+    def key(self, node):
+        """Returns the data stored in a given node.
+
+        Args:
+            node (int): the node index.
+        Returns:
+            (node val data type) the data of the node.
+        """
+        return decode_key(self._node(node)[0], self.key_format)
+
+    def __contains__(self, data):
+        """Checks if a tree contains a given data.
+
+        Args:
+            data (node val data type): the data to be found in the tree.
+        Returns:
+            (boolean) True if the tree contains the data, False otherwise.
+        """
+        return self.find_node(data) is not None
+
+    def find_node(self, data):
+        """Finds a node in a (binary search) tree by walking down the stored links.
+
+        Args:
+            data (node val data type): the data to be found in the tree.
+        Returns:
+            (int) the index of the node that contains the given data, None if not found.
+        """
+        if self.root is None:
+            return None
+
+        target = encode_key(data, self.key_format)
+        node = self.root
+        while node != NIL:
+            key, left, right, _, _ = self._node(node)
+            if key == target:
+                return node
+            elif target < key:
+                node = left
+            else:
+                node = right
+
+        return None
+
+    def iter_inorder(self, node=None):
+        """Iterates over a (sub)tree in order.
+
+        Args:
+            node (int): the index of the node at which the traversal starts (the root by default).
+        Yields:
+            (int) the index of the next node of the inorder traversal path.
+        """
+        if node is None: node = NIL if self.root is None else self.root
+        stack = []
+        while stack or node != NIL:
+            while node != NIL:
+                stack.append(node)
+                node = self._node(node)[1]
+            node = stack.pop()
+            yield node
+            node = self._node(node)[2]
+
+    def __str__(self):
+        """Represents a tree with a string starting from its root."""
+        return ''.join('{} '.format(self.key(n)) for n in self.iter_inorder()) + '\n'
@@ -0,0 +1,121 @@
+import tree
+
+class multisetTree(tree.tree):
+    """A multiset / map (binary search) tree: each node holds a distinct key, the number of times the
+    key has been added and an optional payload. Adding an existing key increments its count instead of
+    adding a node, so the tree grows with the number of distinct keys rather than with the number of
+    insertions.
+    NOTE:
+        - the string representation repeats each key as many times as it occurs, like a tree holding
+        one node per occurrence;
+        - insert_node (level order insertion) does not merge equal keys.
+    """
+    def __init__(self, root=None, engine='object', order_stats=False):
+        """Initializes a multiset tree with its root node (see tree.__init__)."""
+        assert(engine == 'object'), 'A multiset tree only supports the object engine.'
+        assert(not order_stats), 'Order statistics are not supported by multiset trees.'
+        super().__init__(root)
+
+    class treeNode(tree.tree.treeNode):
+        """The multiset tree node class: a tree.treeNode with an occurrence count and a payload."""
+        __slots__ = ('count', 'value')
+
+        def __init__(self, data=None, balance_factor=0):
+            """Initializes a multiset tree node.
+            Attributes:
+                count (int): the number of occurrences of the node data.
+                value (any type): the payload associated with the node data.
+            """
+            super().__init__(data, balance_factor)
+            self.count = 1
+            self.value = None
+
+    def _strTokens(self, node, sep):
+        """(helper function) Iterates over the string representations of the keys of a (sub)tree in
+        order, each key being repeated count times (see tree._strTokens)."""
+        return (('{}'.format(n.data) + sep) * n.count for n in self.iter_inorder(node))
+
+    def __len__(self):
+        """Returns the total number of occurrences of the keys of the tree."""
+        return sum(n.count for n in self.iter_inorder(self.root))
+
+    def _findKey(self, data):
+        """(helper function) Finds the node of a given key without recursion.
+
+        Args:
+            data (node val data type): the key to be found in the tree.
+        Returns:
+            (treeNode) the node holding the key, None if not found.
+        """
+        node = self.root
+        while node is not None:
+            if data == node.data:
+                return node
+            node = node.left if data < node.data else node.right
+
+        return None
+
+    def add_node(self, data, balanced=False, value=None):
+        """Adds an occurrence of a key to the tree: the count of an existing key is incremented,
+        otherwise a new node is added at the end of the same search path (see tree.add_node).
+
+        Args:
+            data (node val data type): the key.
+            balanced (boolean): if True rebalance the tree after adding a new node.
+            value (any type): if not None, the payload to be assigned to the key.
+        Returns:
+            (multisetTree) tree updated with the key.
+        """
+        parent = None
+        node = self.root
+        while node is not None and data != node.data:
+            parent = node
+            left = data < node.data
+            node = node.left if left else node.right
+
+        if node is not None:
+            node.count += 1
+        else:
+            self._levelOrderQueue = None
+            self._sortedKeys = None
+            node = self.treeNode(data)
+            if parent is None:
+                self._root = node
+            else:
+                node.parent = parent
+                if left:
+                    parent.left = node
+                else:
+                    parent.right = node
+                self._root = self._updateInsertionPath(parent, self._root, balanced)
+
+        if value is not None:
+            node.value = value
+
+    def remove_node(self, data, balanced=True):
+        """Removes an occurrence of a key from the tree: the count of the key is decremented and its
+        node is removed when no occurrence is left. Nothing happens if the key is not found.
+
+        Args:
+            data (node val data type): the key.
+            balanced (boolean): if True rebalance the tree along the deletion path.
+        Returns:
+            (multisetTree) tree updated with the key removed.
+        """
+        node = self._findKey(data)
+        if node is None:
+            return
+
+        node.count -= 1
+        if node.count == 0:
+            self._removeNode(node, balanced)
+
+    def count(self, data):
+        """Returns the number of occurrences of a key in the tree (0 if not found)."""
+        node = self._findKey(data)
+        return 0 if node is None else node.count
+
+    def get(self, data, default=None):
+        """Returns the payload of a key, default if the key is not found or has no payload."""
+        node = self._findKey(data)
+        return default if node is None or node.value is None else node.value
@@ -0,0 +1,214 @@
+import tree
+
+class persistentTree(tree.tree):
+    """A persistent (copy-on-write) binary search tree. add_node and remove_node never modify an
+    existing node: the nodes on the search path are copied (path copying) and the new version shares
+    all the other nodes with the previous one. A snapshot is therefore an O(1) reference to the
+    current root, and readers can iterate over it without locks while the tree keeps changing.
+    NOTE:
+        - the parent links are not maintained (a node may belong to several versions), so
+        successor/predecessor are not supported and iter_range walks down from the root;
+        - insert_node (level order insertion) is not supported;
+        - the nodes must not be modified directly.
+    """
+    _parentLinks = False
+
+    def __init__(self, root=None, engine='object', order_stats=False):
+        """Initializes a persistent tree with its root node (see tree.__init__)."""
+        assert(engine == 'object'), 'A persistent tree only supports the object engine.'
+        super().__init__(root, engine, order_stats)
+
+    def snapshot(self):
+        """Returns a frozen view of the current version of the tree in O(1).
+
+        Returns:
+            (persistentTree) a tree sharing all the nodes of the current version, not affected by the
+            following changes of this tree (and vice versa).
+        """
+        t = persistentTree(order_stats=self.order_stats)
+        # the snapshot shares the (trusted) metadata of the current version
+        t._root = self._root
+        t._imbalanced = self._imbalanced
+        return t
+
+    def _copyNode(self, node):
+        """(helper function) Returns an unlinked copy of a given node (children and metadata included)."""
+        copy = self.treeNode(node.data, node.balance_factor)
+        copy.left = node.left
+        copy.right = node.right
+        copy.height = node.height
+        if self.order_stats: copy.size = node.size
+        return copy
+
+    def _copyPath(self, path, sub, balanced):
+        """(helper function) Copies the nodes of a search path bottom-up, linking each copy to the
+        (copied) subtree below it, and updates (and rebalances) the copies.
+
+        Args:
+            path (list of (treeNode, boolean)): the nodes from the top down and, for each node, whether
+            the path continues to its left child.
+            sub (treeNode): the new subtree at the bottom of the path.
+            balanced (boolean): if True rebalance the copies.
+        Returns:
+            (treeNode) the copy of the top node of the path (sub if the path is empty).
+        """
+        for node, left in reversed(path):
+            node = self._copyNode(node)
+            if left:
+                node.left = sub
+            else:
+                node.right = sub
+            self._updateNodeMetadata(node)
+            if balanced:
+                node = self._rebalanceSubtree(node)
+            sub = node
+
+        return sub
+
+    def add_node(self, data, balanced=True):
+        """Adds a node to the tree by copying the O(log n) nodes of its insertion path (equal keys go to
+        the right subtree, see tree.add_node).
+
+        Args:
+            data (node val data type): the value to be assigned to the new tree node.
+            balanced (boolean): if True (default) rebalance the copies (AVL).
+        Returns:
+            (persistentTree) tree updated with the new node.
+        """
+        self._sortedKeys = None
+        path = []
+        node = self.root
+        while node is not None:
+            left = data < node.data
+            path.append((node, left))
+            node = node.left if left else node.right
+
+        self._root = self._copyPath(path, self.treeNode(data), balanced)
+
+    def remove_node(self, data, balanced=True):
+        """Removes a node from the tree by copying the nodes of its search path (and of the path to its
+        inorder successor). Nothing happens if the data is not found in the tree.
+
+        Args:
+            data (node val data type): the value of the node to be removed.
+            balanced (boolean): if True (default) rebalance the copies (AVL).
+        Returns:
+            (persistentTree) tree updated with the node removed.
+        """
+        path = []
+        node = self.root
+        while node is not None and node.data != data:
+            left = data < node.data
+            path.append((node, left))
+            node = node.left if left else node.right
+
+        if node is None:
+            return
+
+        self._sortedKeys = None
+        # the removed node leaves the current version (the copies replace the other nodes)
+        if self._imbalanced is not None and (node.balance_factor > 1 or node.balance_factor < -1):
+            self._imbalanced -= 1
+        if node.left is None or node.right is None:
+            sub = node.left if node.left is not None else node.right
+        else:
+            succ_path = []
+            succ = node.right
+            while succ.left is not None:
+                succ_path.append((succ, True))
+                succ = succ.left
+
+            sub = self._copyNode(succ)
+            sub.left = node.left
+            sub.right = self._copyPath(succ_path, succ.right, balanced)
+            self._updateNodeMetadata(sub)
+            if balanced:
+                sub = self._rebalanceSubtree(sub)
+
+        self._root = self._copyPath(path, sub, balanced)
+
+    def insert_node(self, data, balanced=False):
+        """Level order insertion is not supported by persistent trees."""
+        raise TypeError('insert_node is not supported by persistent trees.')
+
+    def successor(self, node):
+        """The parent links are not maintained by persistent trees (use iter_inorder or iter_range)."""
+        raise TypeError('successor is not supported by persistent trees.')
+
+    def predecessor(self, node):
+        """The parent links are not maintained by persistent trees (use iter_inorder or iter_range)."""
+        raise TypeError('predecessor is not supported by persistent trees.')
+
+    def iter_range(self, lo, hi, inclusive=True):
+        """Iterates (in ascending order) over the nodes whose keys lie between lo and hi, see
+        tree.iter_range. The subtrees out of the range are skipped by an inorder walk from the root.
+
+        Args:
+            lo (node val data type): the lower bound of the range.
+            hi (node val data type): the upper bound of the range.
+            inclusive (boolean or pair of boolean): whether the lower and upper bounds are included.
+        Yields:
+            (treeNode) the next node of the range in inorder sense.
+        """
+        if isinstance(inclusive, bool):
+            inclusive = (inclusive, inclusive)
+        lo_incl, hi_incl = inclusive
+
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                if lo < node.data or (lo_incl and node.data == lo):
+                    stack.append(node)
+                    node = node.left
+                else:
+                    node = node.right
+            if not stack:
+                return
+            node = stack.pop()
+            if hi < node.data or (not hi_incl and node.data == hi):
+                return
+            yield node
+            node = node.right
+
+    def _rotateRight(self, node):
+        """(helper function) Performs a right rotation of the subtree rooted at node on copies of the
+        node and of its left child (the rotated nodes may be shared with other versions).
+
+        Args:
+            node (treeNode): the parent node of the subtree to rotate.
+        Returns:
+            (treeNode) root of the new subtree.
+        """
+        assert(node.left is not None)
+
+        node = self._copyNode(node)
+        pivot = self._copyNode(node.left)
+        node.left = pivot.right
+        pivot.right = node
+
+        self._updateNodeMetadata(node)
+        self._updateNodeMetadata(pivot)
+
+        return pivot
+
+    def _rotateLeft(self, node):
+        """(helper function) Performs a left rotation of the subtree rooted at node on copies of the
+        node and of its right child (the rotated nodes may be shared with other versions).
+
+        Args:
+            node (treeNode): the parent node of the subtree to rotate.
+        Returns:
+            (treeNode) root of the new subtree.
+        """
+        assert(node.right is not None)
+
+        node = self._copyNode(node)
+        pivot = self._copyNode(node.right)
+        node.right = pivot.left
+        pivot.left = node
+
+        self._updateNodeMetadata(node)
+        self._updateNodeMetadata(pivot)
+
+        return pivot
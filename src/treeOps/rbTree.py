@@ -0,0 +1,261 @@
+import tree
+
+class rbTree(tree.tree):
+    """A red-black (binary search) tree. Shares the interface and the node layout of tree.tree, the
+    nodes additionally carry their color. Compared to the AVL balancing of tree.add_node(balanced=True)
+    an insertion performs at most 2 rotations and a deletion at most 3, and the recoloring stops as
+    soon as no red-red conflict is left.
+    NOTE:
+        - the height and balance_factor of the nodes are not maintained (use update_height and
+        update_balance_factor if needed);
+        - insert_node (level order insertion) does not preserve the red-black properties.
+    """
+    _metadataMaintained = False
+
+    def __init__(self, root=None, engine='object', order_stats=False):
+        """Initializes a red-black tree with its root node (colored black)."""
+        assert(engine == 'object'), 'A red-black tree only supports the object engine.'
+        assert(not order_stats), 'Order statistics are not supported by red-black trees.'
+
+        super().__init__(root)
+        if root: self.root.red = False
+
+    class treeNode(tree.tree.treeNode):
+        """The red-black tree node class: a tree.treeNode with a color."""
+        __slots__ = ('red',)
+
+        def __init__(self, data=None, balance_factor=0):
+            """Initializes a (red) tree node.
+            Attributes:
+                red (boolean): True if the node is red, False if it is black.
+            """
+            super().__init__(data, balance_factor)
+            self.red = True
+
+    @classmethod
+    def from_sorted(cls, iterable, engine='object', order_stats=False):
+        """Constructs a red-black tree from the given data in O(n) (plus one sort of the data), see
+        tree.from_sorted. The nodes of the deepest level are colored red and all the others black.
+
+        Args:
+            iterable (iterable): the node data.
+            engine ('object'): the storage engine of the tree.
+            order_stats (boolean): must be False.
+        Returns:
+            (rbTree) a balanced red-black tree.
+        """
+        t = super().from_sorted(iterable, engine, order_stats)
+
+        level = [] if t.root is None else [t.root]
+        while level:
+            children = [c for n in level for c in (n.left, n.right) if c is not None]
+            for n in level:
+                n.red = not children and n is not t.root
+            level = children
+
+        return t
+
+    def _isRed(self, node):
+        """(helper function) Returns True if a given node is red (None leaves are black)."""
+        return node is not None and node.red
+
+    def _updateNodeMetadata(self, node):
+        """(helper function) The height and balance factor are not maintained by red-black trees.
+
+        Returns:
+            (boolean) False, the ancestors of the node never need an update.
+        """
+        return False
+
+    def add_node(self, data, balanced=True):
+        """Adds a node to a red-black tree and restores the red-black properties.
+
+        Args:
+            data (node val data type): the value to be assigned to the new tree node.
+            balanced (boolean): ignored, a red-black tree is always balanced (kept for compatibility).
+        Returns:
+            (rbTree) tree updated with the new node.
+        """
+        self._levelOrderQueue = None
+        self._sortedKeys = None
+
+        parent = None
+        node = self.root
+        while node is not None:
+            parent = node
+            node = node.left if data < node.data else node.right
+
+        node = self.treeNode(data)
+        node.parent = parent
+        if parent is None:
+            self.root = node
+        elif data < parent.data:
+            parent.left = node
+        else:
+            parent.right = node
+
+        self._insertFixup(node)
+
+    def _insertFixup(self, node):
+        """(helper function) Restores the red-black properties after inserting a (red) node by
+        recoloring up the tree and at most two rotations.
+
+        Args:
+            node (treeNode): the inserted node.
+        Returns:
+            (rbTree) the tree satisfying the red-black properties.
+        """
+        while self._isRed(node.parent):
+            parent = node.parent
+            grandparent = parent.parent
+            if parent is grandparent.left:
+                uncle = grandparent.right
+                if self._isRed(uncle):
+                    parent.red = uncle.red = False
+                    grandparent.red = True
+                    node = grandparent
+                else:
+                    if node is parent.right:
+                        node = parent
+                        self._rotateLeft(node)
+                        parent = node.parent
+                    parent.red = False
+                    grandparent.red = True
+                    self._rotateRight(grandparent)
+            else:
+                uncle = grandparent.left
+                if self._isRed(uncle):
+                    parent.red = uncle.red = False
+                    grandparent.red = True
+                    node = grandparent
+                else:
+                    if node is parent.left:
+                        node = parent
+                        self._rotateRight(node)
+                        parent = node.parent
+                    parent.red = False
+                    grandparent.red = True
+                    self._rotateLeft(grandparent)
+
+        self.root.red = False
+
+    def _transplant(self, old, new):
+        """(helper function) Replaces the subtree rooted at old by the subtree rooted at new."""
+        self._replaceChild(old.parent, old, new)
+        if new is not None: new.parent = old.parent
+
+    def remove_node(self, data, balanced=True):
+        """Removes a node from a red-black tree and restores the red-black properties. Nothing happens
+        if the data is not found in the tree.
+
+        Args:
+            data (node val data type): the value of the node to be removed.
+            balanced (boolean): ignored, a red-black tree is always balanced (kept for compatibility).
+        Returns:
+            (rbTree) tree updated with the node removed.
+        """
+        node = self.find_node(data)
+        if node is not None:
+            self._removeNode(node)
+
+    def _removeNode(self, node, balanced=True):
+        """(helper function) Unlinks a given node from the tree (see tree._removeNode) and restores the
+        red-black properties if a black node has been removed from its position.
+
+        Args:
+            node (treeNode): the node to be removed.
+            balanced (boolean): ignored.
+        Returns:
+            (rbTree) tree updated with the node removed.
+        """
+        self._levelOrderQueue = None
+        self._sortedKeys = None
+        self._finger = None
+
+        removed_red = node.red
+        if node.left is None:
+            child, parent = node.right, node.parent
+            self._transplant(node, node.right)
+        elif node.right is None:
+            child, parent = node.left, node.parent
+            self._transplant(node, node.left)
+        else:
+            succ = node.right
+            while succ.left is not None:
+                succ = succ.left
+            removed_red = succ.red
+            child = succ.right
+
+            if succ.parent is node:
+                parent = succ
+            else:
+                parent = succ.parent
+                self._transplant(succ, succ.right)
+                succ.right = node.right
+                succ.right.parent = succ
+
+            self._transplant(node, succ)
+            succ.left = node.left
+            succ.left.parent = succ
+            succ.red = node.red
+
+        node.left = node.right = node.parent = None
+
+        if not removed_red:
+            self._removeFixup(child, parent)
+
+    def _removeFixup(self, node, parent):
+        """(helper function) Restores the red-black properties after removing a black node by
+        recoloring up the tree and at most three rotations.
+
+        Args:
+            node (treeNode): the node that took the place of the removed one (may be None).
+            parent (treeNode): the parent of node (needed when node is None).
+        Returns:
+            (rbTree) the tree satisfying the red-black properties.
+        """
+        while node is not self.root and not self._isRed(node):
+            if node is parent.left:
+                sibling = parent.right
+                if sibling.red:
+                    sibling.red = False
+                    parent.red = True
+                    self._rotateLeft(parent)
+                    sibling = parent.right
+                if not self._isRed(sibling.left) and not self._isRed(sibling.right):
+                    sibling.red = True
+                    node, parent = parent, parent.parent
+                else:
+                    if not self._isRed(sibling.right):
+                        sibling.left.red = False
+                        sibling.red = True
+                        self._rotateRight(sibling)
+                        sibling = parent.right
+                    sibling.red = parent.red
+                    parent.red = False
+                    sibling.right.red = False
+                    self._rotateLeft(parent)
+                    node = self.root
+            else:
+                sibling = parent.left
+                if sibling.red:
+                    sibling.red = False
+                    parent.red = True
+                    self._rotateRight(parent)
+                    sibling = parent.left
+                if not self._isRed(sibling.left) and not self._isRed(sibling.right):
+                    sibling.red = True
+                    node, parent = parent, parent.parent
+                else:
+                    if not self._isRed(sibling.left):
+                        sibling.right.red = False
+                        sibling.red = True
+                        self._rotateLeft(sibling)
+                        sibling = parent.left
+                    sibling.red = parent.red
+                    parent.red = False
+                    sibling.left.red = False
+                    self._rotateRight(parent)
+                    node = self.root
+
+        if node is not None: node.red = False
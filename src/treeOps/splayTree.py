@@ -0,0 +1,133 @@
+import tree
+
+class splayTree(tree.tree):
+    """A self-adjusting (splay) binary search tree. Shares the interface and the node layout of
+    tree.tree: every access (find_node, __contains__, add_node, remove_node) moves the accessed node
+    (or the last node of an unsuccessful search) to the root by rotations (tree._rotateLeft and
+    tree._rotateRight), so frequently accessed keys stay within a few comparisons of the root.
+    NOTE:
+        - the height and balance_factor of the nodes are not maintained (use update_height and
+        update_balance_factor if needed);
+        - lookups modify the shape of the tree;
+        - insert_node (level order insertion) does not splay.
+    """
+    _metadataMaintained = False
+    # find_node and __contains__ rotate the tree (see concurrentTree)
+    _mutatingLookups = True
+
+    def __init__(self, root=None, engine='object', order_stats=False):
+        """Initializes a splay tree with its root node."""
+        assert(engine == 'object'), 'A splay tree only supports the object engine.'
+        assert(not order_stats), 'Order statistics are not supported by splay trees.'
+        super().__init__(root)
+
+    def _updateNodeMetadata(self, node):
+        """(helper function) The height and balance factor are not maintained by splay trees.
+
+        Returns:
+            (boolean) False, the ancestors of the node never need an update.
+        """
+        return False
+
+    def _splay(self, node):
+        """(helper function) Moves a given node to the root by zig, zig-zig and zig-zag steps.
+
+        Args:
+            node (treeNode): the node to be moved to the root.
+        Returns:
+            (splayTree) the tree with node as its root.
+        """
+        while node.parent is not None:
+            parent = node.parent
+            grandparent = parent.parent
+            if grandparent is None:
+                # zig
+                if node is parent.left:
+                    self._rotateRight(parent)
+                else:
+                    self._rotateLeft(parent)
+            elif (node is parent.left) == (parent is grandparent.left):
+                # zig-zig
+                if node is parent.left:
+                    self._rotateRight(grandparent)
+                    self._rotateRight(parent)
+                else:
+                    self._rotateLeft(grandparent)
+                    self._rotateLeft(parent)
+            else:
+                # zig-zag
+                if node is parent.left:
+                    self._rotateRight(parent)
+                    self._rotateLeft(grandparent)
+                else:
+                    self._rotateLeft(parent)
+                    self._rotateRight(grandparent)
+
+    def __contains__(self, data):
+        """Checks if a tree contains a given data (the accessed node is splayed, see find_node).
+
+        Args:
+            data (node val data type): the data to be found in the tree.
+        Returns:
+            (boolean) True if the tree contains the data, False otherwise.
+        """
+        return self.find_node(data) is not None
+
+    def find_node(self, data):
+        """Finds a node in a tree and splays it (or the last node of the search path if the data is
+        not found).
+
+        Args:
+            data (node val data type): the data to be found in the tree.
+        Returns:
+            (treeNode) the tree node that contains the given data, None if not found.
+        """
+        if self.root is None:
+            return None
+
+        node = self._findNode(self.root, data, last=True)
+        self._splay(node)
+        return node if node.data == data else None
+
+    def add_node(self, data, balanced=True):
+        """Adds a node to a splay tree and splays it.
+
+        Args:
+            data (node val data type): the value to be assigned to the new tree node.
+            balanced (boolean): ignored, kept for compatibility.
+        Returns:
+            (splayTree) tree updated with the new node at its root.
+        """
+        self._levelOrderQueue = None
+        self._sortedKeys = None
+
+        parent = None
+        node = self.root
+        while node is not None:
+            parent = node
+            node = node.left if data < node.data else node.right
+
+        node = self.treeNode(data)
+        node.parent = parent
+        if parent is None:
+            self.root = node
+        elif data < parent.data:
+            parent.left = node
+        else:
+            parent.right = node
+
+        self._splay(node)
+
+    def remove_node(self, data, balanced=True):
+        """Removes a node from a splay tree: the node is splayed first, then unlinked (see
+        tree._removeNode). Nothing happens if the data is not found in the tree.
+
+        Args:
+            data (node val data type): the value of the node to be removed.
+            balanced (boolean): ignored, kept for compatibility.
+        Returns:
+            (splayTree) tree updated with the node removed.
+        """
+        node = self.find_node(data)
+        if node is not None:
+            self._removeNode(node, balanced=False)
@@ -1,15 +1,75 @@
 from enum import Enum
 from collections import deque
+from itertools import islice
+import numpy as np
+import arrayTree
+import mappedTree
+import frozenTree
 
 class tree(object):
     """The main (binary search) tree class."""
-    def __init__(self, root=None):
-        """Initializes a tree with its root node."""
-        self.root = root
-        if root: self.root.parent = None
+    # False for the subclasses whose operations do not maintain the height and balance factor of the
+    # nodes, their metadata is never trusted (see is_balanced and height)
+    _metadataMaintained = True
+    # False for the subclasses whose nodes do not link to their parent (see validate)
+    _parentLinks = True
+    # True for the subclasses whose lookups restructure the tree (see concurrentTree)
+    _mutatingLookups = False
+
+    def __new__(cls, root=None, engine='object', order_stats=False, finger=False):
+        """Creates a tree using the given storage engine.
+
+        Args:
+            root (treeNode): the root node (only used with the 'object' engine).
+            engine ('object' or 'array'): 'object' (default) links treeNode objects, 'array' returns an
+            arrayTree.arrayTree which stores the nodes in parallel columns (see arrayTree). The subclasses
+            are not dispatched, their __init__ decides which engines they support.
+            order_stats (boolean): see __init__ (only used with the 'object' engine).
+            finger (boolean): see __init__ (only used with the 'object' engine).
+        Returns:
+            (tree or arrayTree) an empty tree or a tree with the given root.
+        """
+        assert(engine in {'object', 'array'}), 'Invalid tree engine!'
+
+        if engine == 'array' and cls is tree:
+            assert(root is None), 'An array-backed tree cannot be initialized with a treeNode.'
+            return arrayTree.arrayTree()
+        return super().__new__(cls)
+
+    def __init__(self, root=None, engine='object', order_stats=False, finger=False):
+        """Initializes a tree with its root node.
+        Attributes:
+            root (treeNode): the root node.
+            order_stats (boolean): if True the size of the subtree rooted at each node is maintained
+            through insertions, deletions and rotations, which enables rank, select and count_range.
+            The nodes of the tree are then created from sizedTreeNode, the sizes of the nodes of a
+            given root are assumed to be up to date.
+            finger (boolean): if True find_node and __contains__ start from the last accessed node
+            instead of the root (finger search, see _fingerStart).
+        """
+        # the array engine is only dispatched by __new__ for the tree class itself
+        assert(engine == 'object'), 'This tree class only supports the object engine.'
+        self._root = root
+        if root: self._root.parent = None
+        # the number of nodes whose balance factor is lower than -1 or greater than 1 while the metadata
+        # of the nodes is trusted (it has only been modified by the tree operations), None otherwise
+        self._imbalanced = 0 if root is None and self._metadataMaintained else None
+        self.order_stats = order_stats
+        if order_stats:
+            # the new nodes of the tree carry the size of their subtree
+            self.treeNode = self.sizedTreeNode
+        self.finger = finger
+        # the last node accessed by find_node (used if finger is True)
+        self._finger = None
+        # (start node, queue) of the level order insertion (see _insertNode)
+        self._levelOrderQueue = None
+        # (sorted keys, nodes) used by contains_many/find_many, reset when a node is added or removed
+        self._sortedKeys = None
 
     class treeNode(object):
         """The main tree node class (defined as an inner class of the tree class)."""
+        __slots__ = ('data', 'left', 'right', 'parent', 'height', 'balance_factor')
+
         def __init__(self, data=None, balance_factor=0):
             """Initializes a tree node.
             Attributes:
@@ -55,6 +115,19 @@ class tree(object):
             res += 'balance factor: {}'.format(self.balance_factor)
             return res
 
+    class sizedTreeNode(treeNode):
+        """The tree node class of the trees with order_stats enabled: a treeNode with the size of its
+        subtree."""
+        __slots__ = ('size',)
+
+        def __init__(self, data=None, balance_factor=0):
+            """Initializes a tree node.
+            Attributes:
+                size (int): the number of nodes of the tree rooted at the node.
+            """
+            super().__init__(data, balance_factor)
+            self.size = 1
+
     def __contains__(self, data):
         """Checks if a tree contains a given data.
 
@@ -63,7 +136,9 @@ class tree(object):
         Returns:
             (boolean) True if the tree contains the data, False otherwise.
         """
-        if self.root is not None:
+        if self.finger:
+            return self.find_node(data) is not None
+        elif self.root is not None:
             return self._containsData(data, self.root)
         else:
             return False
@@ -73,18 +148,11 @@ class tree(object):
 
         Args:
             data (node val data type): the data to be found in the tree.
-            node (treeNode): the (root) node at which the recursive search begins.
+            node (treeNode): the (root) node at which the search begins.
         Returns:
             (boolean) True if the (sub)tree rooted at node contains the data, False otherwise.
         """
-        if node.data == data:
-            return True
-        elif (data < node.data and node.left is not None):
-            return self._containsData(data, node.left)
-        elif (data > node.data and node.right is not None):
-            return self._containsData(data, node.right)
-            
-        return False
+        return self._findNode(node, data) is not None
 
     def __str__(self):
         """Represents a tree with a string starting from its root."""
@@ -103,12 +171,29 @@ class tree(object):
         Returns:
             (str) a space-delimited string representing the data stored in the tree.
         """
-        res = ''
-        if node is not None:
-            res += self._strTree(node.left)
-            res += '{} '.format(node.data)
-            res += self._strTree(node.right)
-        return res
+        return ''.join(self._strTokens(node, ' '))
+
+    def _strTokens(self, node, sep):
+        """(helper function) Iterates over the string representations of the data of a (sub)tree in
+        order, each one followed by sep (used by _strTree and write)."""
+        return ('{}'.format(n.data) + sep for n in self.iter_inorder(node))
+
+    def write(self, fileobj, sep=' ', chunk_size=65536):
+        """Writes the data of the tree in order (the content of __str__ for sep=' ') to a text file,
+        in chunks of chunk_size nodes, so the string representation is never built in memory.
+
+        Args:
+            fileobj (file object): a file opened for writing in text mode.
+            sep (str): the separator written after each node data.
+            chunk_size (int): the number of nodes written at once.
+        """
+        tokens = self._strTokens(self.root, sep)
+        while True:
+            chunk = ''.join(islice(tokens, chunk_size))
+            if not chunk:
+                break
+            fileobj.write(chunk)
+        fileobj.write('\n')
 
     def verbose_rep(self, verb_level=0):
         """Returns a verbose representation of the tree as a list of dictionaries. The dict keys are 
@@ -139,8 +224,7 @@ class tree(object):
         """
         assert(verb_level in {0, 1}), 'Invalid verbosity level!'
 
-        if node is not None:
-            self._verboseRep(node.left, rep, verb_level)
+        for node in self.iter_inorder(node):
             attrs = {}
             attrs['data'] = node.data
             if verb_level == 0:
@@ -154,25 +238,131 @@ class tree(object):
                 attrs['balance_factor'] = node.balance_factor
             rep.append(attrs)
 
-            self._verboseRep(node.right, rep, verb_level)
+    def to_arrays(self, verb_level=1):
+        """Returns a columnar representation of the tree: one NumPy array per node attribute, the
+        nodes being in inorder (like verbose_rep). The links are given as indices into the columns,
+        -1 standing for a missing node.
+
+        Args:
+            verb_level (0 or 1): the verbosity level, 0 gives the data, left and right columns and 1 adds
+            the parent (derived from the left and right links), height and balance_factor columns.
+        Returns:
+            (dict of numpy arrays) the columns of the tree, keyed by attribute name.
+        """
+        assert(verb_level in {0, 1}), 'Invalid verbosity level!'
+
+        # the links are resolved during the inorder walk: the left child of a node is visited before
+        # it (its index is known) and its right child after it (the index of the parent is kept)
+        nodes = list(self.iter_inorder(self.root))
+        index = {}
+        pending = {}
+        left, right, parent = [-1] * len(nodes), [-1] * len(nodes), [-1] * len(nodes)
+        for i, node in enumerate(nodes):
+            index[id(node)] = i
+            p = pending.pop(id(node), -1)
+            if p != -1:
+                parent[i] = p
+                right[p] = i
+            if node.left is not None:
+                j = index[id(node.left)]
+                left[i] = j
+                parent[j] = i
+            if node.right is not None: pending[id(node.right)] = i
+
+        columns = {}
+        columns['data'] = np.array([node.data for node in nodes])
+        columns['left'] = np.array(left, dtype=np.int64)
+        columns['right'] = np.array(right, dtype=np.int64)
+        if verb_level == 1:
+            columns['parent'] = np.array(parent, dtype=np.int64)
+            columns['height'] = np.array([node.height for node in nodes], dtype=np.int64)
+            columns['balance_factor'] = np.array([node.balance_factor for node in nodes], dtype=np.int64)
+
+        return columns
+
+    def to_dataframe(self, verb_level=1):
+        """Returns the columnar representation of the tree (see to_arrays) as a pandas DataFrame with
+        one row per node.
+
+        Args:
+            verb_level (0 or 1): the verbosity level.
+        Returns:
+            (pandas.DataFrame) the nodes of the tree in inorder.
+        """
+        # pandas is only imported when a DataFrame is requested (it is slow to import)
+        import pandas as pd
+        return pd.DataFrame(self.to_arrays(verb_level))
+
+    @property
+    def root(self):
+        """The root node of the tree."""
+        return self._root
+
+    @root.setter
+    def root(self, node):
+        """Sets the root node of the tree. The metadata of the nodes is no longer trusted (the nodes may
+        have been linked outside of the tree operations) until the next update_height, and the caches
+        built from the previous root are discarded."""
+        self._root = node
+        self._imbalanced = None
+        self._sortedKeys = None
+        self._finger = None
+        self._levelOrderQueue = None
 
     def update_height(self):
-        """Updates the height of every node of a given tree."""
-        self._updateHeight(self.root)
+        """Updates the height and the balance factor (and the size if order_stats is enabled) of every
+        node of a given tree in a single postorder pass, e.g. after the nodes have been linked outside
+        of the tree operations. The metadata is trusted afterwards (see is_balanced and height)."""
+        self._refreshTree()
+
+    def _refreshTree(self):
+        """(helper function) Refreshes the metadata of every node of the tree (see _refreshMetadata),
+        which is trusted afterwards if the tree operations maintain it.
+
+        Returns:
+            (int) the number of nodes whose balance factor is lower than -1 or greater than 1.
+        """
+        imbalanced = self._refreshMetadata(self._root)
+        self._imbalanced = imbalanced if self._metadataMaintained else None
+        return imbalanced
 
     def _updateHeight(self, node):
-        """(helper function) Recursively updates the height of each node starting from the given node 
-        all the way down.
+        """(helper function) Updates the height (and the balance factor) of each node starting from the
+        given node all the way down (see _refreshMetadata).
         
         Args:
             node (treeNode): the tree node at which the procedure starts.
         Returns:
             (tree) the input tree where every node of its subtree rooted at the input node have updated heights.
         """
-        if node is not None:
-            self._updateHeight(node.left)
-            node.height = self._calcHeight(node)
-            self._updateHeight(node.right)
+        self._refreshMetadata(node)
+        # the imbalanced nodes are only counted over the whole tree
+        self._imbalanced = None
+
+    def _refreshMetadata(self, node):
+        """(helper function) Recomputes the height and the balance factor (and the size if order_stats is
+        enabled, and the augmentation of a subclass, see _updateNodeAugmentation) of every node of the
+        subtree rooted at a given node in O(n), from the structure of the subtree only: the children are
+        updated before their parent (postorder).
+
+        Args:
+            node (treeNode): the root of the subtree to be updated.
+        Returns:
+            (int) the number of nodes of the subtree whose balance factor is lower than -1 or greater than 1.
+        """
+        imbalanced = 0
+        for n in self.iter_postorder(node):
+            lheight = -1 if n.left is None else n.left.height
+            rheight = -1 if n.right is None else n.right.height
+            n.height = max(lheight, rheight) + 1
+            n.balance_factor = lheight - rheight
+            if n.balance_factor > 1 or n.balance_factor < -1:
+                imbalanced += 1
+            if self.order_stats:
+                n.size = 1 + self._size(n.left) + self._size(n.right)
+            self._updateNodeAugmentation(n)
+
+        return imbalanced
 
     def _calcHeight(self, node):
         """(helper function) Calculates the height of the tree rooted at a given node.
@@ -188,22 +378,20 @@ class tree(object):
             return max(lheight, rheight) + 1
 
     def update_balance_factor(self):
-        """Updates the balance factor of every node of a given tree."""
-        self._updateBalanceFactor(self.root)
+        """Updates the balance factor of every node of a given tree (the heights are updated in the same
+        pass, see update_height)."""
+        self.update_height()
 
     def _updateBalanceFactor(self, node):
-        """(helper function) Recursively updates the balance factor of each node starting from the given node 
-        all the way down.
+        """(helper function) Updates the balance factor (and the height) of each node starting from the
+        given node all the way down (see _refreshMetadata).
         
         Args:
             node (treeNode): the tree node at which the procedure starts.
         Returns:
             (tree) the input tree where every node of its subtrees rooted at the input node have updated balance_factor.
         """
-        if node is not None:
-            self._updateBalanceFactor(node.left)
-            self._calcBalanceFactor(node)
-            self._updateBalanceFactor(node.right)
+        self._updateHeight(node)
 
     def _calcBalanceFactor(self, node):
         """(helper function) Calculates the balance factor of the tree rooted a given tree node.
@@ -224,45 +412,305 @@ class tree(object):
         Returns:
             (tree) tree updated with the new node inserted at one of its leaves.
         """
+        self._sortedKeys = None
         if self.root is None:
-            self.root = self.treeNode(data)
+            self._root = self.treeNode(data)
         else:
-            self.root = self._addNode(self.root, data, balanced)
+            self._root = self._addNode(self._root, data, balanced)
 
     def _addNode(self, node, data, balanced=False):
         """(helper function) Finds the right location for the new node according to the BST-property.
+        NOTE:
+            - the height and balance factor are only updated along the insertion path, using the
+            stored heights of the children. Without rebalancing the update stops as soon as the metadata
+            of a node on the path has no effect on its ancestors (see _updateNodeMetadata).
 
         Args:
             data (node val data type): the value to be assigned to the new node.
-            node (treeNode): the node at which the recursive approach to insert a new node starts.
+            node (treeNode): the node at which the search for the insertion point starts.
             balanced (boolean): if True rebalance the current root after adding the new node.
         Returns:
-            (tree) tree updated with the new node inserted at one of its leaves.
+            (treeNode) the root of the (sub)tree rooted at node after inserting the new node.
         """
-        if data < node.data:
-            if node.left is not None:
-                lnode = self._addNode(node.left, data, balanced)
+        self._levelOrderQueue = None
+        top = node
+
+        while True:
+            if data < node.data:
+                if node.left is None:
+                    node.left = self.treeNode(data)
+                    node.left.parent = node
+                    break
+                node = node.left
             else:
-                lnode = self.treeNode(data)
+                if node.right is None:
+                    node.right = self.treeNode(data)
+                    node.right.parent = node
+                    break
+                node = node.right
+
+        return self._updateInsertionPath(node, top, balanced)
+
+    def _updateInsertionPath(self, node, top, balanced=False):
+        """(helper function) Updates the height and balance factor (and rebalances the subtrees if
+        required) from the parent of a new leaf up to a given node (see _addNode).
+
+        Args:
+            node (treeNode): the parent of the new leaf.
+            top (treeNode): the node at which the search for the insertion point started.
+            balanced (boolean): if True rebalance the subtrees along the insertion path.
+        Returns:
+            (treeNode) the root of the (sub)tree rooted at top after the update.
+        """
+        top_parent = top.parent
+        while node is not None:
+            changed = self._updateNodeMetadata(node)
+            if balanced:
+                node = self._rebalanceSubtree(node)
+
+            if node.parent is top_parent:
+                return node
+            if not balanced and not changed:
+                break
+            node = node.parent
+
+        return top
+
+    def _updateNodeMetadata(self, node):
+        """(helper function) Updates the height and the balance factor (and the size if order_stats is
+        enabled) of a given node from the stored metadata of its children (the children are assumed to
+        be up to date).
+
+        Args:
+            node (treeNode): the tree node to be updated.
+        Returns:
+            (boolean) True if the ancestors of the node may have to be updated as well, i.e. the height
+            has changed or sizes are maintained.
+        """
+        lheight = -1 if node.left is None else node.left.height
+        rheight = -1 if node.right is None else node.right.height
+        old_height = node.height
+        old_imbalanced = node.balance_factor > 1 or node.balance_factor < -1
+        node.height = max(lheight, rheight) + 1
+        node.balance_factor = lheight - rheight
+        if self._imbalanced is not None and old_imbalanced != (node.balance_factor > 1 or node.balance_factor < -1):
+            self._imbalanced += -1 if old_imbalanced else 1
+
+        if self.order_stats:
+            node.size = 1 + self._size(node.left) + self._size(node.right)
+            return True
+
+        return node.height != old_height
+
+    def _updateNodeAugmentation(self, node):
+        """(helper function) Updates the data stored by a subclass in a given node on top of the height,
+        the balance factor and the size, from the augmentation of its children (the children are assumed
+        to be up to date). There is none by default (see intervalTree).
+
+        Args:
+            node (treeNode): the tree node to be updated.
+        Returns:
+            (boolean) True if the augmentation of the node has changed.
+        """
+        return False
+
+    def _validateNode(self, node):
+        """(helper function) Checks the data stored by a subclass in a given node on top of the height,
+        the balance factor and the size (see _updateNodeAugmentation and validate).
+
+        Args:
+            node (treeNode): the tree node to be checked.
+        """
+        pass
+
+    def _size(self, node):
+        """(helper function) Returns the stored size of the subtree rooted at a given node (0 for None)."""
+        return 0 if node is None else node.size
+
+    @classmethod
+    def from_sorted(cls, iterable, engine='object', order_stats=False):
+        """Constructs a perfectly balanced BST from the given data in O(n) (plus one sort of the data).
+        NOTE:
+            - the data need not be sorted, it is sorted once (in linear time if already sorted);
+            - the input is not modified.
+
+        Args:
+            iterable (iterable): the node data.
+            engine ('object' or 'array'): the storage engine of the tree.
+            order_stats (boolean): if True maintain subtree sizes (see __init__).
+        Returns:
+            (tree) a balanced BST with up-to-date heights and balance factors.
+        """
+        if engine == 'array' and cls is tree:
+            return arrayTree.arrayTree.from_sorted(iterable)
+
+        t = cls(engine=engine, order_stats=order_stats)
+        nodes = [t.treeNode(data) for data in sorted(iterable)]
+        if nodes:
+            t._root = t._balanceByRecursion(nodes, 0, len(nodes) - 1)
+            t._root.parent = None
+
+        return t
+
+    def save(self, path, key_format='q'):
+        """Writes a tree to a binary file with a fixed-width record per node (see mappedTree): the key
+        packed with key_format, the preorder indices of the left and right children (-1 for None), the
+        height and the balance factor. The root is the record 0.
+        NOTE:
+            - the tree shape is stored as is, the tree need not be a BST (but find_node/__contains__ of
+            a memory-mapped tree assume it is);
+            - key_format is a struct format of a single value, e.g. 'q' (int64), 'd' (double) or
+            '<N>s' (str encoded in UTF-8 on at most N bytes).
+
+        Args:
+            path (str): path to the output file.
+            key_format (str): the struct format of the node data.
+        """
+        fmt = key_format.encode()
+        assert(len(fmt) <= 16), 'The key format is too long.'
+
+        nodes = list(self.iter_preorder(self.root))
+        index = {id(n): i for i, n in enumerate(nodes)}
+        record = mappedTree.record_struct(key_format)
+
+        with open(path, 'wb') as fid:
+            fid.write(mappedTree.FILE_HEADER.pack(mappedTree.MAGIC, fmt, len(nodes)))
+            for n in nodes:
+                fid.write(record.pack(mappedTree.encode_key(n.data, key_format),
+                                      mappedTree.NIL if n.left is None else index[id(n.left)],
+                                      mappedTree.NIL if n.right is None else index[id(n.right)],
+                                      n.height, n.balance_factor))
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """Loads a tree written by save.
+
+        Args:
+            path (str): path to the tree file.
+            mmap (boolean): if True (default) the file is memory-mapped and a read-only
+            mappedTree.mappedTree is returned, which answers find_node/__contains__ directly from the
+            mapped buffer. If False the nodes are read into a regular tree.
+        Returns:
+            (tree or mappedTree) the loaded tree.
+        """
+        if mmap:
+            return mappedTree.mappedTree(path)
+
+        with open(path, 'rb') as fid:
+            buf = fid.read()
+
+        magic, fmt, size = mappedTree.FILE_HEADER.unpack_from(buf, 0)
+        assert(magic == mappedTree.MAGIC), 'Invalid tree file!'
+        key_format = fmt.rstrip(b'\0').decode()
+        record = mappedTree.record_struct(key_format)
+
+        t = cls()
+        body = memoryview(buf)[mappedTree.FILE_HEADER.size:mappedTree.FILE_HEADER.size + size * record.size]
+        records = list(record.iter_unpack(body))
+        nodes = [t.treeNode(mappedTree.decode_key(r[0], key_format), r[4]) for r in records]
+        for n, (_, left, right, height, _) in zip(nodes, records):
+            n.height = height
+            if left != mappedTree.NIL:
+                n.left = nodes[left]
+                n.left.parent = n
+            if right != mappedTree.NIL:
+                n.right = nodes[right]
+                n.right.parent = n
+
+        if nodes: t.root = nodes[0]
+        return t
+
+    def remove_node(self, data, balanced=True):
+        """Removes a node from a (binary search) tree (uses _removeNode, see its documentation for more
+        details). Nothing happens if the data is not found in the tree.
+
+        Args:
+            data (node val data type): the value of the node to be removed.
+            balanced (boolean): if True rebalance the tree along the deletion path.
+        Returns:
+            (tree) tree updated with the node removed.
+        """
+        node = self.find_node(data)
+        if node is not None:
+            self._removeNode(node, balanced)
+
+    def _removeNode(self, node, balanced=True):
+        """(helper function) Unlinks a given node from the tree:
+            - a node with at most one child is replaced by that child;
+            - a node with two children is replaced by its inorder successor, which is first unlinked
+            from its own position.
+        The height and balance factor are then updated (and the subtrees are rebalanced if required)
+        from the lowest modified node up to the root, i.e. only along the deletion path.
 
-            node.left = lnode
-            lnode.parent = node
+        Args:
+            node (treeNode): the node to be removed.
+            balanced (boolean): if True rebalance the tree along the deletion path.
+        Returns:
+            (tree) tree updated with the node removed.
+        """
+        self._levelOrderQueue = None
+        self._sortedKeys = None
+        self._finger = None
+        # the node the upward update has to go past before it may stop early
+        succ = None
+        if node.left is None or node.right is None:
+            child = node.left if node.left is not None else node.right
+            start = node.parent
+            self._replaceChild(node.parent, node, child)
+            if child is not None: child.parent = node.parent
         else:
-            if node.right is not None:
-                rnode = self._addNode(node.right, data, balanced)
+            succ = node.right
+            while succ.left is not None:
+                succ = succ.left
+
+            if succ is node.right:
+                start = succ
             else:
-                rnode = self.treeNode(data)
+                start = succ.parent
+                start.left = succ.right
+                if succ.right is not None: succ.right.parent = start
+                succ.right = node.right
+                node.right.parent = succ
+
+            succ.left = node.left
+            node.left.parent = succ
+            self._replaceChild(node.parent, node, succ)
+            succ.parent = node.parent
+
+        if self._imbalanced is not None and (node.balance_factor > 1 or node.balance_factor < -1):
+            self._imbalanced -= 1
+        node.left = node.right = node.parent = None
+        node.height = node.balance_factor = 0
+        if self.order_stats: node.size = 1
+
+        while start is not None:
+            changed = self._updateNodeMetadata(start)
+            if balanced:
+                start = self._rebalanceSubtree(start)
+            elif not changed and succ is None:
+                break
+            # the successor replaces the removed node: its parent has to be updated in any case
+            if start is succ:
+                succ = None
+            start = start.parent
 
-            node.right = rnode
-            rnode.parent = node
-        
-        self._updateHeight(node)
-        self._calcBalanceFactor(node)
+    def _replaceChild(self, parent, old, new):
+        """(helper function) Replaces a child of a given node by another node. If the parent is None
+        the old node is the root and the root is replaced.
 
-        if balanced:
-            return self._rebalanceSubtree(node)
+        Args:
+            parent (treeNode): the parent node of old.
+            old (treeNode): the child to be replaced.
+            new (treeNode): the replacing node (may be None).
+        Returns:
+            (treeNode) parent with the old child replaced by the new one.
+        """
+        if parent is None:
+            self._root = new
+        elif parent.left is old:
+            parent.left = new
         else:
-            return node
+            parent.right = new
 
     def insert_node(self, data, balanced=False):
         """Inserts a node in a tree in level order (uses _insertNode with the root as the starting node) 
@@ -274,8 +722,9 @@ class tree(object):
         Returns:
             (tree) tree updated with a new node.
         """
+        self._sortedKeys = None
         if self.root is None:
-            self.root = self.treeNode(data)
+            self._root = self.treeNode(data)
         else:
             self._insertNode(self.root, data, balanced)
 
@@ -285,6 +734,12 @@ class tree(object):
             traversing down the tree from the given starting point, if a node N is found whose left 
             node is empty, a new node with the given data is created as N.left, else if a node N is 
             found whose right node is empty, the new node is created as N.right. 
+        NOTE:
+            - the queue of the breadth-first traversal is kept between consecutive insertions from the
+            same starting node, so that each insertion is O(1) amortized plus an update of the height
+            and balance factor along the ancestors of the new node. The queue is discarded by the
+            other operations modifying the tree structure (add_node, remove_node, rotations), the tree
+            links must not be modified manually in between.
 
         Args:
             data (node val data type): the value to be assigned to the new node.
@@ -293,38 +748,314 @@ class tree(object):
         Returns:
             (tree) tree updated with a new node.
         """
-        Q = deque()
-        Q.append(node)
+        if self._levelOrderQueue is None or self._levelOrderQueue[0] is not node:
+            Q = deque()
+            Q.append(node)
+            self._expandLevelOrder(Q)
+            self._levelOrderQueue = (node, Q)
+
+        Q = self._levelOrderQueue[1]
+
+        # the front of the queue is the first node (in level order) that may have an empty child
+        while Q[0].left is not None and Q[0].right is not None:
+            Q.popleft()
+            self._expandLevelOrder(Q)
+
+        node = Q[0]
+        newnode = self.treeNode(data)
+        newnode.parent = node
+        if node.left is None:
+            node.left = newnode
+            Q.append(newnode)
+            if node.right is not None: Q.append(node.right)
+        else:
+            node.right = newnode
+            Q.append(newnode)
 
-        while Q:
-            node = Q.popleft()
+        self._updateNodeMetadata(node)
+        if balanced:
+            res = self._rebalanceSubtree(node)
+        else:
+            res = node
 
-            if node.left is None:
-                lnode = self.treeNode(data)
-                node.left = lnode
-                lnode.parent = node
+        ancestor = res.parent
+        while ancestor is not None:
+            if not self._updateNodeMetadata(ancestor):
                 break
+            ancestor = ancestor.parent
+
+        return res
+
+    def _expandLevelOrder(self, Q):
+        """(helper function) Appends the existing children of the front node of a level order queue to
+        the queue. The right child is only appended when the left one exists, otherwise it is appended 
+        once the left child has been inserted (see _insertNode).
+
+        Args:
+            Q (deque of treeNode): the level order queue.
+        Returns:
+            (deque of treeNode) the queue with the children of its front node appended.
+        """
+        node = Q[0]
+        if node.left is not None:
+            Q.append(node.left)
+            if node.right is not None: Q.append(node.right)
+
+    def rank(self, data):
+        """Returns the number of keys of the tree that are smaller than the given data (requires order_stats).
+
+        Args:
+            data (node val data type): the reference value (may or may not be in the tree).
+        Returns:
+            (int) the number of keys smaller than data.
+        """
+        return self._countBelow(data, inclusive=False)
+
+    def select(self, k):
+        """Finds the k-th smallest key of the tree (0-based, requires order_stats).
+
+        Args:
+            k (int): the (0-based) rank of the node to be found.
+        Returns:
+            (treeNode) the tree node with k smaller keys, None if k is out of range.
+        """
+        assert(self.order_stats), 'Order statistics are not maintained by this tree!'
+
+        node = self.root
+        while node is not None:
+            lsize = self._size(node.left)
+            if k < lsize:
+                node = node.left
+            elif k == lsize:
+                return node
             else:
-                Q.append(node.left)
+                k -= lsize + 1
+                node = node.right
 
-            if node.right is None:
-                rnode = self.treeNode(data)
-                node.right = rnode
-                rnode.parent = node
-                break
+        return None
+
+    def count_range(self, lo, hi):
+        """Counts the keys of the tree within the closed interval [lo, hi] (requires order_stats).
+
+        Args:
+            lo (node val data type): the lower bound of the interval.
+            hi (node val data type): the upper bound of the interval.
+        Returns:
+            (int) the number of keys k with lo <= k <= hi.
+        """
+        if hi < lo:
+            return 0
+        return self._countBelow(hi, inclusive=True) - self._countBelow(lo, inclusive=False)
+
+    def _countBelow(self, data, inclusive=False):
+        """(helper function) Counts the keys smaller than (or equal to if inclusive) a given value by
+        walking down a single root-to-leaf path using the subtree sizes.
+
+        Args:
+            data (node val data type): the reference value.
+            inclusive (boolean): if True the keys equal to data are counted as well.
+        Returns:
+            (int) the number of keys smaller than (or equal to) data.
+        """
+        assert(self.order_stats), 'Order statistics are not maintained by this tree!'
+
+        count = 0
+        node = self.root
+        while node is not None:
+            if node.data < data or (inclusive and node.data == data):
+                count += self._size(node.left) + 1
+                node = node.right
             else:
-                Q.append(node.right)
+                node = node.left
 
-        self.update_height()
-        self.update_balance_factor()
+        return count
 
-        if balanced:
-            return self._rebalanceSubtree(node)
-        else:
+    def floor(self, data):
+        """Finds the node with the largest key smaller than or equal to the given data.
+
+        Args:
+            data (node val data type): the reference value (may or may not be in the tree).
+        Returns:
+            (treeNode) the (inorder last) node with the largest key <= data, None if there is none.
+        """
+        res = None
+        node = self.root
+        while node is not None:
+            if node.data < data or node.data == data:
+                res = node
+                node = node.right
+            else:
+                node = node.left
+
+        return res
+
+    def ceiling(self, data):
+        """Finds the node with the smallest key greater than or equal to the given data.
+
+        Args:
+            data (node val data type): the reference value (may or may not be in the tree).
+        Returns:
+            (treeNode) the (inorder first) node with the smallest key >= data, None if there is none.
+        """
+        return self._lowerBound(data, strict=False)
+
+    def _lowerBound(self, data, strict=False):
+        """(helper function) Finds the inorder first node whose key is greater than (strict) or greater
+        than or equal to the given data.
+
+        Args:
+            data (node val data type): the reference value.
+            strict (boolean): if True the keys equal to data are skipped.
+        Returns:
+            (treeNode) the first node after data in inorder sense, None if there is none.
+        """
+        res = None
+        node = self.root
+        while node is not None:
+            if data < node.data or (not strict and node.data == data):
+                res = node
+                node = node.left
+            else:
+                node = node.right
+
+        return res
+
+    def successor(self, node):
+        """Finds the next node of a given node in inorder sense using the parent links.
+
+        Args:
+            node (treeNode): the reference node.
+        Returns:
+            (treeNode) the inorder successor of node, None if node is the last one.
+        """
+        if node.right is not None:
+            node = node.right
+            while node.left is not None:
+                node = node.left
+            return node
+
+        while node.parent is not None and node is node.parent.right:
+            node = node.parent
+
+        return node.parent
+
+    def predecessor(self, node):
+        """Finds the previous node of a given node in inorder sense using the parent links.
+
+        Args:
+            node (treeNode): the reference node.
+        Returns:
+            (treeNode) the inorder predecessor of node, None if node is the first one.
+        """
+        if node.left is not None:
+            node = node.left
+            while node.right is not None:
+                node = node.right
             return node
 
+        while node.parent is not None and node is node.parent.left:
+            node = node.parent
+
+        return node.parent
+
+    def iter_range(self, lo, hi, inclusive=True):
+        """Iterates (in ascending order) over the nodes whose keys lie between lo and hi. Only the 
+        nodes in the range and the nodes on the search path of lo are visited.
+
+        Args:
+            lo (node val data type): the lower bound of the range.
+            hi (node val data type): the upper bound of the range.
+            inclusive (boolean or pair of boolean): whether the lower and upper bounds are included,
+            a single boolean applies to both bounds.
+        Yields:
+            (treeNode) the next node of the range in inorder sense.
+        """
+        if isinstance(inclusive, bool):
+            inclusive = (inclusive, inclusive)
+        lo_incl, hi_incl = inclusive
+
+        node = self._lowerBound(lo, strict=not lo_incl)
+        while node is not None:
+            if hi < node.data or (not hi_incl and node.data == hi):
+                return
+            yield node
+            node = self.successor(node)
+
+    def iter_inorder(self, node):
+        """Iterates over a (sub)tree in order, without recursion.
+
+        Args:
+            node (treeNode): the tree node at which the inorder traversal starts.
+        Yields:
+            (treeNode) the next node of the inorder traversal path.
+        """
+        stack = []
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node
+            node = node.right
+
+    def iter_preorder(self, node):
+        """Iterates over a (sub)tree in preorder, without recursion.
+
+        Args:
+            node (treeNode): the tree node at which the preorder traversal starts.
+        Yields:
+            (treeNode) the next node of the preorder traversal path.
+        """
+        stack = [] if node is None else [node]
+        while stack:
+            node = stack.pop()
+            yield node
+            if node.right is not None: stack.append(node.right)
+            if node.left is not None: stack.append(node.left)
+
+    def iter_postorder(self, node):
+        """Iterates over a (sub)tree in postorder, without recursion.
+
+        Args:
+            node (treeNode): the tree node at which the postorder traversal starts.
+        Yields:
+            (treeNode) the next node of the postorder traversal path.
+        """
+        stack = []
+        last = None
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.left
+            else:
+                top = stack[-1]
+                if top.right is not None and top.right is not last:
+                    node = top.right
+                else:
+                    last = stack.pop()
+                    yield last
+
+    def iter_levelorder(self, node):
+        """Iterates over a (sub)tree in level order (breadth-first).
+
+        Args:
+            node (treeNode): the tree node at which the level order traversal starts.
+        Yields:
+            (treeNode) the next node of the level order traversal path.
+        """
+        if node is None:
+            return
+
+        Q = deque()
+        Q.append(node)
+        while Q:
+            node = Q.popleft()
+            if node.left is not None: Q.append(node.left)
+            if node.right is not None: Q.append(node.right)
+            yield node
+
     def inorder_traversal(self, node, path=None):
-        """Inorder Traversal.
+        """Inorder Traversal (see iter_inorder).
 
         Args:
             node (treeNode): the tree node at with the inorder traversal starts.
@@ -335,15 +1066,12 @@ class tree(object):
         if path is None:
             path = []
 
-        if node is not None:
-            path = self.inorder_traversal(node.left, path)
-            path.append(node)
-            path = self.inorder_traversal(node.right, path)
+        path.extend(self.iter_inorder(node))
 
         return path
 
     def preorder_traversal(self, node, path=None):
-        """Preorder Traversal.
+        """Preorder Traversal (see iter_preorder).
 
         Args:
             node (treeNode): the tree node at with the preorder traversal starts.
@@ -354,15 +1082,12 @@ class tree(object):
         if path is None:
             path = []
 
-        if node is not None:
-            path.append(node)
-            path = self.preorder_traversal(node.left, path)
-            path = self.preorder_traversal(node.right, path)
+        path.extend(self.iter_preorder(node))
 
         return path
 
     def postorder_traversal(self, node, path=None):
-        """Postorder Traversal.
+        """Postorder Traversal (see iter_postorder).
 
         Args:
             node (treeNode): the tree node at with the postorder traversal starts.
@@ -373,44 +1098,152 @@ class tree(object):
         if path is None:
             path = []
 
-        if node is not None:
-            path = self.postorder_traversal(node.left, path)
-            path = self.postorder_traversal(node.right, path)
-            path.append(node)
+        path.extend(self.iter_postorder(node))
 
         return path
 
     def find_node(self, data):
-        """Finds a node in a tree.
+        """Finds a node in a tree. If finger search is enabled the search starts from the last
+        accessed node (see _fingerStart), so that sorted or clustered query streams mostly stay in
+        small subtrees instead of walking down from the root each time.
         
         Args:
             data (node val data type): the data to be found in the tree.
         Returns:
             (treeNode) the tree node that contains the given data.   
         """
-        if self.root is not None:
-            return self._findNode(self.root, data)
-        else:
+        if self.root is None:
             return None
+        if not self.finger:
+            return self._findNode(self.root, data)
+
+        start = self.root if self._finger is None else self._fingerStart(self._finger, data)
+        node = self._findNode(start, data, last=True)
+        self._finger = node
+        return node if node.data == data else None
 
-    def _findNode(self, node, data):
-        """(helper function) Finds a given data in a tree.
+    def _findNode(self, node, data, last=False):
+        """(helper function) Finds a given data in a (sub)tree, without recursion.
         
         Args:
-            node (treeNode): the node at which the recursive search begins.
+            node (treeNode): the node at which the search begins.
             data (node val data type): the data to be found in the tree.
+            last (boolean): if True return the last node of the search path when the data is not found.
         Returns:
             (treeNode) the tree node that contains the given data.
         """
-        if node.data == data:
+        while True:
+            if node.data == data:
+                return node
+            elif (data < node.data and node.left is not None):
+                node = node.left
+            elif (data > node.data and node.right is not None):
+                node = node.right
+            else:
+                return node if last else None
+
+    def _fingerStart(self, node, data):
+        """(helper function) Climbs from a given node (the finger) via the parent links to the lowest
+        ancestor whose subtree holds both the finger and the given data: the climb stops at the first
+        ancestor reached from its left (resp. right) subtree whose key is not lower (resp. not greater)
+        than the data if the data is greater (resp. lower) than the key of the finger.
+
+        Args:
+            node (treeNode): the finger.
+            data (node val data type): the data to be found in the tree.
+        Returns:
+            (treeNode) the node at which the search for the data has to start.
+        """
+        if data == node.data:
             return node
-        elif (data < node.data and node.left is not None):
-            return self._findNode(node.left, data)
-        elif (data > node.data and node.right is not None):
-            return self._findNode(node.right, data)
+
+        greater = data > node.data
+        while node.parent is not None:
+            parent = node.parent
+            if greater and node is parent.left and not parent.data < data:
+                return parent
+            if not greater and node is parent.right and not data < parent.data:
+                return parent
+            node = parent
+
+        return node
+
+    def _sortedSnapshot(self):
+        """(helper function) Returns the keys of the tree as a sorted NumPy array together with the list
+        of the corresponding nodes. Both are built by an inorder walk and cached until a node is added
+        or removed.
+        """
+        if self._sortedKeys is None:
+            nodes = list(self.iter_inorder(self.root))
+            self._sortedKeys = (np.array([n.data for n in nodes]), nodes)
+        return self._sortedKeys
+
+    def _searchMany(self, keys):
+        """(helper function) Searches a batch of keys in the sorted snapshot of the tree.
+
+        Args:
+            keys (array_like): the keys to be found.
+        Returns:
+            (tuple of numpy arrays) the position of each key in the snapshot and whether it was found.
+        """
+        sorted_keys, _ = self._sortedSnapshot()
+        keys = np.asarray(keys)
+        if len(sorted_keys) == 0:
+            return np.zeros(keys.shape, dtype=np.intp), np.zeros(keys.shape, dtype=bool)
+
+        if keys.ndim == 1 and len(keys) > 1:
+            # searching the keys in ascending order keeps the accessed part of the snapshot in cache
+            order = np.argsort(keys, kind='stable')
+            pos = np.empty(len(keys), dtype=np.intp)
+            pos[order] = np.searchsorted(sorted_keys, keys[order])
+        else:
+            pos = np.searchsorted(sorted_keys, keys)
+        pos = np.minimum(pos, len(sorted_keys) - 1)
+        return pos, sorted_keys[pos] == keys
+
+    def contains_many(self, keys):
+        """Checks the membership of a batch of keys at once: the tree is frozen into a sorted NumPy
+        array (cached until the next insertion or deletion) searched with np.searchsorted.
+        NOTE:
+            - the keys must be comparable with NumPy (numbers or strings of a single type);
+            - changes made to the nodes directly (not through add_node, insert_node or remove_node)
+            are not seen by the cached array.
+
+        Args:
+            keys (array_like): the keys to be found in the tree.
+        Returns:
+            (numpy array of bool) True for the keys contained in the tree.
+        """
+        _, found = self._searchMany(keys)
+        return found
+
+    def find_many(self, keys):
+        """Finds the nodes of a batch of keys at once (see contains_many).
+
+        Args:
+            keys (array_like): the keys to be found in the tree.
+        Returns:
+            (list of treeNode) the node containing each key, None for the keys not found.
+        """
+        pos, found = self._searchMany(keys)
+        _, nodes = self._sortedSnapshot()
+        return [nodes[p] if f else None for p, f in zip(pos.tolist(), found.tolist())]
+
+    def freeze(self, layout='eytzinger'):
+        """Returns an immutable, contiguous copy of the (binary search) tree laid out for lookups
+        (see frozenTree). Later changes of the tree are not reflected.
+
+        Args:
+            layout ('eytzinger' or 'veb'): the memory layout of the frozen tree.
+        Returns:
+            (frozenTree) the frozen tree, answering __contains__, find, iter_range and contains_many.
+        """
+        return frozenTree.frozenTree([n.data for n in self.iter_inorder(self.root)], layout)
 
     def DFS(self, start, path=None):
         """Depth-First Search (DFS).
+        NOTE:
+            - if path is not empty, the start node is assumed to be already visited and is not appended.
 
         Args:
             start (treeNode): the node where the traversal starts.
@@ -424,16 +1257,12 @@ class tree(object):
         if start is None:
             return
 
-        if len(path) == 0: path.append(start)
+        nodes = self.iter_preorder(start)
+        if len(path) > 0: next(nodes)
+        path.extend(nodes)
 
-        children = []
-        if start.left is not None: children.append(start.left)
-        if start.right is not None: children.append(start.right)
+        return path
 
-        for child in children:
-            path.append(child)
-            self.DFS(child, path)
-        
     def BFS(self, start):
         """Breadth-First Search (BFS).
 
@@ -444,22 +1273,8 @@ class tree(object):
         """
         if start is None:
             return
-        path = []
-
-        Q = deque()
-        Q.append(start)
-        while Q:
-            k = Q.popleft()
-
-            children = []
-            if k.left is not None: children.append(k.left)
-            if k.right is not None: children.append(k.right)
-            for child in children:
-                Q.append(child)
 
-            path.append(k)
-
-        return path
+        return list(self.iter_levelorder(start))
 
     def root_to_leaf_paths(self):
         """Returns all the root-to-leaf paths of a binary tree.
@@ -501,13 +1316,139 @@ class tree(object):
 
         if len(path) > 0: path.pop()
 
+    def iter_root_to_leaf_paths(self, as_='tuple', dtype=object):
+        """Iterates over the root-to-leaf paths of a binary tree (in the order of root_to_leaf_paths)
+        without building the list of paths: a single path buffer is filled along a depth-first walk.
+
+        Args:
+            as_ ('tuple' or 'array'): 'tuple' yields a new tuple of node data per path, 'array' yields a
+            NumPy view of the path buffer itself, which is overwritten by the next path (copy it to keep it).
+            dtype (NumPy dtype): the dtype of the path buffer ('array' only).
+        Yields:
+            (tuple or numpy array) the data of the nodes of the next root-to-leaf path.
+        """
+        assert(as_ in {'tuple', 'array'}), 'Invalid path type!'
+
+        if as_ == 'array':
+            path = np.empty(max(self.root.height + 1, 1) if self.root is not None else 1, dtype=dtype)
+        else:
+            path = []
+
+        stack = [] if self.root is None else [(self.root, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if as_ == 'array':
+                if depth == len(path):
+                    path = np.resize(path, 2 * len(path))
+                path[depth] = node.data
+            else:
+                del path[depth:]
+                path.append(node.data)
+
+            if node.left is None and node.right is None:
+                yield path[:depth + 1] if as_ == 'array' else tuple(path)
+            else:
+                if node.right is not None: stack.append((node.right, depth + 1))
+                if node.left is not None: stack.append((node.left, depth + 1))
+
+    def count_root_to_leaf_paths(self):
+        """Returns the number of root-to-leaf paths of a binary tree (i.e. the number of leaves)."""
+        return sum(1 for n in self.iter_preorder(self.root) if n.left is None and n.right is None)
+
+    def reduce_root_to_leaf_paths(self, func, initial, select=max):
+        """Reduces every root-to-leaf path to a value and selects one of these values, without building
+        the paths: the value of a path is accumulated along the walk, func(func(initial, root.data), ...).
+
+        Args:
+            func (function): the accumulation function of two arguments (value so far, node data).
+            initial (any type): the value of an empty path.
+            select (function): the selection over the values of all the paths (max by default).
+        Returns:
+            (any type) the selected value, None if the tree is empty.
+        """
+        if self.root is None:
+            return None
+
+        def leafValues():
+            stack = [(self.root, func(initial, self.root.data))]
+            while stack:
+                node, value = stack.pop()
+                if node.left is None and node.right is None:
+                    yield value
+                if node.right is not None: stack.append((node.right, func(value, node.right.data)))
+                if node.left is not None: stack.append((node.left, func(value, node.left.data)))
+
+        return select(leafValues())
+
+    def max_path_sum(self):
+        """Returns the maximum sum of the node data over the root-to-leaf paths (None if the tree is empty)."""
+        return self.reduce_root_to_leaf_paths(lambda value, data: value + data, 0, max)
+
     def is_balanced(self):
-        """Checks whether or not a tree (BST or not) is balanced.
+        """Checks whether or not a tree (BST or not) is balanced: in O(1) from the number of imbalanced
+        nodes kept by the tree operations if the metadata is trusted, otherwise the metadata of the whole
+        tree is refreshed first by an iterative postorder pass (see update_height).
 
         Returns:
             (bool) True when the tree is balanced, False otherwise.
         """
-        return self._isBalanced(self.root) > -1
+        if self._imbalanced is not None:
+            return self._imbalanced == 0
+        return self._refreshTree() == 0
+
+    def height(self):
+        """Returns the height of a tree (-1 if empty): the stored height of the root in O(1) if the
+        metadata is trusted, otherwise the metadata of the whole tree is refreshed first (see
+        update_height).
+
+        Returns:
+            (int) the height of the tree.
+        """
+        if self._root is None:
+            return -1
+        if self._imbalanced is None:
+            self._refreshTree()
+        return self._root.height
+
+    def validate(self):
+        """Checks the invariants of a (binary search) tree in O(n), for debugging: the parent links, the
+        order of the node data, the stored height and balance factor of every node (and its size if
+        order_stats is enabled, and the augmentation of a subclass, see _validateNode) and the number of
+        imbalanced nodes used by is_balanced.
+        NOTE:
+            - the metadata is only checked if the tree operations maintain it (see rbTree, splayTree)
+            and the parent links if the nodes have them (see persistentTree);
+            - insert_node (level order insertion) does not preserve the order of the node data.
+
+        Returns:
+            (bool) True, an AssertionError is raised at the first invariant that does not hold.
+        """
+        assert(not self._parentLinks or self._root is None or self._root.parent is None), 'The root node has a parent!'
+
+        prev = None
+        for n in self.iter_inorder(self._root):
+            assert(prev is None or not n.data < prev.data), 'Unordered data: {} after {}!'.format(n.data, prev.data)
+            prev = n
+
+        imbalanced = 0
+        for n in self.iter_postorder(self._root):
+            for child in (n.left, n.right):
+                assert(not self._parentLinks or child is None or child.parent is n), 'Invalid parent link of a child of {}!'.format(n.data)
+            if not self._metadataMaintained:
+                continue
+
+            lheight = -1 if n.left is None else n.left.height
+            rheight = -1 if n.right is None else n.right.height
+            assert(n.height == max(lheight, rheight) + 1), 'Invalid height of {}!'.format(n.data)
+            assert(n.balance_factor == lheight - rheight), 'Invalid balance factor of {}!'.format(n.data)
+            if self.order_stats:
+                assert(n.size == 1 + self._size(n.left) + self._size(n.right)), 'Invalid size of {}!'.format(n.data)
+            self._validateNode(n)
+            if n.balance_factor > 1 or n.balance_factor < -1:
+                imbalanced += 1
+
+        assert(self._imbalanced is None or self._imbalanced == imbalanced), 'Invalid number of imbalanced nodes!'
+        return True
 
     def _isBalanced(self, node):
         """(helper function) Checks if a BST is balanced.
@@ -548,6 +1489,7 @@ class tree(object):
         Returns:
             (treeNode) the root node of the constructed balanced tree after recursion is completed.
         """
+        self._levelOrderQueue = None
         if start > end:
             return None
 
@@ -560,8 +1502,7 @@ class tree(object):
         if node.left: node.left.parent = node
         if node.right: node.right.parent = node
 
-        self._updateHeight(node)
-        self._calcBalanceFactor(node)
+        self._updateNodeMetadata(node)
 
         return node
 
@@ -576,10 +1517,8 @@ class tree(object):
         Returns:
             (tree) res (a balanced tree) with nodes imported from the input tree.
         """
-        if node is not None:
-            self._convertToAVL(node.left, res)
-            res.add_node(node.data, balanced=True)
-            self._convertToAVL(node.right, res)
+        for n in self.iter_inorder(node):
+            res.add_node(n.data, balanced=True)
 
         return res
 
@@ -621,6 +1560,7 @@ class tree(object):
         Returns:
             (treeNode) root of the new tree.
         """
+        self._levelOrderQueue = None
         assert(node.left is not None)
 
         pivot = node.left
@@ -639,13 +1579,11 @@ class tree(object):
             elif pivot.parent.left == node:
                 pivot.parent.left = pivot
 
-        if self.root == node:
-            self.root = pivot
+        if self._root is node:
+            self._root = pivot
 
-        self._updateHeight(node)
-        self._calcBalanceFactor(node)
-        self._updateHeight(pivot)
-        self._calcBalanceFactor(pivot)
+        self._updateNodeMetadata(node)
+        self._updateNodeMetadata(pivot)
 
         return pivot
 
@@ -657,6 +1595,7 @@ class tree(object):
         Returns:
             (treeNode) root of the new tree.
         """
+        self._levelOrderQueue = None
         assert(node.right is not None)
 
         pivot = node.right
@@ -675,13 +1614,11 @@ class tree(object):
             elif pivot.parent.left == node:
                 pivot.parent.left = pivot
 
-        if self.root == node:
-            self.root = pivot
+        if self._root is node:
+            self._root = pivot
 
-        self._updateHeight(node)
-        self._calcBalanceFactor(node)
-        self._updateHeight(pivot)
-        self._calcBalanceFactor(pivot)
+        self._updateNodeMetadata(node)
+        self._updateNodeMetadata(pivot)
 
         return pivot
 
@@ -1,24 +1,35 @@
 import tree
+import arrayTree
+import multisetTree
 import re
 import string
+import heapq
 import numpy as np
 
-def list_to_tree(dlist, rootVal=None, balanced=False):
+def list_to_tree(dlist, rootVal=None, balanced=False, engine='object', bulk=False, multiset=False):
     """Constructs a binary tree (BST or AVL) from a given list of node data.
 
     NOTE:
         - if balanced=True the rebalancing procedure (consisting of tree rotations) may lead to a 
         tree where rootVal is not necessarily the root. 
         - if rootVal=None (default) the first element of dlist will be assgined to rootVal.
+        - if bulk=True the tree is built at once from the sorted data (see tree.from_sorted), the
+        result is balanced and rootVal is not necessarily the root.
+        - if multiset=True equal values share a single node holding their count (see multisetTree),
+        the object engine is required.
+        - dlist is not modified.
 
     Args:
         dlist (list): list of node data.
         rootVal (node val data type): value of the root node, may or may not be from dlist.
         balanced (boolean): if True the result will be a balanced tree.
+        engine ('object' or 'array'): the storage engine of the tree (see tree.tree).
+        bulk (boolean): if True build a balanced tree in O(n) from the sorted data.
+        multiset (boolean): if True build a multisetTree.multisetTree.
     Returns:
         (tree) a BST from the given data list.
     """
-    t = tree.tree()
+    assert(not (multiset and engine == 'array')), 'Multiset trees only support the object engine.'
 
     if rootVal is None:
         try:
@@ -27,14 +38,21 @@ def list_to_tree(dlist, rootVal=None, balanced=False):
             print("Error! dlist, the list of node data, is empty.")
             return None
 
-    t.add_node(rootVal, balanced)
+    if bulk:
+        assert(not multiset), 'Bulk construction is not supported by multiset trees.'
+        if rootVal in dlist:
+            return tree.tree.from_sorted(dlist, engine=engine)
+        return tree.tree.from_sorted(dlist + [rootVal], engine=engine)
 
-    try:
-        dlist.remove(rootVal)
-    except ValueError:
-        pass
+    t = multisetTree.multisetTree(engine=engine) if multiset else tree.tree(engine=engine)
+    t.add_node(rootVal, balanced)
 
+    # skip the first occurrence of rootVal (already inserted)
+    skipped = False
     for data in dlist:
+        if not skipped and data == rootVal:
+            skipped = True
+            continue
         t.add_node(data, balanced)
 
     return t
@@ -87,8 +105,8 @@ def dict_to_tree(tdict, root_ind=0):
         n.left = lnode
         n.right = rnode
 
+    # the heights and balance factors are updated in a single pass
     t.update_height()
-    t.update_balance_factor()
 
     return t
 
@@ -125,7 +143,96 @@ def convert_to_AVL(inTree):
 
     return avlTree
 
-def text_to_tree(path, regex="", balanced=False):
+def _iterSortedData(t):
+    """(helper function) Iterates over the data of a tree (of any engine) in order."""
+    if isinstance(t, arrayTree.arrayTree):
+        return (t.data[n] for n in t.iter_inorder(t.root))
+    return (n.data for n in t.iter_inorder(t.root))
+
+def _engine(t):
+    """(helper function) Returns the storage engine of a tree."""
+    return 'array' if isinstance(t, arrayTree.arrayTree) else 'object'
+
+def merge_trees(t1, t2, balanced=True):
+    """Merges two BSTs into a new tree containing the data of both (duplicates are kept).
+
+    NOTE:
+        - if balanced=True the in-order streams of both trees are merged and a balanced tree is built
+        from the result in O(n + m) (see tree.from_sorted);
+        - if balanced=False the data of t1 (in preorder, which reproduces its shape) and then of t2 are
+        reinserted into an unbalanced BST;
+        - the input trees are not modified, the result uses the storage engine of t1.
+
+    Args:
+        t1 (tree): the first BST.
+        t2 (tree): the second BST.
+        balanced (boolean): if True the result will be a balanced tree.
+    Returns:
+        (tree) a BST containing the data of both trees.
+    """
+    if not balanced:
+        res = tree.tree(engine=_engine(t1))
+        if isinstance(t1, arrayTree.arrayTree):
+            data = [t1.data[n] for n in t1.iter_preorder(t1.root)]
+        else:
+            data = [n.data for n in t1.iter_preorder(t1.root)]
+        for d in data:
+            res.add_node(d)
+        for d in _iterSortedData(t2):
+            res.add_node(d)
+        return res
+
+    return tree.tree.from_sorted(heapq.merge(_iterSortedData(t1), _iterSortedData(t2)), engine=_engine(t1))
+
+def intersect_trees(t1, t2):
+    """Builds a balanced BST from the data found in both given BSTs in O(n + m), by a single pass over
+    the in-order streams of the trees. Duplicates are kept as many times as they occur in both trees.
+
+    Args:
+        t1 (tree): the first BST.
+        t2 (tree): the second BST.
+    Returns:
+        (tree) a balanced BST (with the storage engine of t1) containing the common data.
+    """
+    res = []
+    it1, it2 = _iterSortedData(t1), _iterSortedData(t2)
+    d1, d2 = next(it1, None), next(it2, None)
+    while d1 is not None and d2 is not None:
+        if d1 < d2:
+            d1 = next(it1, None)
+        elif d2 < d1:
+            d2 = next(it2, None)
+        else:
+            res.append(d1)
+            d1, d2 = next(it1, None), next(it2, None)
+
+    return tree.tree.from_sorted(res, engine=_engine(t1))
+
+def difference_trees(t1, t2):
+    """Builds a balanced BST from the data of t1 that is not found in t2 in O(n + m), by a single pass
+    over the in-order streams of the trees. A duplicate of t1 is removed as many times as it occurs in t2.
+
+    Args:
+        t1 (tree): the first BST.
+        t2 (tree): the BST of the data to be removed.
+    Returns:
+        (tree) a balanced BST (with the storage engine of t1) containing the data of t1 not in t2.
+    """
+    res = []
+    it1, it2 = _iterSortedData(t1), _iterSortedData(t2)
+    d1, d2 = next(it1, None), next(it2, None)
+    while d1 is not None:
+        if d2 is None or d1 < d2:
+            res.append(d1)
+            d1 = next(it1, None)
+        elif d2 < d1:
+            d2 = next(it2, None)
+        else:
+            d1, d2 = next(it1, None), next(it2, None)
+
+    return tree.tree.from_sorted(res, engine=_engine(t1))
+
+def text_to_tree(path, regex="", balanced=False, multiset=False):
     """Splits a text into paragraphs, splits each paragraph into words and stores those words in a tree.
 
     NOTE:
@@ -138,11 +245,13 @@ def text_to_tree(path, regex="", balanced=False):
             become "dont" and numbers like "2.3" will become "23"
             regex="(?<!\d )["+string.punctuation+"](?!\d)", acts as above but numbers will remain unchanged.
         - The size of the returned list is equal to the number of non-empty paragraphs in the text.
+        - If multiset=True each tree holds one node per distinct word with its number of occurrences.
 
     Args:
         path (str): path to the input file.
         regex (str): regular expression used while splitting paragraph into words.
         balanced (boolean): if True the constructed trees will be balanced.
+        multiset (boolean): if True the constructed trees will be multisetTree.multisetTree.
     Returns:
         (list of tree) a list of trees where each tree stores words found in any (non-empty) paragraph.
     """
@@ -158,7 +267,7 @@ def text_to_tree(path, regex="", balanced=False):
         wordlist = re.sub(regex,'',par).split()
         if len(wordlist) > 0:
             # use default rootVal
-            t = list_to_tree(wordlist, balanced=balanced)
+            t = list_to_tree(wordlist, balanced=balanced, multiset=multiset)
             treelist.append(t)
 
     return treelist
@@ -0,0 +1,113 @@
+# these tests are designed for pytest framework
+import pytest
+import tree as Tree
+import arrayTree as ArrayTree
+import rbTree as RBTree
+import splayTree as STree
+import persistentTree as PTree
+import intervalTree as ITree
+import multisetTree as MTree
+import deepdiff
+import operator as op
+
+@pytest.fixture
+def ref_atree():
+    """Returns an array-backed AVL tree and an object-based AVL tree built from the same data."""
+    data = [5, 3, 8, 1, 4, 7, 9, 2, 6]
+    at = Tree.tree(engine='array')
+    t = Tree.tree()
+    for d in data:
+        at.add_node(d, True)
+        t.add_node(d, True)
+
+    return at, t
+
+def test_engine():
+    at = Tree.tree(engine='array')
+    cond1 = isinstance(at, ArrayTree.arrayTree)
+    cond2 = isinstance(Tree.tree(), Tree.tree)
+    cond3 = (at.root == None and len(at) == 0)
+
+    assert cond1 and cond2 and cond3
+
+def test_engine_subclasses():
+    # only the tree class itself is dispatched to the array engine
+    for cls in (RBTree.rbTree, STree.splayTree, PTree.persistentTree, ITree.intervalTree, MTree.multisetTree):
+        with pytest.raises(AssertionError):
+            cls(engine='array')
+        with pytest.raises(AssertionError):
+            cls.from_sorted([1, 2], engine='array')
+
+    cond1 = isinstance(Tree.tree.from_sorted([2, 1], engine='array'), ArrayTree.arrayTree)
+    cond2 = isinstance(RBTree.rbTree.from_sorted([2, 1]), RBTree.rbTree)
+
+    assert cond1 and cond2
+
+def test__contains__(ref_atree):
+    at,_ = ref_atree
+    cond = (4 in at, 10 in at, 0 in Tree.tree(engine='array'))
+
+    assert cond == (True, False, False)
+
+def test_find_node(ref_atree):
+    at,_ = ref_atree
+    n = at.find_node(7)
+
+    assert at.data[n] == 7 and at.find_node(11) == None
+
+def test__str__(ref_atree):
+    at, t = ref_atree
+
+    assert at.__str__() == t.__str__() == "1 2 3 4 5 6 7 8 9 \n"
+
+def test_verbose_rep(ref_atree):
+    at, t = ref_atree
+
+    for verb_level in (0, 1):
+        rep = sorted(at.verbose_rep(verb_level), key=op.itemgetter('data'))
+        ref_rep = sorted(t.verbose_rep(verb_level), key=op.itemgetter('data'))
+
+        assert not deepdiff.DeepDiff(rep, ref_rep)
+
+def test_add_node_unbalanced():
+    at = Tree.tree(engine='array')
+    t = Tree.tree()
+    for d in [8, 3, 10, 1, 6, 14, 4, 7, 13]:
+        at.add_node(d)
+        t.add_node(d)
+
+    rep = at.verbose_rep(1)
+    ref_rep = t.verbose_rep(1)
+
+    assert not deepdiff.DeepDiff(rep, ref_rep) and not at.is_balanced()
+
+def test_traversals(ref_atree):
+    at, t = ref_atree
+    data = lambda path: [at.data[n] for n in path]
+    ref_data = lambda path: [n.data for n in path]
+
+    cond1 = data(at.inorder_traversal(at.root)) == ref_data(t.inorder_traversal(t.root))
+    cond2 = data(at.preorder_traversal(at.root)) == ref_data(t.preorder_traversal(t.root))
+    cond3 = data(at.postorder_traversal(at.root)) == ref_data(t.postorder_traversal(t.root))
+    cond4 = data(at.BFS(at.root)) == ref_data(t.BFS(t.root))
+
+    assert cond1 and cond2 and cond3 and cond4
+
+def test_is_balanced():
+    at = Tree.tree(engine='array')
+    for i in range(1000):
+        at.add_node(i, True)
+
+    cond1 = at.is_balanced()
+    cond2 = (at.height[at.root] == 9)
+
+    assert cond1 and cond2
+
+def test_from_sorted():
+    at = Tree.tree.from_sorted(range(100, 0, -1), engine='array')
+    t = Tree.tree.from_sorted(range(1, 101))
+
+    rep = at.verbose_rep(1)
+    ref_rep = t.verbose_rep(1)
+
+    assert not deepdiff.DeepDiff(rep, ref_rep) and at.is_balanced()
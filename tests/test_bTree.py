@@ -0,0 +1,98 @@
+# these tests are designed for pytest framework
+import pytest
+import bTree as BTree
+import random
+
+@pytest.fixture
+def ref_btree(tmp_path):
+    """Returns a small-paged B+-tree (with a tiny page cache) holding 2000 shuffled integer keys
+    (each key twice), and the sorted list of its keys."""
+    keys = list(range(1000)) * 2
+    random.Random(0).shuffle(keys)
+
+    t = BTree.bTree(str(tmp_path / 'ref.db'), page_size=256, cache_pages=4)
+    for k in keys:
+        t.add_node(k)
+
+    yield t, sorted(keys)
+    t.close()
+
+def test_capacity(tmp_path):
+    t = BTree.bTree(str(tmp_path / 'cap.db'), page_size=4096)
+
+    cond1 = (t.max_leaf_keys == (4096 - 13) // 8)
+    cond2 = (t.max_internal_keys == (4096 - 13 - 8) // 16)
+    cond3 = (len(t) == 0 and 1 not in t and t.inorder_traversal() == [])
+
+    t.close()
+    assert cond1 and cond2 and cond3
+
+def test_add_node(ref_btree):
+    t, keys = ref_btree
+
+    cond1 = (len(t) == 2000)
+    cond2 = (t.inorder_traversal() == keys)
+    cond3 = (len(t._cache) <= 4)
+
+    assert cond1 and cond2 and cond3
+
+def test_find_node(ref_btree):
+    t,_ = ref_btree
+
+    cond1 = all(k in t for k in range(0, 1000, 7))
+    cond2 = (-1 not in t and 1000 not in t)
+    cond3 = (t.find_node(500) == 500 and t.find_node(1500) == None)
+
+    assert cond1 and cond2 and cond3
+
+def test_iter_range(ref_btree):
+    t,_ = ref_btree
+
+    cond1 = list(t.iter_range(10, 12)) == [10, 10, 11, 11, 12, 12]
+    cond2 = list(t.iter_range(10, 12, inclusive=False)) == [11, 11]
+    cond3 = list(t.iter_range(998, 2000)) == [998, 998, 999, 999]
+
+    assert cond1 and cond2 and cond3
+
+def test_reopen(tmp_path):
+    path = str(tmp_path / 'words.db')
+    words = ['west', 'östlicher', 'divan', 'goethe', 'a', 'divan']
+
+    with BTree.bTree(path, page_size=128, key_format='12s', cache_pages=2) as t:
+        for w in words:
+            t.add_node(w)
+
+    t = BTree.bTree(path)
+    cond1 = (t.page_size == 128 and t.key_format == '12s')
+    cond2 = (t.inorder_traversal() == sorted(words))
+    cond3 = ('goethe' in t and 'faust' not in t)
+    t.close()
+
+    assert cond1 and cond2 and cond3
+
+def test_small_cache(tmp_path):
+    path = str(tmp_path / 'small.db')
+    keys = [random.Random(1).randrange(10**6) for _ in range(20000)]
+
+    # the cache is kept at its minimal size: the pages being split must not be evicted
+    t = BTree.bTree(path, page_size=128, cache_pages=2)
+    for k in keys:
+        t.cache_pages = t._depth + 2
+        t.add_node(k)
+    t.close()
+
+    t = BTree.bTree(path, cache_pages=16)
+    cond1 = (t.inorder_traversal() == sorted(keys) and t._depth >= 4)
+    t.close()
+
+    with pytest.raises(AssertionError):
+        BTree.bTree(str(tmp_path / 'one.db'), cache_pages=1)
+
+    t = BTree.bTree(str(tmp_path / 'three.db'), page_size=128, cache_pages=3)
+    with pytest.raises(AssertionError):
+        for k in keys:
+            t.add_node(k)
+    cond2 = (t.inorder_traversal() == sorted(keys[:len(t)]))
+    t.close()
+
+    assert cond1 and cond2
@@ -0,0 +1,151 @@
+# these tests are designed for pytest framework
+import pytest
+import concurrentTree as CTree
+import splayTree as STree
+import threading
+import random
+import sys
+import time
+
+def test_rwLock():
+    lock = CTree.rwLock()
+    lock.acquire_read()
+    lock.acquire_read()
+    # the nested acquisitions of a thread hold the lock once
+    cond1 = (lock._readers == 1 and not lock._writer)
+
+    acquired = threading.Event()
+    def writer():
+        with lock.write_locked():
+            with lock.write_locked(), lock.read_locked():
+                acquired.set()
+
+    w = threading.Thread(target=writer)
+    w.start()
+    lock.release_read()
+    cond2 = not acquired.wait(0.05)
+    lock.release_read()
+    w.join(5)
+    cond3 = acquired.is_set() and lock._readers == 0 and not lock._writer
+
+    # a read lock is not upgraded
+    with lock.read_locked():
+        with pytest.raises(AssertionError):
+            lock.acquire_write()
+    cond4 = lock._readers == 0 and lock._waitingWriters == 0
+
+    assert cond1 and cond2 and cond3 and cond4
+
+def test_concurrent_tree():
+    ct = CTree.concurrentTree()
+    for k in range(10):
+        ct.add_node(k, balanced=True)
+    ct.remove_node(3)
+    ct.add_node(20, balanced=True)
+
+    cond1 = (5 in ct and 3 not in ct and 20 in ct and ct.find_node(7).data == 7)
+    cond2 = [n.data for n in ct.inorder_traversal()] == [0, 1, 2, 4, 5, 6, 7, 8, 9, 20]
+    cond3 = len(ct.BFS()) == len(ct.preorder_traversal()) == len(ct.postorder_traversal()) == 10
+
+    assert cond1 and cond2 and cond3
+
+def test_concurrent_stress():
+    """Readers check the consistency of the tree while a writer inserts with rebalancing."""
+    keys = list(range(3000))
+    random.Random(0).shuffle(keys)
+    ct = CTree.concurrentTree()
+    inserted = [0]
+    done = threading.Event()
+    errors = []
+
+    def writer():
+        for i, k in enumerate(keys):
+            ct.add_node(k, balanced=True)
+            inserted[0] = i + 1
+        done.set()
+
+    def reader(seed):
+        rnd = random.Random(seed)
+        while not done.is_set():
+            n = inserted[0]
+            if n and keys[rnd.randrange(n)] not in ct:
+                errors.append('missing key')
+            with ct.read_locked():
+                data = [node.data for node in ct.tree.iter_inorder(ct.tree.root)]
+                if data != sorted(data) or len(data) < n:
+                    errors.append('inconsistent traversal')
+                if not ct.tree.is_balanced():
+                    errors.append('unbalanced tree')
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)
+    try:
+        threads = [threading.Thread(target=reader, args=(s,)) for s in range(4)]
+        threads.append(threading.Thread(target=writer))
+        for th in threads: th.start()
+        for th in threads: th.join(60)
+    finally:
+        sys.setswitchinterval(interval)
+
+    cond1 = errors == []
+    cond2 = [n.data for n in ct.inorder_traversal()] == list(range(3000))
+
+    assert cond1 and cond2
+
+def test_concurrent_splay_lookups():
+    """Splay lookups rotate the tree, they must wait for the readers like the writers."""
+    st = STree.splayTree()
+    for k in range(100):
+        st.add_node(k)
+    ct = CTree.concurrentTree(st)
+    found = threading.Event()
+
+    def lookup():
+        if 5 in ct and ct.find_node(7) is not None:
+            found.set()
+
+    ct.lock.acquire_read()
+    th = threading.Thread(target=lookup)
+    th.start()
+    cond1 = not found.wait(0.05)
+    ct.lock.release_read()
+    th.join(5)
+    cond2 = found.is_set() and st.root.data == 7
+
+    assert cond1 and cond2
+
+def test_nested_reads():
+    """The readers of the wrapper can be called inside read_locked while a writer is queued."""
+    results = []
+    for t in [None, STree.splayTree()]:
+        ct = CTree.concurrentTree(t)
+        for k in range(10):
+            ct.add_node(k)
+        done = threading.Event()
+
+        def reader():
+            with ct.read_locked():
+                w = threading.Thread(target=ct.add_node, args=(20,), daemon=True)
+                w.start()
+                for _ in range(500):
+                    if ct.lock._waitingWriters: break
+                    time.sleep(0.01)
+                if 5 in ct and ct.find_node(7) is not None and len(ct.inorder_traversal()) == 10:
+                    done.set()
+            w.join(5)
+
+        th = threading.Thread(target=reader, daemon=True)
+        th.start()
+        th.join(5)
+        results.append(done.is_set() and 20 in ct)
+
+    # the lookups of the other trees share the read lock
+    ct = CTree.concurrentTree()
+    ct.add_node(5)
+    found = threading.Event()
+    with ct.read_locked():
+        th = threading.Thread(target=lambda: 5 in ct and found.set())
+        th.start()
+        th.join(5)
+
+    assert results == [True, True] and found.is_set()
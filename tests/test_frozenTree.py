@@ -0,0 +1,55 @@
+# these tests are designed for pytest framework
+import pytest
+import tree as Tree
+import frozenTree as FTree
+import random
+
+@pytest.fixture(params=['eytzinger', 'veb'])
+def ref_frozen_tree(request):
+    """Returns a frozen tree (in both layouts) of 100 random keys with duplicates, and the sorted keys."""
+    rnd = random.Random(0)
+    keys = sorted(rnd.randrange(300) for _ in range(100))
+    return FTree.frozenTree(keys, request.param), keys
+
+def test_layout():
+    keys = list(range(1, 11))
+    f1 = FTree.frozenTree(keys, 'eytzinger')
+    f2 = FTree.frozenTree(keys, 'veb')
+
+    cond1 = f1.keys == [7, 4, 9, 2, 6, 8, 10, 1, 3, 5]
+    cond2 = (f2.keys == [7, 4, 9, 2, 1, 3, 6, 5, 8, 10] and f2.left[3] == 4 and f2.right[1] == 6)
+    cond3 = list(f1) == list(f2) == keys and len(f1) == len(f2) == 10
+
+    assert cond1 and cond2 and cond3
+
+def test_find(ref_frozen_tree):
+    f, keys = ref_frozen_tree
+    queries = range(-5, 305)
+
+    cond1 = all((q in f) == (q in keys) for q in queries)
+    cond2 = all(f.keys[f.find(q)] == q for q in keys)
+    cond3 = f.contains_many(list(queries)).tolist() == [q in keys for q in queries]
+
+    assert cond1 and cond2 and cond3
+
+def test_iter_range(ref_frozen_tree):
+    f, keys = ref_frozen_tree
+
+    cond = True
+    for lo, hi in [(-5, 0), (10, 50), (keys[3], keys[20]), (299, 400), (50, 10)]:
+        cond = cond and list(f.iter_range(lo, hi)) == [k for k in keys if lo <= k <= hi]
+        cond = cond and list(f.iter_range(lo, hi, False)) == [k for k in keys if lo < k < hi]
+        cond = cond and list(f.iter_range(lo, hi, (False, True))) == [k for k in keys if lo < k <= hi]
+
+    assert cond
+
+def test_freeze():
+    t = Tree.tree.from_sorted(['pear', 'apple', 'fig', 'kiwi'])
+    f = t.freeze('veb')
+    t.add_node('plum')
+
+    cond1 = ('fig' in f and 'plum' not in f and 'plum' in t)
+    cond2 = list(f.iter_range('b', 'l')) == ['fig', 'kiwi']
+    cond3 = (list(Tree.tree().freeze()) == [] and 1 not in Tree.tree().freeze('veb'))
+
+    assert cond1 and cond2 and cond3
@@ -98,6 +98,13 @@ def test_default_graphNode(dflt_graphNode):
     dflt_previous = (dflt_graphNode.previous == None)
     assert dflt_data and dflt_children and dflt_status and dflt_distance and dflt_previous
 
+def test_graphNode_slots(dflt_graphNode):
+    cond1 = not hasattr(dflt_graphNode, '__dict__')
+    cond2 = (dflt_graphNode._children is None and len(dflt_graphNode._getChildren()) == 0)
+    cond3 = (dflt_graphNode._getWeight(dflt_graphNode) is None and dflt_graphNode._children is None)
+
+    assert cond1 and cond2 and cond3
+
 def test__lt__():
     n1 = Graph.graph().graphNode('A')
     n2 = Graph.graph().graphNode('B')
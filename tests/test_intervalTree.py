@@ -0,0 +1,118 @@
+# these tests are designed for pytest framework
+import pytest
+import intervalTree as ITree
+import random
+
+def check_max_end(t):
+    """Returns True if the maximum end point of every node matches its subtree."""
+    def max_end(n):
+        return max(m.data[1] for m in t.inorder_traversal(n))
+    return all(n.max_end == max_end(n) for n in t.inorder_traversal(t.root))
+
+@pytest.fixture
+def ref_intervals():
+    """Returns 300 random intervals (with some duplicates) and an interval tree holding them."""
+    rnd = random.Random(0)
+    intervals = []
+    for _ in range(300):
+        lo = rnd.randrange(1000)
+        intervals.append((lo, lo + rnd.randrange(50)))
+    intervals += intervals[:20]
+
+    t = ITree.intervalTree()
+    for iv in intervals:
+        t.add_node(iv)
+
+    return t, intervals
+
+def test_add_node(ref_intervals):
+    t, intervals = ref_intervals
+
+    cond1 = [n.data for n in t.inorder_traversal(t.root)] == sorted(intervals)
+    cond2 = check_max_end(t) and t.is_balanced()
+
+    t.add_node((2000, 2001), balanced=False)
+    cond3 = t.root.max_end == 2001 and check_max_end(t)
+
+    assert cond1 and cond2 and cond3
+
+def test_remove_node(ref_intervals):
+    t, intervals = ref_intervals
+    rnd = random.Random(1)
+    rnd.shuffle(intervals)
+
+    for iv in intervals[:150]:
+        t.remove_node(iv)
+    for iv in intervals[150:200]:
+        t.remove_node(iv, balanced=False)
+
+    cond1 = [n.data for n in t.inorder_traversal(t.root)] == sorted(intervals[200:])
+    cond2 = check_max_end(t)
+
+    assert cond1 and cond2
+
+def test_overlapping(ref_intervals):
+    t, intervals = ref_intervals
+
+    cond = True
+    for a, b in [(0, 0), (100, 120), (500, 500), (990, 2000), (-10, -1), (0, 1100)]:
+        ref = sorted(iv for iv in intervals if iv[0] <= b and a <= iv[1])
+        cond = cond and [n.data for n in t.overlapping(a, b)] == ref
+
+    assert cond
+
+def test_from_sorted():
+    t = ITree.intervalTree.from_sorted([(5, 10), (1, 3), (2, 20), (8, 9)])
+
+    cond1 = t.root.max_end == 20 and check_max_end(t)
+    cond2 = [n.data for n in t.overlapping(15, 16)] == [(2, 20)]
+
+    assert cond1 and cond2
+
+def test_order_stats():
+    t = ITree.intervalTree(order_stats=True)
+    for iv in [(5, 8), (1, 3), (7, 9), (2, 6), (4, 4)]:
+        t.add_node(iv)
+    t.remove_node((7, 9))
+
+    cond1 = (t.root.size == 4 and t.rank((4, 4)) == 2 and t.select(3).data == (5, 8))
+    cond2 = ([n.data for n in t.overlapping(3, 5)] == [(1, 3), (2, 6), (4, 4), (5, 8)] and t.validate())
+
+    assert cond1 and cond2
+
+def test_refresh_linked_nodes():
+    # nodes linked by hand, the metadata is refreshed by update_height, is_balanced or height
+    refreshes = [lambda t: t.update_height(), lambda t: t.is_balanced(), lambda t: t.height()]
+    cond = True
+    for refresh in refreshes:
+        root = ITree.intervalTree.treeNode((5, 6))
+        root.left = ITree.intervalTree.treeNode((1, 100))
+        root.left.parent = root
+        t = ITree.intervalTree(root=root)
+        refresh(t)
+        cond = cond and root.max_end == 100 and [n.data for n in t.overlapping(50, 60)] == [(1, 100)]
+
+        t.root = ITree.intervalTree.treeNode((0, 1))
+        t.root.right = root
+        root.parent = t.root
+        refresh(t)
+        cond = cond and t.root.max_end == 100 and [n.data for n in t.overlapping(50, 60)] == [(1, 100)]
+
+    assert cond
+
+def test_validate():
+    root = ITree.intervalTree.treeNode((5, 6))
+    root.left = ITree.intervalTree.treeNode((1, 100))
+    root.left.parent = root
+    t = ITree.intervalTree(root=root)
+    t.update_height()
+    cond1 = t.validate()
+
+    # a stale maximum end point is reported
+    root.left.data = (1, 200)
+    with pytest.raises(AssertionError):
+        t.validate()
+    t.update_height()
+    cond2 = root.max_end == 200 and t.validate()
+
+    assert cond1 and cond2
@@ -0,0 +1,57 @@
+# these tests are designed for pytest framework
+import pytest
+import tree as Tree
+
+@pytest.fixture
+def ref_mapped_tree(tmp_path):
+    """Returns a memory-mapped tree loaded from a saved balanced BST of the keys 0, 2, ..., 198,
+    and the source tree."""
+    t = Tree.tree.from_sorted(range(0, 200, 2))
+    path = str(tmp_path / 'ref.tree')
+    t.save(path)
+
+    mt = Tree.tree.load(path)
+    yield mt, t
+    mt.close()
+
+def test_mapped_tree(ref_mapped_tree):
+    mt, t = ref_mapped_tree
+
+    cond1 = (len(mt) == 100 and mt.root == 0 and mt.key(mt.root) == t.root.data)
+    cond2 = [mt.key(n) for n in mt.iter_inorder()] == list(range(0, 200, 2))
+    cond3 = str(mt) == str(t)
+
+    assert cond1 and cond2 and cond3
+
+def test_find_node(ref_mapped_tree):
+    mt,_ = ref_mapped_tree
+
+    cond1 = all(mt.key(mt.find_node(k)) == k for k in range(0, 200, 2))
+    cond2 = all(mt.find_node(k) == None for k in range(-1, 201, 2))
+    cond3 = (40 in mt and 41 not in mt and 1000 not in mt)
+
+    assert cond1 and cond2 and cond3
+
+def test_str_keys(tmp_path):
+    words = ['pear', 'apple', 'fig', 'kiwi', 'banana']
+    path = str(tmp_path / 'words.tree')
+    Tree.tree.from_sorted(words).save(path, key_format='8s')
+
+    with Tree.tree.load(path) as mt:
+        cond1 = all(w in mt for w in words)
+        cond2 = ('grape' not in mt and 'pea' not in mt)
+        cond3 = [mt.key(n) for n in mt.iter_inorder()] == sorted(words)
+
+    t2 = Tree.tree.load(path, mmap=False)
+    cond4 = [n.data for n in t2.iter_inorder(t2.root)] == sorted(words)
+
+    assert cond1 and cond2 and cond3 and cond4
+
+def test_empty_tree(tmp_path):
+    path = str(tmp_path / 'empty.tree')
+    Tree.tree().save(path)
+
+    with Tree.tree.load(path) as mt:
+        cond = (len(mt) == 0 and mt.root == None and 1 not in mt and list(mt.iter_inorder()) == [])
+
+    assert cond
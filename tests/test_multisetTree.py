@@ -0,0 +1,76 @@
+# these tests are designed for pytest framework
+import pytest
+import multisetTree as MTree
+
+@pytest.fixture
+def ref_multiset():
+    """Returns a multiset tree of the words of a short sentence."""
+    t = MTree.multisetTree()
+    for w in 'the cat and the dog and the bird'.split():
+        t.add_node(w, balanced=True)
+
+    return t
+
+def test_add_node(ref_multiset):
+    t = ref_multiset
+
+    cond1 = [n.data for n in t.inorder_traversal(t.root)] == ['and', 'bird', 'cat', 'dog', 'the']
+    cond2 = (t.count('the') == 3 and t.count('and') == 2 and t.count('cat') == 1 and t.count('cow') == 0)
+    cond3 = (len(t) == 8 and str(t) == 'and and bird cat dog the the the \n')
+    cond4 = ('dog' in t and 'cow' not in t and t.is_balanced())
+
+    assert cond1 and cond2 and cond3 and cond4
+
+def test_remove_node(ref_multiset):
+    t = ref_multiset
+    t.remove_node('the')
+    t.remove_node('cat')
+    t.remove_node('cow')
+
+    cond1 = [n.data for n in t.inorder_traversal(t.root)] == ['and', 'bird', 'dog', 'the']
+    cond2 = (t.count('the') == 2 and len(t) == 6 and 'cat' not in t)
+
+    assert cond1 and cond2
+
+def test_values():
+    t = MTree.multisetTree()
+    t.add_node('a', value=1)
+    t.add_node('b')
+    t.add_node('a')
+    t.add_node('b', value=[2])
+
+    cond1 = (t.get('a') == 1 and t.get('b') == [2] and t.get('c', 0) == 0)
+    cond2 = (t.count('a') == 2 and t.count('b') == 2)
+
+    assert cond1 and cond2
+
+def test_add_node_single_descent():
+    class key(object):
+        """An integer key counting the comparisons."""
+        comparisons = 0
+        def __init__(self, k):
+            self.k = k
+        def __lt__(self, other):
+            key.comparisons += 1
+            return self.k < other.k
+        def __eq__(self, other):
+            key.comparisons += 1
+            return self.k == other.k
+
+    t = MTree.multisetTree()
+    for k in range(0, 126, 2):
+        t.add_node(key(k), balanced=True)
+    height = t.height()
+
+    # a new key (with a payload) and an existing key are found by a single descent
+    key.comparisons = 0
+    t.add_node(key(63), balanced=True, value='x')
+    cond1 = key.comparisons <= 2 * (height + 1)
+
+    key.comparisons = 0
+    t.add_node(key(62), value='y')
+    cond2 = key.comparisons <= 2 * (height + 1)
+
+    cond3 = (t.get(key(63)) == 'x' and t.count(key(62)) == 2 and t.validate())
+
+    assert cond1 and cond2 and cond3
@@ -0,0 +1,104 @@
+# these tests are designed for pytest framework
+import pytest
+import persistentTree as PTree
+import random
+
+def check_avl(t):
+    """Returns True if the stored heights and balance factors of a tree are correct and balanced."""
+    nodes = t.inorder_traversal(t.root)
+    return all(n.height == t._calcHeight(n) and
+               n.balance_factor == t._calcHeight(n.left) - t._calcHeight(n.right) and
+               abs(n.balance_factor) <= 1 for n in nodes)
+
+def test_add_node():
+    t = PTree.persistentTree()
+    for k in range(100):
+        t.add_node(k)
+
+    cond1 = [n.data for n in t.inorder_traversal(t.root)] == list(range(100))
+    cond2 = check_avl(t) and t.root.height == 6
+
+    t.add_node(100, balanced=False)
+    cond3 = 100 in t and t.find_node(100).data == 100
+
+    assert cond1 and cond2 and cond3
+
+def test_snapshot():
+    t = PTree.persistentTree()
+    for k in [5, 3, 8, 1, 4]:
+        t.add_node(k)
+
+    s = t.snapshot()
+    old_nodes = {id(n): (n.data, n.left, n.right, n.height) for n in s.inorder_traversal(s.root)}
+    t.add_node(2)
+    t.add_node(9)
+    t.remove_node(5)
+
+    cond1 = [n.data for n in s.inorder_traversal(s.root)] == [1, 3, 4, 5, 8]
+    cond2 = [n.data for n in t.inorder_traversal(t.root)] == [1, 2, 3, 4, 8, 9]
+    # the nodes of the snapshot are unchanged and shared with the new version when possible
+    cond3 = all((n.data, n.left, n.right, n.height) == old_nodes[id(n)] for n in s.inorder_traversal(s.root))
+    cond4 = any(id(n) in old_nodes for n in t.inorder_traversal(t.root))
+    cond5 = check_avl(s) and check_avl(t)
+
+    assert cond1 and cond2 and cond3 and cond4 and cond5
+
+def test_remove_node():
+    rnd = random.Random(0)
+    t = PTree.persistentTree()
+    ref = []
+    snapshots = []
+    for i in range(2000):
+        k = rnd.randrange(300)
+        if rnd.random() < 0.6:
+            t.add_node(k)
+            ref.append(k)
+        else:
+            t.remove_node(k)
+            if k in ref: ref.remove(k)
+        if i % 250 == 0:
+            snapshots.append((t.snapshot(), sorted(ref)))
+
+    cond1 = [n.data for n in t.inorder_traversal(t.root)] == sorted(ref) and check_avl(t)
+    cond2 = all([n.data for n in s.inorder_traversal(s.root)] == r and check_avl(s) for s, r in snapshots)
+
+    assert cond1 and cond2
+
+def test_iter_range():
+    t = PTree.persistentTree()
+    for k in [5, 3, 8, 1, 4, 7, 9, 3]:
+        t.add_node(k)
+
+    cond1 = [n.data for n in t.iter_range(3, 7)] == [3, 3, 4, 5, 7]
+    cond2 = [n.data for n in t.iter_range(3, 7, inclusive=False)] == [4, 5]
+    cond3 = [n.data for n in t.iter_range(3, 7, inclusive=(False, True))] == [4, 5, 7]
+    cond4 = list(t.iter_range(10, 20)) == []
+
+    assert cond1 and cond2 and cond3 and cond4
+
+def test_trusted_metadata():
+    t = PTree.persistentTree()
+    for k in range(200):
+        t.add_node(k, balanced=k < 100)
+    snap = t.snapshot()
+    for k in range(0, 200, 4):
+        t.remove_node(k, balanced=False)
+
+    # the metadata maintained by the path copies stays trusted (O(1) is_balanced and height)
+    cond1 = t._imbalanced is not None and snap._imbalanced is not None
+    cond2 = t.is_balanced() == (t._isBalanced(t.root) > -1) and t.height() == t._calcHeight(t.root)
+    cond3 = snap.is_balanced() == (snap._isBalanced(snap.root) > -1) and snap.validate() and t.validate()
+
+    assert cond1 and cond2 and cond3
+
+def test_unsupported():
+    t = PTree.persistentTree()
+    t.add_node(1)
+
+    # the unsupported operations fail even when the assertions are disabled (python -O)
+    with pytest.raises(TypeError):
+        t.insert_node(2)
+    with pytest.raises(TypeError):
+        t.successor(t.root)
+    with pytest.raises(TypeError):
+        t.predecessor(t.root)
@@ -0,0 +1,81 @@
+# these tests are designed for pytest framework
+import pytest
+import tree as Tree
+import rbTree as RBTree
+
+def black_height(t, node):
+    """Returns the black height of the subtree rooted at node, asserts the red-black properties."""
+    if node is None:
+        return 1
+
+    if node.red:
+        assert not t._isRed(node.left) and not t._isRed(node.right)
+    for child in (node.left, node.right):
+        assert child is None or child.parent is node
+
+    lheight = black_height(t, node.left)
+    rheight = black_height(t, node.right)
+    assert lheight == rheight
+
+    return lheight + (0 if node.red else 1)
+
+@pytest.fixture
+def ref_rbtree():
+    """Returns a red-black tree built from the keys 1..20 in a fixed shuffled order."""
+    t = RBTree.rbTree()
+    for d in [8, 3, 17, 10, 1, 6, 14, 4, 7, 13, 20, 2, 19, 5, 11, 16, 9, 12, 15, 18]:
+        t.add_node(d)
+
+    return t
+
+def test_default_rbtree():
+    t = RBTree.rbTree()
+    n = t.treeNode(1)
+
+    assert t.root == None and n.red and isinstance(n, Tree.tree.treeNode)
+
+def test_add_node(ref_rbtree):
+    t = ref_rbtree
+
+    cond1 = [n.data for n in t.inorder_traversal(t.root)] == list(range(1, 21))
+    cond2 = not t.root.red and black_height(t, t.root) > 0
+    cond3 = (5 in t and 21 not in t)
+
+    assert cond1 and cond2 and cond3
+
+def test_add_node_sorted():
+    t = RBTree.rbTree()
+    for i in range(1000):
+        t.add_node(i)
+
+    cond1 = black_height(t, t.root) > 0
+    cond2 = t._calcHeight(t.root) <= 2 * 10
+
+    assert cond1 and cond2
+
+def test_remove_node(ref_rbtree):
+    t = ref_rbtree
+    for d in [8, 1, 20, 14, 3, 21]:
+        t.remove_node(d)
+
+    cond1 = [n.data for n in t.inorder_traversal(t.root)] == [2, 4, 5, 6, 7, 9, 10, 11, 12, 13, 15, 16, 17, 18, 19]
+    cond2 = (t.root.parent == None and black_height(t, t.root) > 0)
+
+    assert cond1 and cond2
+
+def test_remove_node_all(ref_rbtree):
+    t = ref_rbtree
+    for d in [17, 5, 9, 1, 13, 20, 2, 12, 8, 16, 4, 19, 11, 3, 15, 7, 18, 6, 14, 10]:
+        t.remove_node(d)
+        black_height(t, t.root)
+
+    assert t.root == None
+
+def test_from_sorted():
+    for n in (0, 1, 2, 7, 100):
+        t = RBTree.rbTree.from_sorted(range(n))
+
+        cond1 = [n.data for n in t.inorder_traversal(t.root)] == list(range(n))
+        cond2 = (t.root == None or not t.root.red)
+
+        assert cond1 and cond2 and black_height(t, t.root) > 0
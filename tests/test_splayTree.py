@@ -0,0 +1,65 @@
+# these tests are designed for pytest framework
+import pytest
+import splayTree as STree
+import random
+
+def is_bst(t):
+    """Returns True if the inorder traversal of the tree is sorted and the parent links are consistent."""
+    nodes = t.inorder_traversal(t.root)
+    cond1 = all(a.data <= b.data for a, b in zip(nodes, nodes[1:]))
+    cond2 = all(c.parent is n for n in nodes for c in (n.left, n.right) if c is not None)
+    return cond1 and cond2 and (t.root is None or t.root.parent is None)
+
+@pytest.fixture
+def ref_splay_tree():
+    """Returns a splay tree of 200 shuffled keys and the sorted keys."""
+    keys = list(range(200))
+    random.Random(0).shuffle(keys)
+    t = STree.splayTree()
+    for k in keys:
+        t.add_node(k)
+
+    return t, sorted(keys)
+
+def test_add_node(ref_splay_tree):
+    t, keys = ref_splay_tree
+    t.add_node(1000)
+
+    cond1 = [n.data for n in t.inorder_traversal(t.root)] == keys + [1000]
+    cond2 = (t.root.data == 1000 and is_bst(t))
+
+    assert cond1 and cond2
+
+def test_find_node(ref_splay_tree):
+    t, keys = ref_splay_tree
+
+    cond1 = (t.find_node(57).data == 57 and t.root.data == 57)
+    cond2 = (123 in t and t.root.data == 123)
+    # an unsuccessful search splays the last node of the search path
+    cond3 = (t.find_node(-5) == None and t.root.data == 0)
+    cond4 = (t.find_node(99.5) == None and t.root.data in (99, 100))
+    cond5 = [n.data for n in t.inorder_traversal(t.root)] == keys and is_bst(t)
+
+    assert cond1 and cond2 and cond3 and cond4 and cond5
+
+def test_remove_node(ref_splay_tree):
+    t, keys = ref_splay_tree
+    for k in keys[::2]:
+        t.remove_node(k)
+    t.remove_node(-1)
+
+    cond1 = [n.data for n in t.inorder_traversal(t.root)] == keys[1::2]
+    cond2 = is_bst(t) and all(k not in t for k in keys[::2])
+
+    assert cond1 and cond2
+
+def test_hot_keys(ref_splay_tree):
+    t,_ = ref_splay_tree
+    for _ in range(3):
+        for k in (5, 150, 77):
+            k in t
+
+    depth = lambda n: 0 if n.parent is None else 1 + depth(n.parent)
+    cond = all(depth(t._findNode(t.root, k)) <= 2 for k in (5, 150, 77))
+
+    assert cond
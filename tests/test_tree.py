@@ -3,6 +3,8 @@ import pytest
 import tree as Tree
 import deepdiff
 import operator as op
+import random
+import io
 
 @pytest.fixture
 def dflt_tree():
@@ -256,6 +258,9 @@ def test_default_treeNode(dflt_treeNode):
     dflt_balance_factor = (dflt_treeNode.balance_factor == 0)
     assert (dflt_data and dflt_left and dflt_right and dflt_parent and dflt_height and dflt_balance_factor)
 
+def test_treeNode_slots(dflt_treeNode):
+    assert not hasattr(dflt_treeNode, '__dict__')
+
 def test__lt__():
     n1 = Tree.tree().treeNode(1)
     n2 = Tree.tree().treeNode(2)
@@ -696,6 +701,128 @@ def test_height_bf_insert_node(ref_bst):
 
     assert cond1 and cond2
 
+def test_height_bf_add_node_sorted():
+    t = Tree.tree()
+    for i in range(200):
+        t.add_node(i, True)
+
+    nodes = t.inorder_traversal(t.root)
+
+    cond1 = all(n.height == t._calcHeight(n) for n in nodes)
+    cond2 = all(n.balance_factor == t._calcHeight(n.left) - t._calcHeight(n.right) for n in nodes)
+    cond3 = t.is_balanced()
+
+    assert cond1 and cond2 and cond3
+
+def test_updateNodeMetadata(ref_bst):
+    t, nodes = ref_bst
+    n10 = nodes[2]
+    n14 = nodes[5]
+
+    n14.height = 5
+    t._updateNodeMetadata(n10)
+
+    assert n10.height == 6 and n10.balance_factor == -6
+
+def test_from_sorted():
+    data = [7, 3, 9, 1, 5, 8, 2, 6, 4]
+    t = Tree.tree.from_sorted(data)
+
+    nodes = t.inorder_traversal(t.root)
+
+    cond1 = [n.data for n in nodes] == list(range(1, 10))
+    cond2 = all(n.height == t._calcHeight(n) for n in nodes)
+    cond3 = all(n.balance_factor == t._calcHeight(n.left) - t._calcHeight(n.right) for n in nodes)
+    cond4 = (t.root.data == 5 and t.root.parent == None and t.root.height == 3 and t.is_balanced())
+    cond5 = (data == [7, 3, 9, 1, 5, 8, 2, 6, 4])
+    cond6 = (Tree.tree.from_sorted([]).root == None)
+
+    assert cond1 and cond2 and cond3 and cond4 and cond5 and cond6
+
+def test_remove_node(ref_bst):
+    t, nodes = ref_bst
+    n8, n3, n10, n1, n6, n14, n4, n7, n13 = nodes
+
+    # a leaf, a node with one child and nodes with two children (including the root)
+    t.remove_node(1, False)
+    t.remove_node(10, False)
+    t.remove_node(3, False)
+    t.remove_node(8, False)
+    t.remove_node(5, False)
+
+    ref_rep = [
+    {'data': 4, 'left': 'None', 'right': 'None', 'parent': 6,
+     'height': 0, 'balance_factor': 0},
+    {'data': 6, 'left': 4, 'right': 7, 'parent': 13,
+     'height': 1, 'balance_factor': 0},
+    {'data': 7, 'left': 'None', 'right': 'None', 'parent': 6,
+     'height': 0, 'balance_factor': 0},
+    {'data': 13, 'left': 6, 'right': 14, 'parent': 'None',
+     'height': 2, 'balance_factor': 1},
+    {'data': 14, 'left': 'None', 'right': 'None', 'parent': 13,
+     'height': 0, 'balance_factor': 0}]
+
+    rep = t.verbose_rep(1)
+    diff_list = [deepdiff.DeepDiff(n1, n2) for n1, n2 in zip(rep, ref_rep)]
+
+    cond1 = (len(rep) == 5 and diff_list == [{}] * 5)
+    cond2 = (t.root == n13 and n8.parent == None and n8.left == None and n8.right == None)
+
+    assert cond1 and cond2
+
+def test_remove_node_balanced():
+    t = Tree.tree()
+    keys = list(range(0, 300, 3)) + list(range(1, 300, 3))
+    for k in keys:
+        t.add_node(k, True)
+
+    for k in keys[::2]:
+        t.remove_node(k)
+
+    nodes = t.inorder_traversal(t.root)
+
+    cond1 = [n.data for n in nodes] == sorted(keys[1::2])
+    cond2 = all(n.height == t._calcHeight(n) for n in nodes)
+    cond3 = all(n.parent is None or n in (n.parent.left, n.parent.right) for n in nodes)
+    cond4 = t.is_balanced()
+
+    assert cond1 and cond2 and cond3 and cond4
+
+def test_remove_node_unbalanced_random():
+    rng = random.Random(5)
+    for _ in range(200):
+        t = Tree.tree()
+        keys = [rng.randrange(50) for _ in range(rng.randint(1, 40))]
+        for k in keys:
+            t.add_node(k)
+        for k in rng.sample(keys, rng.randint(1, len(keys))):
+            t.remove_node(k, balanced=False)
+
+        nodes = t.inorder_traversal(t.root)
+
+        cond1 = all(n.height == t._calcHeight(n) for n in nodes)
+        cond2 = all(n.balance_factor == t._calcHeight(n.left) - t._calcHeight(n.right) for n in nodes)
+
+        assert cond1 and cond2
+
+def test_insert_node_level_order():
+    t = Tree.tree()
+    for i in range(100):
+        t.insert_node(i)
+    # the level order queue is discarded by add_node
+    t.add_node(100)
+    for i in range(101, 127):
+        t.insert_node(i)
+
+    path = t.BFS(t.root)
+
+    cond1 = [n.data for n in path[:100]] == list(range(100))
+    cond2 = all(path[i].left == path[2*i + 1] and path[i].right == path[2*i + 2] for i in range(63))
+    cond3 = all(n.height == t._calcHeight(n) for n in path)
+    cond4 = (t.root.height == 6 and t.root.balance_factor == 0)
+
+    assert cond1 and cond2 and cond3 and cond4
+
 def test_inorder_traversal(ref_bst):
     t,_ = ref_bst
     ref_inorder = [1, 3, 4, 6, 7, 8, 10, 13, 14]
@@ -729,6 +856,116 @@ def test_postorder_traversal(ref_bst):
 
     assert postorder == ref_postorder
 
+def test_rank():
+    t = Tree.tree(order_stats=True)
+    for d in [8, 3, 10, 1, 6, 14, 4, 7, 13, 6]:
+        t.add_node(d, True)
+
+    ranks = [t.rank(x) for x in [0, 1, 6, 7, 9, 14, 15]]
+
+    assert ranks == [0, 0, 3, 5, 7, 9, 10]
+
+def test_select():
+    t = Tree.tree(order_stats=True)
+    for d in [8, 3, 10, 1, 6, 14, 4, 7, 13]:
+        t.add_node(d)
+    t.remove_node(3)
+
+    keys = [t.select(k).data for k in range(8)]
+
+    assert keys == [1, 4, 6, 7, 8, 10, 13, 14] and t.select(8) == None
+
+def test_count_range():
+    t = Tree.tree.from_sorted(range(0, 100, 2), order_stats=True)
+
+    cond1 = (t.count_range(10, 20) == 6)
+    cond2 = (t.count_range(11, 19) == 4)
+    cond3 = (t.count_range(-5, 200) == 50)
+    cond4 = (t.count_range(20, 10) == 0)
+
+    assert cond1 and cond2 and cond3 and cond4
+
+def test_sized_nodes():
+    t = Tree.tree()
+    t.add_node(1)
+    st = Tree.tree.from_sorted(range(5), order_stats=True)
+    st.add_node(5)
+
+    # only the trees with order_stats enabled pay for the size of the subtrees
+    cond1 = not hasattr(t.root, 'size') and not hasattr(Tree.tree.treeNode(), 'size')
+    cond2 = all(isinstance(n, Tree.tree.sizedTreeNode) for n in st.iter_inorder(st.root))
+    cond3 = (st.root.size == 6 and st.select(5).data == 5 and st.validate())
+
+    assert cond1 and cond2 and cond3
+
+def test_floor_ceiling(ref_bst):
+    t,_ = ref_bst
+
+    floors = [t.floor(x) for x in [0, 1, 5, 9, 20]]
+    ceilings = [t.ceiling(x) for x in [0, 1, 5, 9, 20]]
+
+    cond1 = [None if n is None else n.data for n in floors] == [None, 1, 4, 8, 14]
+    cond2 = [None if n is None else n.data for n in ceilings] == [1, 1, 6, 10, None]
+
+    assert cond1 and cond2
+
+def test_successor_predecessor(ref_bst):
+    t, nodes = ref_bst
+    n8, n3, n10, n1, n6, n14, n4, n7, n13 = nodes
+
+    cond1 = (t.successor(n7) == n8 and t.successor(n8) == n10 and t.successor(n14) == None)
+    cond2 = (t.predecessor(n8) == n7 and t.predecessor(n13) == n10 and t.predecessor(n1) == None)
+
+    assert cond1 and cond2
+
+def test_iter_range(ref_bst):
+    t,_ = ref_bst
+
+    cond1 = [n.data for n in t.iter_range(4, 10)] == [4, 6, 7, 8, 10]
+    cond2 = [n.data for n in t.iter_range(4, 10, inclusive=False)] == [6, 7, 8]
+    cond3 = [n.data for n in t.iter_range(4, 10, inclusive=(False, True))] == [6, 7, 8, 10]
+    cond4 = [n.data for n in t.iter_range(15, 20)] == []
+
+    assert cond1 and cond2 and cond3 and cond4
+
+def test_iter_inorder(ref_bst):
+    t,_ = ref_bst
+    inorder = [n.data for n in t.iter_inorder(t.root)]
+
+    assert inorder == [1, 3, 4, 6, 7, 8, 10, 13, 14]
+
+def test_iter_preorder(ref_bst):
+    t,_ = ref_bst
+    preorder = [n.data for n in t.iter_preorder(t.root)]
+
+    assert preorder == [8, 3, 1, 6, 4, 7, 10, 14, 13]
+
+def test_iter_postorder(ref_bst):
+    t,_ = ref_bst
+    postorder = [n.data for n in t.iter_postorder(t.root)]
+
+    assert postorder == [1, 4, 7, 6, 3, 13, 14, 10, 8]
+
+def test_iter_levelorder(ref_bst):
+    t,_ = ref_bst
+    levelorder = [n.data for n in t.iter_levelorder(t.root)]
+
+    assert levelorder == [8, 3, 10, 1, 6, 14, 4, 7, 13]
+
+def test_traversals_deep_tree():
+    t = Tree.tree()
+    for i in range(1500):
+        t.add_node(i)
+
+    ref = list(range(1500))
+
+    cond1 = [n.data for n in t.inorder_traversal(t.root)] == ref
+    cond2 = [n.data for n in t.preorder_traversal(t.root)] == ref
+    cond3 = [n.data for n in t.postorder_traversal(t.root)] == ref[::-1]
+    cond4 = t.__str__() == ' '.join(str(i) for i in ref) + ' \n'
+
+    assert cond1 and cond2 and cond3 and cond4
+
 def test_find_node(ref_bst):
     t, nodes = ref_bst
     n10 = nodes[2]
@@ -780,6 +1017,37 @@ def test_root_to_leaf_paths(ref_bst):
 
     assert sorted(pathsList) == sorted(ref_pathsList)
 
+def test_iter_root_to_leaf_paths(ref_bst):
+    t,_ = ref_bst
+    ref_pathsList = [[8, 3, 1], [8, 3, 6, 4], [8, 3, 6, 7], [8, 10, 14, 13]]
+
+    cond1 = [list(p) for p in t.iter_root_to_leaf_paths()] == ref_pathsList
+    cond2 = [p.tolist() for p in t.iter_root_to_leaf_paths(as_='array', dtype=int)] == ref_pathsList
+    # the array paths are views of a single buffer
+    paths = list(t.iter_root_to_leaf_paths(as_='array'))
+    cond3 = all(p.base is paths[0].base for p in paths)
+    cond4 = list(Tree.tree().iter_root_to_leaf_paths()) == []
+
+    assert cond1 and cond2 and cond3 and cond4
+
+def test_count_root_to_leaf_paths(ref_bst):
+    t,_ = ref_bst
+
+    cond1 = t.count_root_to_leaf_paths() == 4
+    cond2 = Tree.tree().count_root_to_leaf_paths() == 0
+
+    assert cond1 and cond2
+
+def test_reduce_root_to_leaf_paths(ref_bst):
+    t,_ = ref_bst
+
+    cond1 = t.max_path_sum() == 45
+    cond2 = t.reduce_root_to_leaf_paths(lambda v, d: v + d, 0, min) == 12
+    cond3 = t.reduce_root_to_leaf_paths(lambda v, d: v + 1, 0) == 4
+    cond4 = Tree.tree().max_path_sum() == None
+
+    assert cond1 and cond2 and cond3 and cond4
+
 def test_rootToLeafPaths(ref_bst):
     t, nodes = ref_bst
     n3 = nodes[1]
@@ -794,6 +1062,87 @@ def test_is_balanced(ref_bst):
     t,_ = ref_bst
     assert not t.is_balanced()
 
+def test_is_balanced_maintained():
+    t = Tree.tree()
+    for k in range(10):
+        t.add_node(k, balanced=True)
+    cond1 = t.is_balanced() and t._imbalanced == 0
+
+    t.add_node(10)
+    t.add_node(11)
+    cond2 = not t.is_balanced() and t._imbalanced > 0
+
+    t.remove_node(11)
+    cond3 = t.is_balanced() and t.validate()
+
+    assert cond1 and cond2 and cond3
+
+def test_is_balanced_external_root(ref_bst):
+    t, nodes = ref_bst
+    # a root assigned outside of the tree operations is not trusted until the next refresh
+    cond1 = t._imbalanced is None and not t.is_balanced()
+
+    t.update_height()
+    cond2 = t._imbalanced == 1 and not t.is_balanced() and t.validate()
+
+    assert cond1 and cond2
+
+def test_is_balanced_deep_untrusted():
+    t = Tree.tree()
+    nodes = [t.treeNode(k) for k in range(3000)]
+    for parent, child in zip(nodes, nodes[1:]):
+        parent.right = child
+        child.parent = parent
+    # the metadata of the linked nodes is refreshed without recursion
+    t.root = nodes[0]
+    cond1 = not t.is_balanced() and t._imbalanced == 2998
+
+    t.root = t.root
+    cond2 = t.height() == 2999 and t._imbalanced is not None
+
+    assert cond1 and cond2
+
+def test_height(ref_bst):
+    t, nodes = ref_bst
+    cond1 = t.height() == 3 and Tree.tree().height() == -1
+
+    t2 = Tree.tree()
+    for k in range(20):
+        t2.add_node(k)
+    cond2 = t2.height() == 19 and t2.root.height == 19
+
+    assert cond1 and cond2
+
+def test_validate(ref_bst):
+    t, nodes = ref_bst
+    n8, n3, n10 = nodes[0], nodes[1], nodes[2]
+    cond1 = t.validate()
+
+    n8.height = 5
+    with pytest.raises(AssertionError):
+        t.validate()
+
+    t.update_height()
+    cond2 = t.validate() and n8.height == 3
+
+    n3.data, n10.data = n10.data, n3.data
+    with pytest.raises(AssertionError):
+        t.validate()
+
+    assert cond1 and cond2
+
+def test_remove_node_unbalanced_replacing_successor():
+    t = Tree.tree()
+    for k in [50, 10, 5, 20, 25, 30]:
+        t.add_node(k)
+    # the successor (20) keeps its height but replaces a higher node
+    t.remove_node(10, balanced=False)
+
+    cond1 = t.root.height == 3 and t.height() == t._calcHeight(t.root)
+    cond2 = t.validate()
+
+    assert cond1 and cond2
+
 def test_isBalanced(ref_bst):
     t, nodes = ref_bst
     n3 = nodes[1]
@@ -923,3 +1272,135 @@ def test_rotateLeft(right_heavy_tree, left_heavy_tree):
     cond = diff_list == [{}] * 5
 
     assert cond
+
+def test_save_load(ref_bst, tmp_path):
+    t,_ = ref_bst
+    t.update_height()
+    t.update_balance_factor()
+    path = str(tmp_path / 'ref.tree')
+    t.save(path)
+
+    t2 = Tree.tree.load(path, mmap=False)
+
+    cond1 = t2.verbose_rep(1) == t.verbose_rep(1)
+    cond2 = (t2.root.data == t.root.data and t2.root.parent == None)
+    cond3 = all(n.left.parent is n for n in t2.iter_preorder(t2.root) if n.left is not None)
+
+    Tree.tree().save(path)
+    cond4 = (Tree.tree.load(path, mmap=False).root == None)
+
+    assert cond1 and cond2 and cond3 and cond4
+
+def test_findNode_deep_tree():
+    t = Tree.tree()
+    for k in range(1500):
+        t.add_node(k)
+
+    cond1 = (t.find_node(1499).data == 1499 and t.find_node(1500) == None)
+    cond2 = (1499 in t and -1 not in t and t._containsData(750, t.root))
+
+    assert cond1 and cond2
+
+def test_finger_search():
+    keys = list(range(0, 400, 2))
+    t = Tree.tree(finger=True)
+    for k in keys:
+        t.add_node(k, balanced=True)
+
+    queries = list(range(-3, 403)) + list(range(403, -3, -7))
+    cond1 = all((q in t) == (q in keys) for q in queries)
+    cond2 = all((t.find_node(q) is not None and t.find_node(q).data == q) == (q in keys) for q in queries)
+    cond3 = t._finger is not None
+
+    for k in keys[::3]:
+        t.remove_node(k)
+    cond4 = all((q in t) == (q in keys and q not in keys[::3]) for q in queries)
+
+    assert cond1 and cond2 and cond3 and cond4
+
+def test_contains_many(ref_bst):
+    t,_ = ref_bst
+    keys = [8, 2, 13, 14, 0, 7, 15, 4]
+
+    cond1 = t.contains_many(keys).tolist() == [k in t for k in keys]
+    cond2 = [None if n is None else n.data for n in t.find_many(keys)] == [8, None, 13, 14, None, 7, None, 4]
+
+    t.add_node(2)
+    t.remove_node(13)
+    cond3 = t.contains_many(keys).tolist() == [True, True, False, True, False, True, False, True]
+    cond4 = Tree.tree().contains_many([1, 2]).tolist() == [False, False]
+
+    words = Tree.tree.from_sorted(['pear', 'fig', 'kiwi'])
+    cond5 = words.contains_many(['fig', 'apple', 'pear', 'zz']).tolist() == [True, False, True, False]
+
+    assert cond1 and cond2 and cond3 and cond4 and cond5
+
+def test_root_setter_caches():
+    t = Tree.tree(finger=True)
+    for k in range(10):
+        t.add_node(k, balanced=True)
+    cond1 = (t.contains_many([9]).tolist() == [True] and 9 in t and t._finger is not None)
+
+    # the caches built from the previous root are discarded
+    t.root = t.root.left
+    t.root.parent = None
+    cond2 = (t._sortedKeys is None and t._finger is None)
+    cond3 = (t.contains_many([9]).tolist() == [False] and 9 not in t)
+
+    t2 = Tree.tree()
+    for k in range(3):
+        t2.insert_node(k)
+    t2.root = t2.root
+    cond4 = t2._levelOrderQueue is None
+
+    assert cond1 and cond2 and cond3 and cond4
+
+def test_to_arrays(ref_bst):
+    t,_ = ref_bst
+    t.update_height()
+    t.update_balance_factor()
+    columns = t.to_arrays()
+    rep = t.verbose_rep(1)
+    data = columns['data'].tolist()
+
+    link = lambda i: 'None' if i == -1 else data[i]
+    cond1 = data == [r['data'] for r in rep]
+    cond2 = all([link(i) for i in columns[k].tolist()] == [r[k] for r in rep] for k in ('left', 'right', 'parent'))
+    cond3 = all(columns[k].tolist() == [r[k] for r in rep] for k in ('height', 'balance_factor'))
+    cond4 = sorted(t.to_arrays(verb_level=0)) == ['data', 'left', 'right']
+    cond5 = all(len(c) == 0 for c in Tree.tree().to_arrays().values())
+
+    assert cond1 and cond2 and cond3 and cond4 and cond5
+
+def test_to_dataframe(ref_bst):
+    t,_ = ref_bst
+    df = t.to_dataframe()
+
+    cond1 = list(df.columns) == ['data', 'left', 'right', 'parent', 'height', 'balance_factor']
+    cond2 = (len(df) == 9 and df['data'].tolist() == [1, 3, 4, 6, 7, 8, 10, 13, 14])
+    cond3 = (df['parent'][df['data'] == 8].tolist() == [-1])
+
+    assert cond1 and cond2 and cond3
+
+def test_write(ref_bst, tmp_path):
+    t,_ = ref_bst
+
+    out = io.StringIO()
+    t.write(out, chunk_size=2)
+    cond1 = out.getvalue() == str(t)
+
+    out = io.StringIO()
+    t.write(out, sep=',')
+    cond2 = out.getvalue() == '1,3,4,6,7,8,10,13,14,\n'
+
+    path = tmp_path / 'keys.txt'
+    big = Tree.tree.from_sorted(range(100000))
+    with open(path, 'w') as fid:
+        big.write(fid, chunk_size=1000)
+    cond3 = path.read_text() == str(big)
+
+    out = io.StringIO()
+    Tree.tree().write(out)
+    cond4 = out.getvalue() == str(Tree.tree())
+
+    assert cond1 and cond2 and cond3 and cond4
@@ -143,6 +143,16 @@ def test_list_to_tree_balanced():
 
     assert cond
 
+def test_list_to_tree_bulk():
+    dlist = [6, 10, 14, 3, 4, 1, 8, 13, 7]
+    t = to.list_to_tree(dlist, rootVal=5, bulk=True)
+
+    cond1 = [n.data for n in t.inorder_traversal(t.root)] == [1, 3, 4, 5, 6, 7, 8, 10, 13, 14]
+    cond2 = (t.is_balanced() and t.root.height == 3)
+    cond3 = (dlist == [6, 10, 14, 3, 4, 1, 8, 13, 7])
+
+    assert cond1 and cond2 and cond3
+
 def test_dict_to_tree(ref_bst):
     ref_t,_ = ref_bst
 
@@ -309,3 +319,73 @@ def test_solve():
     cbqp = to.CBQP(3, Q, A, b)
     cbqp._solve(t, t.root, [])
     assert cbqp.optimal_value == -5.0 and cbqp.solution == [0, 1, 0]
+
+def test_merge_trees():
+    t1 = to.list_to_tree([5, 2, 8, 1, 9, 5])
+    t2 = to.list_to_tree([7, 3, 5, 10])
+    ref = sorted([5, 2, 8, 1, 9, 5] + [7, 3, 5, 10])
+
+    t = to.merge_trees(t1, t2)
+    cond1 = [n.data for n in t.iter_inorder(t.root)] == ref and t.is_balanced()
+
+    t = to.merge_trees(t1, t2, balanced=False)
+    cond2 = [n.data for n in t.iter_inorder(t.root)] == ref
+    cond3 = t.preorder_traversal(t.root)[0].data == 5
+
+    t = to.merge_trees(to.list_to_tree([4, 2, 6], engine='array'), t2)
+    cond4 = [t.data[n] for n in t.iter_inorder(t.root)] == [2, 3, 4, 5, 6, 7, 10]
+
+    cond5 = str(t1) == '1 2 5 5 8 9 \n' and str(t2) == '3 5 7 10 \n'
+
+    assert cond1 and cond2 and cond3 and cond4 and cond5
+
+def test_intersect_trees():
+    t1 = to.list_to_tree([5, 2, 8, 1, 9, 5, 5])
+    t2 = to.list_to_tree([7, 5, 1, 5, 10, 2])
+
+    t = to.intersect_trees(t1, t2)
+    cond1 = [n.data for n in t.iter_inorder(t.root)] == [1, 2, 5, 5] and t.is_balanced()
+    cond2 = to.intersect_trees(t1, to.list_to_tree([3, 4])).root == None
+
+    assert cond1 and cond2
+
+def test_difference_trees():
+    t1 = to.list_to_tree([5, 2, 8, 1, 9, 5, 5])
+    t2 = to.list_to_tree([7, 5, 1, 5, 10])
+
+    t = to.difference_trees(t1, t2)
+    cond1 = [n.data for n in t.iter_inorder(t.root)] == [2, 5, 8, 9] and t.is_balanced()
+    t = to.difference_trees(t2, t1)
+    cond2 = [n.data for n in t.iter_inorder(t.root)] == [7, 10]
+    cond3 = to.difference_trees(t1, t1).root == None
+
+    assert cond1 and cond2 and cond3
+
+def test_text_to_tree_multiset():
+    path = "../data/Goethe.txt"
+    regex = "(?<!\d )["+string.punctuation+"](?!\d)"
+    treelist = to.text_to_tree(path, regex=regex, balanced=False)
+    mtreelist = to.text_to_tree(path, regex=regex, balanced=False, multiset=True)
+
+    parnr = 151
+    t = mtreelist[parnr]
+
+    cond1 = all(str(mt) == str(t) for mt, t in zip(mtreelist, treelist))
+    cond2 = (len(t.inorder_traversal(t.root)) == 20 and len(treelist[parnr].inorder_traversal(treelist[parnr].root)) == 21)
+    cond3 = (t.count('du') == 2 and t.count('Gast') == 1)
+
+    assert cond1 and cond2 and cond3
+
+def test_list_to_tree_multiset():
+    dlist = [5, 3, 5, 8, 3, 5]
+    t = to.list_to_tree(dlist, multiset=True)
+
+    cond1 = [n.data for n in t.inorder_traversal(t.root)] == [3, 5, 8]
+    cond2 = (t.count(5) == 3 and t.count(3) == 2 and t.root.data == 5)
+    cond3 = to.list_to_tree(dlist, rootVal=4, multiset=True).count(4) == 1
+
+    # a multiset tree only supports the object engine
+    with pytest.raises(AssertionError):
+        to.list_to_tree(['a', 'b', 'a', 'a'], multiset=True, engine='array')
+
+    assert cond1 and cond2 and cond3